@@ -0,0 +1,89 @@
+import os
+import sys
+import tempfile
+import time
+
+from ExtractBudgetData.TextFile import TextFile, TextFileIdentifier
+
+
+class LegacyTextFileIdentifier:
+    def __init__(self, content):
+        self.content = content
+
+    def getFileType(self):
+        if self.fileIsCSV():
+            return 'csv'
+        if self.fileContainsNewlineDelimiters():
+            return 'newline'
+        return 'unknown'
+
+    def fileIsCSV(self):
+        for char in self.content:
+            if char == ',':
+                return True
+        return False
+
+    def fileContainsNewlineDelimiters(self):
+        for char in self.content:
+            if char == '\n':
+                return True
+        return False
+
+
+class FlatFileWriter:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def write(self, sizeInMegabytes):
+        filePath = os.path.join(self.directory, f'ledger-{sizeInMegabytes}MB.txt')
+        line = 'Coffee From The Corner Store\n4.50\n'
+        repetitions = sizeInMegabytes * 1024 * 1024 // len(line)
+        with open(filePath, 'w', encoding='utf-8') as file:
+            for _ in range(repetitions // 10000):
+                file.write(line * 10000)
+            file.write(line * (repetitions % 10000))
+        return filePath
+
+
+class DetectorBenchmark:
+    def __init__(self, filePath):
+        self.filePath = filePath
+
+    def run(self):
+        return {
+            'legacy': self.timeLegacyDetector(),
+            'sniffed': self.timeSniffedDetector(),
+        }
+
+    def timeLegacyDetector(self):
+        start = time.perf_counter()
+        content = TextFile(self.filePath).getDataFromFile()
+        fileType = LegacyTextFileIdentifier(content).getFileType()
+        return fileType, time.perf_counter() - start
+
+    def timeSniffedDetector(self):
+        start = time.perf_counter()
+        fileType = TextFile(self.filePath).getDialect().fileType
+        return fileType, time.perf_counter() - start
+
+
+def main(sizesInMegabytes):
+    print(f'sniff length: {TextFileIdentifier.sniffLength} characters')
+    with tempfile.TemporaryDirectory() as directory:
+        for sizeInMegabytes in sizesInMegabytes:
+            filePath = FlatFileWriter(directory).write(sizeInMegabytes)
+            results = DetectorBenchmark(filePath).run()
+            legacyType, legacySeconds = results['legacy']
+            sniffedType, sniffedSeconds = results['sniffed']
+            assert legacyType == sniffedType
+            print(
+                f'{sizeInMegabytes:>6} MB  {legacyType:<8}'
+                f'  legacy {legacySeconds:9.4f}s'
+                f'  sniffed {sniffedSeconds:9.6f}s'
+                f'  speedup {legacySeconds / sniffedSeconds:10.1f}x'
+            )
+            os.remove(filePath)
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [10, 100, 1024])
@@ -0,0 +1,54 @@
+import argparse
+import os
+import tempfile
+
+from openpyxl import Workbook
+
+from Benchmarks.Pipeline import StageClock
+from Benchmarks.SyntheticLedger import SyntheticLedger
+from ExtractBudgetData.Aggregation import groupBudgetInfo
+from ExtractBudgetData.Cost import Cost
+from UpdateSpreadsheet.WorksheetFormatter import SpreadsheetFormatter
+from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+
+layouts = {
+    'detailed': lambda budgetInfo: budgetInfo,
+    'grouped': lambda budgetInfo: groupBudgetInfo(budgetInfo),
+    'top 20': lambda budgetInfo: groupBudgetInfo(budgetInfo, 20),
+}
+
+
+def writeWorkbook(items, layout, workbookPath):
+    budgetInfo = layouts[layout](Cost(items).streamBudgetInfo('formatted'))
+    depositor = WorksheetDataDepositor(Workbook(), 'Sheet')
+    workbook = depositor.replace(budgetInfo)
+    SpreadsheetFormatter(workbook['Sheet'], depositor.getRowTypes()).apply()
+    workbook.save(workbookPath)
+    return workbook['Sheet'].max_row
+
+
+def main(arguments):
+    items = SyntheticLedger(arguments.items, distinctItems=arguments.distinct_items).createItems()
+    print(f'{arguments.items} items, {arguments.distinct_items} distinct')
+    with tempfile.TemporaryDirectory() as directory:
+        for layout in layouts:
+            workbookPath = os.path.join(directory, f'{layout}.xlsx')
+            stageClock = StageClock()
+            for _ in range(arguments.repeat):
+                numberOfRows = stageClock.measure(layout, writeWorkbook, items, layout, workbookPath)
+            print(
+                f'  {layout:<9} {stageClock.stageSeconds[layout]:8.3f}s'
+                f'  {numberOfRows:>8} rows  {os.path.getsize(workbookPath) / 1e6:8.2f}MB'
+            )
+
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description='Compare detailed and grouped day sheets for a repetitive ledger.')
+    parser.add_argument('--items', type=int, default=200000)
+    parser.add_argument('--distinct-items', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    main(parseArguments())
@@ -0,0 +1,55 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from Benchmarks.SyntheticLedger import SyntheticLedger
+from ExtractBudgetData.Aggregation import ItemAggregator
+from ExtractBudgetData.Cost import CostTableBuilder
+from ExtractBudgetData.ItemDictionary import ItemDictionary
+from ExtractBudgetData.TextFile import TextFile
+
+variants = {
+    'raw names': lambda: None,
+    'item ids': ItemDictionary,
+}
+
+
+def measureTable(ledgerPath, itemDictionary):
+    tracemalloc.start()
+    try:
+        costTable = CostTableBuilder(TextFile(ledgerPath).iterMappedData(), itemDictionary=itemDictionary).createTable('formatted')
+        retainedBytes = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return costTable, retainedBytes
+
+
+def measureGrouping(costTable, itemDictionary):
+    start = time.perf_counter()
+    ItemAggregator('formatted', itemDictionary=itemDictionary).aggregate(costTable)
+    return time.perf_counter() - start
+
+
+def main(arguments):
+    syntheticLedger = SyntheticLedger(arguments.items, distinctItems=arguments.distinct_items)
+    print(f'{arguments.items} items, {arguments.distinct_items} distinct')
+    with tempfile.TemporaryDirectory() as directory:
+        ledgerPath = syntheticLedger.write(os.path.join(directory, 'ledger.txt'))
+        for variant, createDictionary in variants.items():
+            itemDictionary = createDictionary()
+            costTable, retainedBytes = measureTable(ledgerPath, itemDictionary)
+            groupingSeconds = measureGrouping(costTable, itemDictionary)
+            print(f'  {variant:<10} table {retainedBytes / 1e6:8.2f}MB  grouping {groupingSeconds:7.3f}s')
+
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description='Compare cost tables holding item names with ones holding item ids.')
+    parser.add_argument('--items', type=int, default=500000)
+    parser.add_argument('--distinct-items', type=int, default=500)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    main(parseArguments())
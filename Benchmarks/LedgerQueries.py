@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from Benchmarks.SyntheticLedger import SyntheticLedger
+from ExtractBudgetData.Cost import Cost
+from ExtractBudgetData.SqliteLedger import SqliteLedger
+from ExtractBudgetData.TaxRules import TaxRule, TaxRuleTable
+
+
+def recordDays(sqliteLedger, numberOfDays, itemsPerDay, taxRules):
+    firstDate = date(2025, 1, 1)
+    for dayNumber in range(numberOfDays):
+        isoDate = (firstDate + timedelta(days=dayNumber)).isoformat()
+        items = SyntheticLedger(itemsPerDay, seed=dayNumber).createItems()
+        budgetInfo = Cost(items, taxRules=taxRules).streamBudgetInfo('formatted')
+        sqliteLedger.beginDay(isoDate, replacesDay=True)
+        for _ in sqliteLedger.passThrough(isoDate, budgetInfo.costTable, taxRules):
+            pass
+        sqliteLedger.commitDay(isoDate, itemsPerDay, [0.0, 0.0, 0.0])
+
+
+def timeQuery(query, *arguments):
+    bestSeconds = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        query(*arguments)
+        bestSeconds = min(bestSeconds, time.perf_counter() - start)
+    return bestSeconds
+
+
+def main(numberOfDays=365, itemsPerDay=1000):
+    taxRules = TaxRuleTable({'standard': '0.13', 'food': '0'}, [TaxRule('prefix', 'fresh', 'food')])
+    with tempfile.TemporaryDirectory() as directory:
+        sqliteLedger = SqliteLedger(os.path.join(directory, 'ledger.sqlite3'))
+        start = time.perf_counter()
+        recordDays(sqliteLedger, numberOfDays, itemsPerDay, taxRules)
+        recordSeconds = time.perf_counter() - start
+        queries = {
+            'quarter range': (sqliteLedger.rangeTotals, '2025-04-01', '2025-06-30'),
+            'item in quarter': (sqliteLedger.itemTotals, 'Organic Coffee 2', '2025-04-01', '2025-06-30'),
+            'categories in quarter': (sqliteLedger.categoryTotals, '2025-04-01', '2025-06-30'),
+        }
+        print(f'{numberOfDays} days x {itemsPerDay} items')
+        print(f'  record                 {recordSeconds:9.3f}s  {numberOfDays * itemsPerDay / recordSeconds:12,.0f} rows/s')
+        for queryName, (query, *arguments) in queries.items():
+            print(f'  {queryName:<22} {timeQuery(query, *arguments) * 1000:9.3f}ms')
+        sqliteLedger.close()
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:3]))
@@ -0,0 +1,42 @@
+import random
+import sys
+import time
+
+from ExtractBudgetData.Cost import Cost
+from ExtractBudgetData.MoneyEngine import CentsMoneyEngine, DecimalMoneyEngine
+
+
+def createItems(numberOfItems):
+    generator = random.Random(0)
+    return [
+        [f'Item {index % 97}', f'{generator.randint(0, 400)}.{generator.randint(0, 99):02d}']
+        for index in range(numberOfItems)
+    ]
+
+
+def timeCostSummary(cost):
+    start = time.perf_counter()
+    priceTable = cost.createPriceTable('formatted')
+    priceSummary = cost.createPriceSummary(priceTable)
+    return priceSummary[1], time.perf_counter() - start
+
+
+def main(numberOfItems):
+    items = createItems(numberOfItems)
+    engines = {
+        'float (python)': Cost(items),
+        'float (numpy)': Cost(items, backend='numpy'),
+        'integer cents': Cost(items, moneyEngine=CentsMoneyEngine()),
+        'decimal': Cost(items, moneyEngine=DecimalMoneyEngine()),
+    }
+    print(f'{numberOfItems} items')
+    results = {}
+    for engineName, cost in engines.items():
+        totals, seconds = timeCostSummary(cost)
+        results[engineName] = seconds
+        print(f'  {engineName:<15} {seconds:8.3f}s  totals {totals[1:]}')
+    assert results['integer cents'] <= results['float (python)']
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,77 @@
+import random
+import sys
+import time
+
+from openpyxl import Workbook
+
+from Benchmarks.LegacyFormatting import RowNumberIdentifier
+from ExtractBudgetData.Cost import Cost, CostSummary, CostTableBuilder
+from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+
+
+class LegacyTypeOfRowIdentifier(RowNumberIdentifier):
+    def typeOfRow(self, row):
+        for item in row:
+            if '$' in str(item):
+                return 'Body'
+        return 'Header'
+
+
+class LegacyDollarStringPipeline:
+    def __init__(self, items):
+        self.items = items
+
+    def run(self):
+        costTableBuilder = CostTableBuilder(self.items)
+        costTable = [costTableBuilder.headers] + [
+            self.standardizePrice(costTableBuilder.computePriceDetails(item)) for item in costTableBuilder.iterItems()
+        ]
+        summaryHeaders, summaryValues = CostSummary(costTable).compute()
+        summaryValues = [str(summaryValues[0])] + ['${:.2f}'.format(total) for total in summaryValues[1:]]
+        budgetInfo = costTable + [summaryHeaders, summaryValues]
+        worksheet = WorksheetDataDepositor(Workbook(), 'Sheet').insert(budgetInfo)['Sheet']
+        rowIdentifier = LegacyTypeOfRowIdentifier(worksheet)
+        return rowIdentifier.fetchRowNumbers('header'), rowIdentifier.fetchRowNumbers('body')
+
+    def standardizePrice(self, item):
+        return [item[0]] + ['${0:.2f}'.format(price) for price in item[1:]]
+
+
+class NumericPipeline:
+    def __init__(self, items):
+        self.items = items
+
+    def run(self):
+        budgetInfo = Cost(self.items).getBudgetInfo('formatted')
+        worksheet = WorksheetDataDepositor(Workbook(), 'Sheet').insert(budgetInfo)['Sheet']
+        rowIdentifier = RowNumberIdentifier(worksheet)
+        return rowIdentifier.fetchRowNumbers('header'), rowIdentifier.fetchRowNumbers('body')
+
+
+def createItems(numberOfItems):
+    generator = random.Random(0)
+    return [
+        [f'Item {index % 97}', f'{generator.randint(0, 400)}.{generator.randint(0, 99):02d}']
+        for index in range(numberOfItems)
+    ]
+
+
+def timePipeline(pipeline):
+    start = time.perf_counter()
+    rowNumbers = pipeline.run()
+    return rowNumbers, time.perf_counter() - start
+
+
+def main(numberOfItems):
+    items = createItems(numberOfItems)
+    legacyRows, legacySeconds = timePipeline(LegacyDollarStringPipeline(items))
+    numericRows, numericSeconds = timePipeline(NumericPipeline(items))
+    assert legacyRows == numericRows
+    print(f'{numberOfItems} items')
+    print(f'  dollar strings {legacySeconds:8.3f}s')
+    print(f'  numeric        {numericSeconds:8.3f}s')
+    print(f'  speedup        {legacySeconds / numericSeconds:8.2f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,158 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from openpyxl import Workbook
+
+from Benchmarks.SyntheticLedger import SyntheticLedger, fileTypes, priceDistributions
+from ExtractBudgetData.Cost import Cost
+from ExtractBudgetData.TextFile import TextFile
+from UpdateSpreadsheet.WorksheetFormatter import SpreadsheetFormatter
+from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+
+stageNames = ('extract', 'cost raw', 'cost formatted', 'insert', 'format', 'save')
+repositoryRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StageClock:
+    def __init__(self):
+        self.stageSeconds = {}
+
+    def measure(self, stageName, function, *arguments):
+        start = time.perf_counter()
+        result = function(*arguments)
+        seconds = time.perf_counter() - start
+        self.stageSeconds[stageName] = min(seconds, self.stageSeconds.get(stageName, seconds))
+        return result
+
+
+class StageMemoryTracer:
+    def __init__(self):
+        self.stagePeakBytes = {}
+
+    def measure(self, stageName, function, *arguments):
+        tracemalloc.start()
+        try:
+            result = function(*arguments)
+            self.stagePeakBytes[stageName] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return result
+
+
+class PipelineRun:
+    def __init__(self, ledgerPath, workbookPath):
+        self.ledgerPath = ledgerPath
+        self.workbookPath = workbookPath
+
+    def run(self, stageRecorder):
+        items = stageRecorder.measure('extract', TextFile(self.ledgerPath).extractData)
+        stageRecorder.measure('cost raw', Cost(items).getBudgetInfo, 'raw')
+        budgetInfo = stageRecorder.measure('cost formatted', Cost(items).getBudgetInfo, 'formatted')
+        depositor = WorksheetDataDepositor(Workbook(), 'Sheet')
+        workbook = stageRecorder.measure('insert', depositor.insert, budgetInfo)
+        formatter = SpreadsheetFormatter(workbook['Sheet'], depositor.getRowTypes())
+        stageRecorder.measure('format', formatter.apply)
+        stageRecorder.measure('save', workbook.save, self.workbookPath)
+        return len(items)
+
+
+class PipelineBenchmark:
+    def __init__(self, directory, syntheticLedger, repetitions):
+        self.directory = directory
+        self.syntheticLedger = syntheticLedger
+        self.repetitions = repetitions
+
+    def run(self):
+        ledgerPath = self.syntheticLedger.write(os.path.join(self.directory, f'ledger.{self.syntheticLedger.fileType}.txt'))
+        pipelineRun = PipelineRun(ledgerPath, os.path.join(self.directory, 'Week 1.xlsx'))
+        stageClock = StageClock()
+        for _ in range(self.repetitions):
+            numberOfItems = pipelineRun.run(stageClock)
+        memoryTracer = StageMemoryTracer()
+        pipelineRun.run(memoryTracer)
+        return self.createResult(numberOfItems, stageClock, memoryTracer, pipelineRun)
+
+    def createResult(self, numberOfItems, stageClock, memoryTracer, pipelineRun):
+        return {
+            'items': numberOfItems,
+            'fileType': self.syntheticLedger.fileType,
+            'priceDistribution': self.syntheticLedger.priceDistribution,
+            'seed': self.syntheticLedger.seed,
+            'repetitions': self.repetitions,
+            'ledgerBytes': os.path.getsize(pipelineRun.ledgerPath),
+            'workbookBytes': os.path.getsize(pipelineRun.workbookPath),
+            'stages': {
+                stageName: {
+                    'seconds': stageClock.stageSeconds[stageName],
+                    'itemsPerSecond': numberOfItems / stageClock.stageSeconds[stageName],
+                    'peakBytes': memoryTracer.stagePeakBytes[stageName],
+                }
+                for stageName in stageNames
+            },
+        }
+
+
+def getCommit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=repositoryRoot,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def printResult(result):
+    print(f"{result['items']} items  {result['fileType']}  {result['priceDistribution']}")
+    for stageName, stage in result['stages'].items():
+        print(
+            f'  {stageName:<15}  {stage["seconds"]:9.4f}s'
+            f'  {stage["itemsPerSecond"]:13,.0f} items/s'
+            f'  peak {stage["peakBytes"] / 1e6:9.2f}MB'
+        )
+
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description='Time every stage of the ledger to spreadsheet pipeline.')
+    parser.add_argument('--items', type=int, nargs='+', default=[10000, 50000])
+    parser.add_argument('--file-types', choices=fileTypes, nargs='+', default=list(fileTypes))
+    parser.add_argument('--distribution', choices=sorted(priceDistributions), default='lognormal')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='JSON lines file that each run is appended to')
+    return parser.parse_args()
+
+
+def main(arguments):
+    results = []
+    for numberOfItems in arguments.items:
+        for fileType in arguments.file_types:
+            syntheticLedger = SyntheticLedger(numberOfItems, fileType, arguments.distribution, arguments.seed)
+            with tempfile.TemporaryDirectory() as directory:
+                result = PipelineBenchmark(directory, syntheticLedger, arguments.repeat).run()
+            printResult(result)
+            results.append(result)
+    if arguments.output:
+        record = {
+            'recordedAt': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': getCommit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results,
+        }
+        with open(arguments.output, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(record) + '\n')
+
+
+if __name__ == '__main__':
+    main(parseArguments())
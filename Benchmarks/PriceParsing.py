@@ -0,0 +1,76 @@
+import argparse
+import random
+import time
+
+from Benchmarks.SyntheticLedger import SyntheticLedger, priceDistributions
+from ExtractBudgetData.Cost import CostTableBuilder
+
+
+class LegacyCostTableBuilder(CostTableBuilder):
+    def iterItems(self):
+        return iter(self.items)
+
+    def computePriceDetails(self, item):
+        try:
+            basePriceNumber = int(item[1])
+        except ValueError:
+            basePriceNumber = float(item[1])
+        taxMultiplier = self.taxRules.multiplierFor(item[0])
+        priceAfterTax = basePriceNumber * taxMultiplier
+        return [item[0], basePriceNumber, priceAfterTax, priceAfterTax - basePriceNumber]
+
+
+builders = {
+    'exception fallback': LegacyCostTableBuilder,
+    'price parser': CostTableBuilder,
+}
+
+
+def formatPrice(generator, price):
+    dollars = float(price)
+    if generator.random() < 0.5:
+        return f'${dollars:,.2f}'
+    return f'{dollars:,.2f}'
+
+
+def createPriceMixes(items, seed):
+    generator = random.Random(seed)
+    return {
+        'decimal': items,
+        'integer': [[item[0], str(round(float(item[1])))] for item in items],
+        'formatted': [[item[0], formatPrice(generator, item[1])] for item in items],
+    }
+
+
+def timeBuilder(createBuilder, items, repeat):
+    bestSeconds = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        createBuilder(items).createTable('formatted')
+        bestSeconds = min(bestSeconds, time.perf_counter() - start)
+    return bestSeconds
+
+
+def main(arguments):
+    items = SyntheticLedger(arguments.items, priceDistribution=arguments.distribution).createItems()
+    print(f'{arguments.items} items, {arguments.distribution} prices')
+    for priceMix, mixedItems in createPriceMixes(items, arguments.seed).items():
+        for builder, createBuilder in builders.items():
+            if priceMix == 'formatted' and createBuilder is LegacyCostTableBuilder:
+                print(f'  {priceMix:<9} {builder:<18}      fails')
+                continue
+            seconds = timeBuilder(createBuilder, mixedItems, arguments.repeat)
+            print(f'  {priceMix:<9} {builder:<18} {seconds:8.3f}s  {arguments.items / seconds / 1e6:6.2f}M rows/s')
+
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description='Compare exception-driven price parsing with the pattern-based price parser.')
+    parser.add_argument('--items', type=int, default=500000)
+    parser.add_argument('--distribution', choices=sorted(priceDistributions), default='uniform')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    main(parseArguments())
@@ -0,0 +1,99 @@
+import random
+import sys
+import time
+
+from openpyxl import Workbook
+
+from Benchmarks.LegacyFormatting import FontFormatter
+from ExtractBudgetData.Cost import Cost
+from UpdateSpreadsheet.StyleRegistry import StyleRegistry
+from UpdateSpreadsheet.WorksheetFormatter import SpreadsheetFormatter
+from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+from UpdateSpreadsheet.dataObjects import (
+    BODY_FONT_PROFILE,
+    BOTTOM_LEFT_ALIGNMENT,
+    COLUMN_WIDTH_PADDING,
+    HEADER_FONT_PROFILE,
+    ROW_HEIGHT,
+)
+
+
+class MultiPassSpreadsheetFormatter(SpreadsheetFormatter):
+    def apply(self):
+        FontFormatter(self.worksheet).changeHeaderFont(HEADER_FONT_PROFILE)
+        FontFormatter(self.worksheet).changeBodyFont(BODY_FONT_PROFILE)
+        self.adjustWidthOfColumnsToFit()
+        self.padRowHeight()
+        self.alignCellsBottomLeft()
+
+    def adjustWidthOfColumnsToFit(self) -> None:
+        for column in self.worksheet.iter_cols():
+            currentColumnIndex = ""
+            maxLengthOfCellInColumn = 0
+            for cell in column:
+                currentColumnIndex = cell.column_letter
+                lengthOfCellValue = len(self.getDisplayedValue(cell))
+                if lengthOfCellValue > maxLengthOfCellInColumn:
+                    maxLengthOfCellInColumn = lengthOfCellValue
+            self.worksheet.column_dimensions[currentColumnIndex].width = maxLengthOfCellInColumn + COLUMN_WIDTH_PADDING
+
+    def padRowHeight(self) -> None:
+        for row in range(1, self.dataRows + 1):
+            self.worksheet.row_dimensions[row].height = ROW_HEIGHT
+
+    def alignCellsBottomLeft(self) -> None:
+        styleRegistry = StyleRegistry.forWorkbook(self.worksheet.parent)
+        for row in self.worksheet.iter_rows(max_row=self.dataRows, max_col=self.worksheet.max_column):
+            for cell in row:
+                styleRegistry.applyAlignment(cell, BOTTOM_LEFT_ALIGNMENT)
+
+
+def createBudgetInfo(numberOfItems):
+    generator = random.Random(0)
+    items = [
+        [f'Item {index % 97}', f'{generator.randint(0, 400)}.{generator.randint(0, 99):02d}']
+        for index in range(numberOfItems)
+    ]
+    return Cost(items).getBudgetInfo('formatted')
+
+
+def timeFormatter(budgetInfo, formatterFactory):
+    depositor = WorksheetDataDepositor(Workbook(), 'Sheet')
+    worksheet = depositor.insert(budgetInfo)['Sheet']
+    start = time.perf_counter()
+    formatterFactory(worksheet, depositor).apply()
+    seconds = time.perf_counter() - start
+    return seconds, getFormatting(worksheet)
+
+
+def getFormatting(worksheet):
+    cells = [
+        (cell.font.name, cell.font.b, cell.alignment.horizontal, cell.alignment.vertical)
+        for row in worksheet.iter_rows() for cell in row
+    ]
+    columnWidths = {letter: dimension.width for letter, dimension in worksheet.column_dimensions.items()}
+    rowHeights = {number: dimension.height for number, dimension in worksheet.row_dimensions.items()}
+    return cells, columnWidths, rowHeights
+
+
+def main(numberOfItems):
+    budgetInfo = createBudgetInfo(numberOfItems)
+    multiPassSeconds, multiPassFormatting = timeFormatter(
+        budgetInfo, lambda worksheet, depositor: MultiPassSpreadsheetFormatter(worksheet)
+    )
+    detectedSeconds, detectedFormatting = timeFormatter(
+        budgetInfo, lambda worksheet, depositor: SpreadsheetFormatter(worksheet)
+    )
+    suppliedSeconds, suppliedFormatting = timeFormatter(
+        budgetInfo, lambda worksheet, depositor: SpreadsheetFormatter(worksheet, depositor.getRowTypes())
+    )
+    assert multiPassFormatting == detectedFormatting == suppliedFormatting
+    print(f'{numberOfItems} items')
+    print(f'  multi-pass                  {multiPassSeconds:8.3f}s')
+    print(f'  single pass, detected rows  {detectedSeconds:8.3f}s')
+    print(f'  single pass, supplied rows  {suppliedSeconds:8.3f}s')
+    print(f'  speedup                     {multiPassSeconds / suppliedSeconds:8.2f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,82 @@
+import os
+import sys
+import tempfile
+import time
+
+import openpyxl
+
+from UpdateSpreadsheet.FileSystem import FileCreator, SpreadsheetFileCreator
+from UpdateSpreadsheet.WorkbookPopulator import WorkbookPopulator
+
+
+class StageTimer:
+    def __init__(self):
+        self.stageSeconds = {}
+
+    def time(self, stageName, function, *arguments):
+        start = time.perf_counter()
+        result = function(*arguments)
+        self.stageSeconds[stageName] = self.stageSeconds.get(stageName, 0.0) + time.perf_counter() - start
+        return result
+
+    def total(self):
+        return sum(self.stageSeconds.values())
+
+
+class LegacyRoundTripSetUp:
+    def __init__(self, parentDirectory, currentDate):
+        self.parentDirectory = parentDirectory
+        self.currentDate = currentDate
+
+    def run(self, stageTimer):
+        filePath = f'{self.parentDirectory}Week legacy.xlsx'
+        stageTimer.time('create empty file', openpyxl.Workbook().save, filePath)
+        bytesRoundTripped = os.path.getsize(filePath) * 2
+        workbook = stageTimer.time('reload empty file', openpyxl.load_workbook, filePath)
+        stageTimer.time('populate', WorkbookPopulator(self.currentDate).populate, workbook)
+        stageTimer.time('save', workbook.save, filePath)
+        return bytesRoundTripped
+
+
+class InMemorySetUp:
+    def __init__(self, parentDirectory, currentDate):
+        self.parentDirectory = parentDirectory
+        self.currentDate = currentDate
+
+    def run(self, stageTimer):
+        spreadsheet = SpreadsheetFileCreator(FileCreator(self.parentDirectory), self.currentDate).create()
+        workbook = stageTimer.time('create in memory', spreadsheet.__getitem__, 'Workbook')
+        stageTimer.time('populate', WorkbookPopulator(self.currentDate).populate, workbook)
+        stageTimer.time('atomic save', spreadsheet.save)
+        return 0
+
+
+def timeSetUp(setUpClass, currentDate, repetitions):
+    stageTimer = StageTimer()
+    bytesRoundTripped = 0
+    for _ in range(repetitions):
+        with tempfile.TemporaryDirectory() as temporaryDirectory:
+            bytesRoundTripped += setUpClass(f'{temporaryDirectory}/', currentDate).run(stageTimer)
+    return stageTimer, bytesRoundTripped
+
+
+def report(label, stageTimer, bytesRoundTripped, repetitions):
+    print(f'  {label:<20} {stageTimer.total() / repetitions * 1000:8.2f}ms per run')
+    for stageName, seconds in stageTimer.stageSeconds.items():
+        print(f'    {stageName:<18} {seconds / repetitions * 1000:8.2f}ms')
+    if bytesRoundTripped:
+        print(f'    {"bytes written+read":<18} {bytesRoundTripped // repetitions:8d}')
+
+
+def main(repetitions):
+    currentDate = '2025-03-20'
+    legacyTimer, legacyBytes = timeSetUp(LegacyRoundTripSetUp, currentDate, repetitions)
+    inMemoryTimer, inMemoryBytes = timeSetUp(InMemorySetUp, currentDate, repetitions)
+    print(f'{repetitions} spreadsheet set-ups')
+    report('create-save-reload', legacyTimer, legacyBytes, repetitions)
+    report('in memory', inMemoryTimer, inMemoryBytes, repetitions)
+    print(f'  saved per run        {(legacyTimer.total() - inMemoryTimer.total()) / repetitions * 1000:8.2f}ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
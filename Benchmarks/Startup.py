@@ -0,0 +1,89 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+heavyModules = ('openpyxl', 'pendulum', 'numpy')
+repositoryRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StartupEnvironment:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def create(self):
+        ledgerPath = os.path.join(self.directory, 'ledger.txt')
+        with open(ledgerPath, 'w', encoding='utf-8') as file:
+            file.write('Coffee\n4.50\nBagel\n2.25\nNewspaper\n3.00\n')
+        with open(os.path.join(self.directory, 'paths.py'), 'w', encoding='utf-8') as file:
+            file.write(f'flatTextFile = {ledgerPath!r}\n')
+            file.write(f'saveDirectoryForSpreadsheets = {self.directory + os.sep!r}\n')
+        environment = dict(os.environ)
+        environment['PYTHONPATH'] = os.pathsep.join([repositoryRoot, self.directory])
+        return environment
+
+
+class ImportTimeReport:
+    def __init__(self, stderr):
+        self.cumulativeMicroseconds = self.parse(stderr)
+
+    def parse(self, stderr):
+        cumulativeMicroseconds = {}
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, moduleName = line[len('import time:'):].split('|')
+            cumulativeMicroseconds[moduleName.strip()] = int(cumulative)
+        return cumulativeMicroseconds
+
+    def describeHeavyModules(self):
+        return '  '.join(
+            f'{moduleName} {self.cumulativeMicroseconds[moduleName] / 1000:6.1f}ms'
+            if moduleName in self.cumulativeMicroseconds else f'{moduleName} {"-":>8}'
+            for moduleName in heavyModules
+        )
+
+
+class StartupBenchmark:
+    def __init__(self, directory, environment, repetitions):
+        self.directory = directory
+        self.environment = environment
+        self.repetitions = repetitions
+
+    def run(self, arguments):
+        bestSeconds = float('inf')
+        for _ in range(self.repetitions):
+            start = time.perf_counter()
+            completedProcess = self.runOnce(arguments)
+            bestSeconds = min(bestSeconds, time.perf_counter() - start)
+        return bestSeconds, ImportTimeReport(completedProcess.stderr)
+
+    def runOnce(self, arguments):
+        return subprocess.run(
+            [sys.executable, '-X', 'importtime', *arguments],
+            cwd=self.directory,
+            env=self.environment,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+
+def main(repetitions):
+    mainScript = os.path.join(repositoryRoot, 'main.py')
+    commands = {
+        'interpreter': ['-c', 'pass'],
+        'import main': ['-c', 'import main'],
+        'main.py --help': [mainScript, '--help'],
+        'main.py (daily run)': [mainScript],
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        startupBenchmark = StartupBenchmark(directory, StartupEnvironment(directory).create(), repetitions)
+        for commandName, arguments in commands.items():
+            bestSeconds, importTimeReport = startupBenchmark.run(arguments)
+            print(f'{commandName:<20}  best {bestSeconds * 1000:8.1f}ms  {importTimeReport.describeHeavyModules()}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,80 @@
+import sys
+import time
+
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Font
+
+from Benchmarks.LegacyFormatting import CellFontChanger
+from UpdateSpreadsheet.FontFormatter import TypeOfRowIdentifier
+from UpdateSpreadsheet.StyleRegistry import StyleRegistry
+from UpdateSpreadsheet.dataObjects import BODY_FONT_PROFILE, BOTTOM_LEFT_ALIGNMENT, HEADER_FONT_PROFILE
+
+
+class LegacyCellFontChanger(CellFontChanger):
+    def changeCellFontProperties(self, FontProfile, bodyCell):
+        bodyCell.font = Font(
+            name=FontProfile.name,
+            size=FontProfile.size,
+            bold=FontProfile.boldToggle
+        )
+
+
+class StyleCacheBenchmark:
+    def __init__(self, numberOfRows):
+        self.numberOfRows = numberOfRows
+
+    def createWorksheet(self):
+        worksheet = Workbook().active
+        worksheet.append(['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'])
+        for rowNumber in range(self.numberOfRows):
+            worksheet.append([f'Item {rowNumber}', 1.0, 1.13, 0.13])
+        worksheet.append(['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'])
+        worksheet.append([self.numberOfRows, float(self.numberOfRows), 1.13 * self.numberOfRows, 0.13 * self.numberOfRows])
+        return worksheet
+
+    def run(self, fontChangerClass, alignCell):
+        worksheet = self.createWorksheet()
+        rowTypes = [TypeOfRowIdentifier(worksheet).typeOfRow(row) for row in worksheet.iter_rows(values_only=True)]
+        fontChangers = {
+            'Header': fontChangerClass(worksheet, HEADER_FONT_PROFILE),
+            'Body': fontChangerClass(worksheet, BODY_FONT_PROFILE),
+        }
+        start = time.perf_counter()
+        for rowType, row in zip(rowTypes, worksheet.iter_rows()):
+            fontChanger = fontChangers[rowType]
+            for cell in row:
+                fontChanger.changeCellFontProperties(fontChanger.fontProfile, cell)
+                alignCell(worksheet, cell)
+        seconds = time.perf_counter() - start
+        return seconds, len(worksheet.parent._fonts), len(worksheet.parent._alignments)
+
+
+def alignCellPerCell(worksheet, cell):
+    cell.alignment = Alignment(
+        horizontal="left",
+        vertical="bottom"
+    )
+
+
+def alignCellFromRegistry(worksheet, cell):
+    StyleRegistry.forWorkbook(worksheet.parent).applyAlignment(cell, BOTTOM_LEFT_ALIGNMENT)
+
+
+def report(label, seconds, fontCount, alignmentCount, numberOfCells):
+    print(f'  {label:<22} {seconds:8.2f}s  {seconds / numberOfCells * 1e6:6.2f}us per cell  '
+          f'fonts={fontCount} alignments={alignmentCount}')
+
+
+def main(numberOfRows):
+    styleCacheBenchmark = StyleCacheBenchmark(numberOfRows)
+    numberOfCells = (numberOfRows + 3) * 4
+    legacyResult = styleCacheBenchmark.run(LegacyCellFontChanger, alignCellPerCell)
+    registryResult = styleCacheBenchmark.run(CellFontChanger, alignCellFromRegistry)
+    print(f'font and alignment styling of {numberOfCells} cells ({numberOfRows} item rows)')
+    report('per-cell Font/Alignment', *legacyResult, numberOfCells)
+    report('shared style registry', *registryResult, numberOfCells)
+    print(f'  speed-up               {legacyResult[0] / registryResult[0]:8.2f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,94 @@
+import argparse
+import random
+
+adjectives = ('Small', 'Large', 'Organic', 'Used', 'Imported', 'Spare', 'Weekly', 'Discount', 'Fresh', 'Café')
+nouns = ('Coffee', 'Bagel', 'Notebook', 'Bus Fare', 'Headphones', 'Groceries', 'Sweater', 'Mug', 'Lamp', 'Shoes')
+
+
+def uniformPrice(generator):
+    return generator.uniform(0.01, 400)
+
+
+def lognormalPrice(generator):
+    return generator.lognormvariate(2.5, 1.0)
+
+
+def paretoPrice(generator):
+    return generator.paretovariate(1.5) * 2
+
+
+priceDistributions = {
+    'uniform': uniformPrice,
+    'lognormal': lognormalPrice,
+    'pareto': paretoPrice,
+}
+fileTypes = ('newline', 'csv')
+
+
+class SyntheticLedger:
+    linesPerWrite = 10000
+
+    def __init__(self, numberOfItems, fileType='newline', priceDistribution='lognormal', seed=0, distinctItems=500):
+        if fileType not in fileTypes:
+            raise ValueError(f"Unsupported file type: {fileType}")
+        if priceDistribution not in priceDistributions:
+            raise ValueError(f"Unsupported price distribution: {priceDistribution}")
+        self.numberOfItems = numberOfItems
+        self.fileType = fileType
+        self.priceDistribution = priceDistribution
+        self.seed = seed
+        self.distinctItems = distinctItems
+
+    def createItems(self):
+        return list(self.iterItems())
+
+    def iterItems(self):
+        generator = random.Random(self.seed)
+        itemNames = self.createItemNames()
+        drawPrice = priceDistributions[self.priceDistribution]
+        for _ in range(self.numberOfItems):
+            yield [generator.choice(itemNames), f'{drawPrice(generator):.2f}']
+
+    def createItemNames(self):
+        return [
+            f'{adjectives[index % len(adjectives)]} {nouns[index // len(adjectives) % len(nouns)]} {index}'
+            for index in range(self.distinctItems)
+        ]
+
+    def write(self, filePath):
+        lines = []
+        with open(filePath, 'w', encoding='utf-8', newline='') as file:
+            for item in self.iterItems():
+                lines.append(self.formatItem(item))
+                if len(lines) == self.linesPerWrite:
+                    file.write(''.join(lines))
+                    lines.clear()
+            file.write(''.join(lines))
+        return filePath
+
+    def formatItem(self, item):
+        if self.fileType == 'csv':
+            return f'{item[0]}, {item[1]},\n'
+        return f'{item[0]}\n{item[1]}\n'
+
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description='Write a deterministic synthetic ledger.')
+    parser.add_argument('filePath')
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--file-type', choices=fileTypes, default='newline')
+    parser.add_argument('--distribution', choices=sorted(priceDistributions), default='lognormal')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--distinct-items', type=int, default=500)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = parseArguments()
+    SyntheticLedger(
+        arguments.items,
+        arguments.file_type,
+        arguments.distribution,
+        arguments.seed,
+        arguments.distinct_items,
+    ).write(arguments.filePath)
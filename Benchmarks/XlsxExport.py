@@ -0,0 +1,53 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from openpyxl import Workbook
+
+from ExtractBudgetData.Cost import Cost
+from UpdateSpreadsheet.StreamingWorksheetWriter import StreamingWorksheetDataDepositor
+from UpdateSpreadsheet.XlsxExporter import XlsxWorkbookExporter
+
+
+def createBudgetInfo(numberOfItems):
+    generator = random.Random(0)
+    items = [
+        [f'Item {index % 97}', f'{generator.randint(0, 400)}.{generator.randint(0, 99):02d}']
+        for index in range(numberOfItems)
+    ]
+    return Cost(items).getBudgetInfo('formatted')
+
+
+def saveWithOpenpyxl(budgetInfo, filePath):
+    workbook = Workbook(write_only=True)
+    StreamingWorksheetDataDepositor(workbook, 'Sheet').insert(budgetInfo)
+    workbook.save(filePath)
+
+
+def saveWithXmlExporter(budgetInfo, filePath):
+    xlsxExporter = XlsxWorkbookExporter(['Sheet'])
+    xlsxExporter.insert('Sheet', budgetInfo)
+    xlsxExporter.save(filePath)
+
+
+def timeExport(exportFunction, budgetInfo, filePath):
+    start = time.perf_counter()
+    exportFunction(budgetInfo, filePath)
+    return time.perf_counter() - start, os.path.getsize(filePath)
+
+
+def main(numberOfItems):
+    budgetInfo = createBudgetInfo(numberOfItems)
+    with tempfile.TemporaryDirectory() as temporaryDirectory:
+        openpyxlSeconds, openpyxlBytes = timeExport(saveWithOpenpyxl, budgetInfo, f'{temporaryDirectory}/openpyxl.xlsx')
+        xmlSeconds, xmlBytes = timeExport(saveWithXmlExporter, budgetInfo, f'{temporaryDirectory}/xml.xlsx')
+    print(f'{numberOfItems} items')
+    print(f'  openpyxl write-only  {openpyxlSeconds:8.2f}s  {openpyxlBytes / 1e6:7.1f}MB')
+    print(f'  xml exporter         {xmlSeconds:8.2f}s  {xmlBytes / 1e6:7.1f}MB')
+    print(f'  speedup              {openpyxlSeconds / xmlSeconds:8.2f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,131 @@
+import heapq
+
+from ExtractBudgetData.Cost import BudgetInfo, InternedCostTable
+from ExtractBudgetData.ItemDictionary import ItemDictionary
+
+
+class ItemGroup:
+    __slots__ = ('name', 'count', 'totals', 'lowestPrice', 'highestPrice')
+
+    def __init__(self, name, numberOfAmounts):
+        self.name = name
+        self.count = 0
+        self.totals = [0.0] * numberOfAmounts
+        self.lowestPrice = None
+        self.highestPrice = None
+
+    def add(self, amounts):
+        self.count += 1
+        for index, amount in enumerate(amounts):
+            self.totals[index] += amount
+        self.includePrices(amounts[0], amounts[0])
+
+    def merge(self, itemGroup):
+        self.count += itemGroup.count
+        for index, total in enumerate(itemGroup.totals):
+            self.totals[index] += total
+        self.includePrices(itemGroup.lowestPrice, itemGroup.highestPrice)
+
+    def includePrices(self, lowestPrice, highestPrice):
+        if self.lowestPrice is None or lowestPrice < self.lowestPrice:
+            self.lowestPrice = lowestPrice
+        if self.highestPrice is None or highestPrice > self.highestPrice:
+            self.highestPrice = highestPrice
+
+
+class ItemAggregator:
+    spendColumn = 1
+
+    def __init__(self, formatType='formatted', topItems=None, itemDictionary=None):
+        if topItems is not None and topItems < 1:
+            raise ValueError("The number of top items must be at least 1")
+        self.formatType = formatType
+        self.topItems = topItems
+        self.itemDictionary = itemDictionary if itemDictionary is not None else ItemDictionary()
+        self.headers = []
+        self.groups = {}
+
+    def add(self, row):
+        self.addIdentified(self.identify(row), row[1:])
+
+    def identify(self, row):
+        itemId = getattr(row, 'itemId', None)
+        itemNames = self.itemDictionary.names
+        if itemId is not None and itemId < len(itemNames) and itemNames[itemId] is row[0]:
+            return itemId
+        return self.itemDictionary.idFor(row[0])
+
+    def addIdentified(self, itemId, amounts):
+        itemGroup = self.groups.get(itemId)
+        if itemGroup is None:
+            itemGroup = self.groups[itemId] = ItemGroup(self.itemDictionary.nameFor(itemId), len(amounts))
+        itemGroup.add(amounts)
+
+    def aggregate(self, costTableRows):
+        if self.holdsSameItemIds(costTableRows):
+            self.headers = costTableRows.headers
+            for itemId, *amounts in costTableRows.iterIdentifiedRows():
+                self.addIdentified(itemId, amounts)
+            return self
+        costTableRows = iter(costTableRows)
+        self.headers = next(costTableRows)
+        for row in costTableRows:
+            self.add(row)
+        return self
+
+    def holdsSameItemIds(self, costTableRows):
+        return isinstance(costTableRows, InternedCostTable) and costTableRows.itemDictionary is self.itemDictionary
+
+    def iterTable(self, costTableRows):
+        self.aggregate(costTableRows)
+        yield self.getHeaders()
+        for itemGroup in self.getReportedGroups():
+            yield self.createRow(itemGroup)
+
+    def getHeaders(self):
+        return ['Count', *self.headers, 'Lowest Price', 'Highest Price']
+
+    def getReportedGroups(self):
+        if self.topItems is None or self.topItems >= len(self.groups):
+            return list(self.groups.values())
+        topGroups = self.topBySpend(self.topItems)
+        otherItems = ItemGroup(f'{len(self.groups) - len(topGroups)} Other Items', len(self.headers) - 1)
+        reportedGroups = set(topGroups)
+        for itemGroup in self.groups.values():
+            if itemGroup not in reportedGroups:
+                otherItems.merge(itemGroup)
+        return topGroups + [otherItems]
+
+    def topBySpend(self, numberOfItems):
+        return heapq.nlargest(numberOfItems, self.groups.values(), key=lambda itemGroup: itemGroup.totals[self.spendColumn])
+
+    def createRow(self, itemGroup):
+        amounts = self.roundAmounts([*itemGroup.totals, itemGroup.lowestPrice, itemGroup.highestPrice])
+        return [itemGroup.count, itemGroup.name, *amounts]
+
+    def iterSummary(self, costSummaryRows):
+        summaryHeaders, summaryValues = costSummaryRows
+        yield [summaryHeaders[0], 'Distinct Items', *summaryHeaders[1:], 'Lowest Price', 'Highest Price']
+        yield [summaryValues[0], len(self.groups), *summaryValues[1:], *self.roundAmounts(self.getPriceRange())]
+
+    def getPriceRange(self):
+        if not self.groups:
+            return [None, None]
+        lowestPrice = min(itemGroup.lowestPrice for itemGroup in self.groups.values())
+        highestPrice = max(itemGroup.highestPrice for itemGroup in self.groups.values())
+        return [lowestPrice, highestPrice]
+
+    def roundAmounts(self, amounts):
+        if self.formatType == 'formatted':
+            return [amount if amount is None else round(amount, 2) for amount in amounts]
+        return amounts
+
+
+def groupBudgetInfo(budgetInfo, topItems=None, itemDictionary=None):
+    itemAggregator = ItemAggregator(budgetInfo.formatType, topItems, itemDictionary)
+    return BudgetInfo(
+        itemAggregator.iterTable(budgetInfo.costTable),
+        itemAggregator.iterSummary(budgetInfo.costSummary),
+        budgetInfo.formatType,
+        plainColumnCount=2,
+    )
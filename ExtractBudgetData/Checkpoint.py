@@ -0,0 +1,196 @@
+import hashlib
+import json
+import mmap
+import os
+from typing import NamedTuple
+
+from ExtractBudgetData.Cost import BudgetInfo, Cost, CostSummaryStream, ValueStandardizer
+from ExtractBudgetData.PriceParser import PriceParser
+from ExtractBudgetData.TaxRules import TaxRuleTable
+from ExtractBudgetData.TextFile import TextFile, TextFileMappedReader
+
+
+class CostCheckpoint(NamedTuple):
+    sheetName: str
+    formatType: str
+    byteOffset: int
+    prefixHash: str
+    numberOfItems: int
+    totals: list
+    pendingItem: str | None
+    taxRulesFingerprint: str
+
+    @classmethod
+    def empty(cls, sheetName, formatType, taxRulesFingerprint):
+        return cls(sheetName, formatType, 0, hashlib.sha256().hexdigest(), 0, [], None, taxRulesFingerprint)
+
+
+class CheckpointStore:
+    def __init__(self, statePath):
+        self.statePath = statePath
+
+    def load(self):
+        try:
+            with open(self.statePath, 'r', encoding='utf-8') as file:
+                return CostCheckpoint(**json.load(file))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError):
+            return None
+
+    def save(self, checkpoint):
+        temporaryPath = f'{self.statePath}.tmp'
+        with open(temporaryPath, 'w', encoding='utf-8') as file:
+            json.dump(checkpoint._asdict(), file)
+        os.replace(temporaryPath, self.statePath)
+
+
+class IncrementalCost:
+    def __init__(self, filePath, sheetName, formatType, taxRules=None, itemDictionary=None):
+        self.filePath = filePath
+        self.sheetName = sheetName
+        self.formatType = formatType
+        self.taxRules = taxRules
+        self.taxRulesFingerprint = (taxRules if taxRules is not None else TaxRuleTable.default()).fingerprint()
+        self.itemDictionary = itemDictionary
+        self.fileSize = os.path.getsize(filePath)
+        self.priceParser = PriceParser()
+        self.rebuild()
+
+    def rebuild(self):
+        self.checkpoint = CostCheckpoint.empty(self.sheetName, self.formatType, self.taxRulesFingerprint)
+        self.prefixHasher = hashlib.sha256()
+        self.isResuming = False
+
+    def resumeFrom(self, savedCheckpoint):
+        self.rebuild()
+        if not self.isCompatible(savedCheckpoint):
+            return False
+        prefixHasher = FilePrefixHasher(self.filePath).hashRange(hashlib.sha256(), 0, savedCheckpoint.byteOffset)
+        if prefixHasher.hexdigest() != savedCheckpoint.prefixHash:
+            return False
+        if self.lastTokenWasExtended(savedCheckpoint.byteOffset):
+            return False
+        self.checkpoint = savedCheckpoint
+        self.prefixHasher = prefixHasher
+        self.isResuming = True
+        return True
+
+    def isCompatible(self, savedCheckpoint):
+        return (
+            savedCheckpoint is not None
+            and savedCheckpoint.sheetName == self.sheetName
+            and savedCheckpoint.formatType == self.formatType
+            and savedCheckpoint.taxRulesFingerprint == self.taxRulesFingerprint
+            and savedCheckpoint.byteOffset <= self.fileSize
+        )
+
+    def lastTokenWasExtended(self, byteOffset):
+        if byteOffset == 0 or byteOffset == self.fileSize:
+            return False
+        delimiter = self.getDialect().delimiter.encode('utf-8')
+        with open(self.filePath, 'rb') as file:
+            file.seek(byteOffset - 1)
+            boundaryBytes = file.read(2)
+        return delimiter not in boundaryBytes
+
+    def streamBudgetInfo(self, appendedPairs=None):
+        runningSummary = self.startRun()
+        if appendedPairs is None:
+            appendedPairs = self.iterAppendedPairs()
+        cost = Cost(appendedPairs, taxRules=self.taxRules, itemDictionary=self.itemDictionary, priceParser=self.priceParser)
+        return cost.streamBudgetInfo(self.formatType, runningSummary)
+
+    def shardBudgetInfo(self, maxWorkers=None):
+        from ExtractBudgetData.ShardedCost import ShardedCost
+        if self.isResuming:
+            raise ValueError("Sharded costing rebuilds the whole file and cannot resume from a checkpoint")
+        runningSummary = self.startRun()
+        shardedCost = ShardedCost(
+            self.filePath, maxWorkers, taxRules=self.taxRules, itemDictionary=self.itemDictionary, keepsNumberTypes=True
+        )
+        costTable = shardedCost.createPriceTable(self.formatType)
+        self.pendingItem = shardedCost.unpairedItem
+        self.priceParser.rejects.extend(shardedCost.rejects)
+        costTableRows = runningSummary.passThrough(self.canonicalizeRows(costTable))
+        return BudgetInfo(costTableRows, runningSummary.iterSummary(), self.formatType)
+
+    def startRun(self):
+        self.runningSummary = CostSummaryStream(
+            ValueStandardizer(), self.checkpoint.numberOfItems, list(self.checkpoint.totals)
+        )
+        self.pendingItem = self.checkpoint.pendingItem
+        self.fileHash = FilePrefixHasher(self.filePath).hashRange(
+            self.prefixHasher.copy(), self.checkpoint.byteOffset, self.fileSize
+        ).hexdigest()
+        return self.runningSummary
+
+    def canonicalizeRows(self, costTableRows):
+        costTableRows = iter(costTableRows)
+        yield next(costTableRows)
+        if self.itemDictionary is None:
+            yield from costTableRows
+            return
+        yield from map(self.itemDictionary.identify, costTableRows)
+
+    def iterAppendedPairs(self):
+        dialect = self.getDialect()
+        tokens = TextFileMappedReader(self.filePath, dialect).iterTokens((self.checkpoint.byteOffset, self.fileSize))
+        for token in tokens:
+            if self.pendingItem is None:
+                self.pendingItem = token
+            else:
+                yield [self.pendingItem, token]
+                self.pendingItem = None
+
+    def getRejects(self):
+        rejects = self.priceParser.rejects
+        if not rejects:
+            return []
+        leadingPriceOffset = 1 if self.checkpoint.pendingItem is not None else 0
+        priceTokenIndexes = {2 * rejectedPrice.entryNumber - 1 - leadingPriceOffset for rejectedPrice in rejects}
+        lineNumbers = {}
+        tokens = TextFileMappedReader(self.filePath, self.getDialect()).iterNumberedTokens(
+            (self.checkpoint.byteOffset, self.fileSize)
+        )
+        for tokenIndex, (lineNumber, _) in enumerate(tokens):
+            if tokenIndex in priceTokenIndexes:
+                lineNumbers[tokenIndex] = lineNumber
+                if len(lineNumbers) == len(priceTokenIndexes):
+                    break
+        return [
+            rejectedPrice._replace(lineNumber=lineNumbers.get(2 * rejectedPrice.entryNumber - 1 - leadingPriceOffset))
+            for rejectedPrice in rejects
+        ]
+
+    def getDialect(self):
+        dialect = TextFile(self.filePath).getDialect()
+        if dialect.fileType == 'unknown':
+            raise ValueError("Unsupported file type")
+        return dialect
+
+    def getCheckpoint(self):
+        return CostCheckpoint(
+            self.sheetName,
+            self.formatType,
+            self.fileSize,
+            self.fileHash,
+            self.runningSummary.numberOfItems,
+            self.runningSummary.totals,
+            self.pendingItem,
+            self.taxRulesFingerprint,
+        )
+
+
+class FilePrefixHasher:
+    def __init__(self, filePath):
+        self.filePath = filePath
+
+    def hashRange(self, hasher, start, end):
+        if start == end:
+            return hasher
+        with open(self.filePath, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mappedFile:
+                with memoryview(mappedFile) as fileView:
+                    hasher.update(fileView[start:end])
+        return hasher
@@ -1,64 +1,389 @@
 from abc import ABC, abstractmethod
+from array import array
+from importlib.util import find_spec
+
+from ExtractBudgetData.ItemDictionary import IdentifiedRow
+from ExtractBudgetData.PriceParser import PriceParser
+from ExtractBudgetData.TaxRules import TaxRuleTable
 
 class Cost:
-    def __init__(self, items):
+    def __init__(self, items, backend='python', moneyEngine=None, taxRules=None, itemDictionary=None, priceParser=None):
         self.items = items
+        self.backend = backend
+        self.moneyEngine = moneyEngine
+        self.taxRules = taxRules
+        self.itemDictionary = itemDictionary
+        self.priceParser = priceParser if priceParser is not None else PriceParser()
 
     def getBudgetInfo(self, formatType):
         priceTable = self.createPriceTable(formatType)
         priceSummary = self.createPriceSummary(priceTable)
         return self.consolidatePriceInfo(priceTable, priceSummary)
 
+    def streamBudgetInfo(self, formatType, runningSummary=None):
+        if self.moneyEngine is not None:
+            raise ValueError("Streamed costing keeps float running totals and cannot use a money engine")
+        if self.backend != 'python':
+            raise ValueError(f"Streamed costing prices one row at a time and cannot use the '{self.backend}' backend")
+        priceRows = CostTableBuilder(self.items, self.taxRules, self.itemDictionary, self.priceParser).iterTable(formatType)
+        if runningSummary is None:
+            runningSummary = CostSummaryStream(ValueStandardizer())
+        costTableRows = runningSummary.passThrough(priceRows)
+        return BudgetInfo(costTableRows, runningSummary.iterSummary(), formatType)
+
     def createPriceTable(self, typeOfTable):
-        return CostTable(self.items).createTable(typeOfTable)
+        if self.moneyEngine is not None:
+            return MoneyEngineCostTableBuilder(
+                self.items, self.moneyEngine, self.taxRules, self.priceParser
+            ).createTable(typeOfTable)
+        if self.backend == 'numpy':
+            return NumpyCostTableBuilder(self.items, self.taxRules, self.priceParser).createTable(typeOfTable)
+        return CostTableBuilder(self.items, self.taxRules, self.itemDictionary, self.priceParser).createTable(typeOfTable)
+
+    def createRowTable(self, typeOfTable):
+        return CostTableBuilder(self.items, self.taxRules, priceParser=self.priceParser).createRowTable(typeOfTable)
 
     def createPriceSummary(self, priceTable):
         return CostSummary(priceTable).compute()
 
     def consolidatePriceInfo(self, costTable, costSummary):
-        consolidated = []
-        consolidated.extend(costTable)
-        consolidated.extend(costSummary)
-        return consolidated
+        formatType = CostSummary(costTable).typeOfCostTable()
+        return BudgetInfo(costTable, costSummary, formatType)
 
 
-class CostTable:
-    def __init__(self, items):
+class CostTableBuilder:
+    def __init__(self, items, taxRules=None, itemDictionary=None, priceParser=None):
         self.items = items
-        self.table = [['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid']]
+        self.taxRules = taxRules if taxRules is not None else TaxRuleTable.default()
+        self.itemDictionary = itemDictionary
+        self.priceParser = priceParser if priceParser is not None else PriceParser()
+        self.headers = ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid']
 
     def createTable(self, formatType):
-        itemPriceDetails = list(map(self.computePriceDetails, self.items))
+        return self.fillTable(self.createEmptyTable(formatType), formatType)
+
+    def createRowTable(self, formatType):
+        return self.fillTable(RowCostTable(self.headers, formatType), formatType)
+
+    def fillTable(self, costTable, formatType):
+        itemPriceDetails = map(self.computePriceDetails, self.iterItems())
         if formatType == 'raw':
-            self.table.extend(itemPriceDetails)
+            costTable.extend(itemPriceDetails)
         elif formatType == 'formatted':
-            formattedItemPriceDetails = self.standardize(itemPriceDetails)
-            self.table.extend(formattedItemPriceDetails)
-        return self.table
+            costTable.extend(map(self.roundToCents, itemPriceDetails))
+        return costTable
+
+    def createEmptyTable(self, formatType):
+        if self.itemDictionary is not None:
+            return InternedCostTable(self.headers, formatType, self.itemDictionary)
+        return CostTable(self.headers, formatType)
+
+    def iterItems(self):
+        pricedItems = self.priceParser.parsePairs(self.items)
+        if self.itemDictionary is None:
+            return pricedItems
+        return self.canonicalizeNames(pricedItems)
+
+    def canonicalizeNames(self, pricedItems):
+        canonicalName = self.itemDictionary.canonicalName
+        for item in pricedItems:
+            item[0] = canonicalName(item[0])
+            yield item
+
+    def iterTable(self, formatType):
+        yield self.headers
+        if self.itemDictionary is not None:
+            yield from self.iterIdentifiedRows(formatType)
+            return
+        itemPriceDetails = map(self.computePriceDetails, self.iterItems())
+        if formatType == 'raw':
+            yield from itemPriceDetails
+        elif formatType == 'formatted':
+            yield from map(self.roundToCents, itemPriceDetails)
+
+    def iterIdentifiedRows(self, formatType):
+        if formatType not in ('raw', 'formatted'):
+            return
+        idFor, nameFor = self.itemDictionary.idFor, self.itemDictionary.nameFor
+        for item in self.priceParser.parsePairs(self.items):
+            itemId = idFor(item[0])
+            item[0] = nameFor(itemId)
+            row = self.computePriceDetails(item)
+            if formatType == 'formatted':
+                row = self.roundToCents(row)
+            yield IdentifiedRow(row, itemId)
 
     def computePriceDetails(self, item):
-        try:
-            basePriceNumber = int(item[1])
-            taxMultiplier = 1.13
-            priceAfterTax = basePriceNumber * taxMultiplier
-            taxesPaid = priceAfterTax - basePriceNumber
-            return [item[0], basePriceNumber, priceAfterTax, taxesPaid]
-        except ValueError:
-            basePriceNumber = float(item[1])
-            taxMultiplier = 1.13
-            priceAfterTax = basePriceNumber * taxMultiplier
-            taxesPaid = priceAfterTax - basePriceNumber
-            return [item[0], basePriceNumber, priceAfterTax, taxesPaid]
-
-    def standardize(self, priceDetails):
-        def standardizePrice(item):
-            return [
-                item[0],
-                '${0:.2f}'.format(item[1]),
-                '${0:.2f}'.format(item[2]),
-                '${0:.2f}'.format(item[3])
-            ]
-        return list(map(standardizePrice, priceDetails))
+        basePriceNumber = item[1]
+        taxMultiplier = self.taxRules.multiplierFor(item[0])
+        priceAfterTax = basePriceNumber * taxMultiplier
+        taxesPaid = priceAfterTax - basePriceNumber
+        return [item[0], basePriceNumber, priceAfterTax, taxesPaid]
+
+    def roundToCents(self, item):
+        return [item[0], round(item[1], 2), round(item[2], 2), round(item[3], 2)]
+
+
+class ColumnarCostTableBuilder:
+    def __init__(self, items, taxRules=None, priceParser=None):
+        self.items = items
+        self.taxRules = taxRules if taxRules is not None else TaxRuleTable.default()
+        self.priceParser = priceParser if priceParser is not None else PriceParser()
+        self.headers = ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid']
+
+    def splitNamesAndPrices(self, items):
+        names = []
+        prices = []
+        for item in self.priceParser.parsePairs(items, self.priceParser.normalize):
+            names.append(item[0])
+            prices.append(item[1])
+        return names, prices
+
+
+class NumpyCostTableBuilder(ColumnarCostTableBuilder):
+    def __init__(self, items, taxRules=None, priceParser=None):
+        if find_spec('numpy') is None:
+            raise ImportError("The numpy backend requires numpy to be installed")
+        super().__init__(items, taxRules, priceParser)
+
+    def createTable(self, formatType):
+        names, prices = self.splitNamesAndPrices(self.items)
+        priceColumns = self.computePriceColumns(self.parsePrices(prices), names)
+        if formatType == 'formatted':
+            priceColumns = list(map(self.roundToCents, priceColumns))
+        return NumpyCostTable(self.headers, formatType, names, priceColumns)
+
+    def parsePrices(self, prices):
+        import numpy
+        return numpy.array(prices, dtype=numpy.str_).astype(numpy.float64)
+
+    def computePriceColumns(self, basePrices, names):
+        import numpy
+        taxMultipliers = numpy.array(self.taxRules.multipliersFor(names), dtype=numpy.float64)
+        pricesAfterTax = basePrices * taxMultipliers
+        taxesPaid = pricesAfterTax - basePrices
+        return [basePrices, pricesAfterTax, taxesPaid]
+
+    def roundToCents(self, column):
+        import numpy
+        roundedColumn = numpy.round(column, 2)
+        scaledColumn = column * 100
+        distanceFromHalfCent = numpy.abs(scaledColumn - numpy.floor(scaledColumn) - 0.5)
+        for index in numpy.flatnonzero(distanceFromHalfCent < 1e-6):
+            roundedColumn[index] = round(float(column[index]), 2)
+        return roundedColumn
+
+
+class MoneyEngineCostTableBuilder(ColumnarCostTableBuilder):
+    def __init__(self, items, moneyEngine, taxRules=None, priceParser=None):
+        super().__init__(items, taxRules, priceParser)
+        self.moneyEngine = moneyEngine
+
+    def createTable(self, formatType):
+        names, prices = self.splitNamesAndPrices(self.items)
+        basePrices = self.moneyEngine.parsePrices(prices)
+        taxRates = self.taxRules.ratesFor(names)
+        priceColumns = self.moneyEngine.computePriceColumns(basePrices, taxRates)
+        return MoneyEngineCostTable(self.headers, formatType, names, priceColumns, self.moneyEngine)
+
+
+class CostTable:
+    __slots__ = ('headers', 'formatType', 'names', 'columns')
+
+    def __init__(self, headers, formatType, names=None, columns=None):
+        self.headers = headers
+        self.formatType = formatType
+        self.names = names if names is not None else []
+        self.columns = columns if columns is not None else [array('d') for _ in headers[1:]]
+
+    def append(self, row):
+        self.names.append(self.storeName(row[0]))
+        for column, price in zip(self.columns, row[1:]):
+            column.append(price)
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def concatenate(self, costTables):
+        names = []
+        for costTable in costTables:
+            names.extend(costTable.names)
+        columns = [
+            self.joinColumns([costTable.columns[index] for costTable in costTables])
+            for index in range(len(self.columns))
+        ]
+        return self.withRows(names, columns)
+
+    def withRows(self, names, columns):
+        return type(self)(self.headers, self.formatType, names, columns)
+
+    def joinColumns(self, columns):
+        joinedColumn = array(columns[0].typecode)
+        for column in columns:
+            joinedColumn.extend(column)
+        return joinedColumn
+
+    def __len__(self):
+        return len(self.names) + 1
+
+    def __iter__(self):
+        yield self.headers
+        rows = zip(self.iterNames(), *map(self.iterColumn, self.columns))
+        yield from map(list, rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Cost table index out of range")
+        if index == 0:
+            return self.headers
+        rowIndex = index - 1
+        return [self.nameAt(rowIndex)] + [self.columnValue(column, rowIndex) for column in self.columns]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def storeName(self, name):
+        return name
+
+    def iterNames(self):
+        return iter(self.names)
+
+    def nameAt(self, rowIndex):
+        return self.names[rowIndex]
+
+    def iterColumn(self, column):
+        return iter(column)
+
+    def columnValue(self, column, rowIndex):
+        return float(column[rowIndex])
+
+    def columnTotals(self):
+        return list(map(self.sequentialColumnTotal, self.columns))
+
+    def sequentialColumnTotal(self, column):
+        total = 0.0
+        for price in column:
+            total += price
+        return total
+
+
+class InternedCostTable(CostTable):
+    __slots__ = ('itemDictionary',)
+
+    def __init__(self, headers, formatType, itemDictionary, names=None, columns=None):
+        super().__init__(headers, formatType, names if names is not None else array('l'), columns)
+        self.itemDictionary = itemDictionary
+
+    def withRows(self, names, columns):
+        return type(self)(self.headers, self.formatType, self.itemDictionary, array('l', names), columns)
+
+    def storeName(self, name):
+        return self.itemDictionary.idFor(name)
+
+    def iterNames(self):
+        return map(self.itemDictionary.nameFor, self.names)
+
+    def nameAt(self, rowIndex):
+        return self.itemDictionary.nameFor(self.names[rowIndex])
+
+    def iterIdentifiedRows(self):
+        return zip(self.names, *map(self.iterColumn, self.columns))
+
+
+class RowCostTable(CostTable):
+    __slots__ = ()
+
+    def __init__(self, headers, formatType, names=None, columns=None):
+        super().__init__(headers, formatType, names, columns if columns is not None else [[] for _ in headers[1:]])
+
+    def joinColumns(self, columns):
+        joinedColumn = []
+        for column in columns:
+            joinedColumn.extend(column)
+        return joinedColumn
+
+    def columnValue(self, column, rowIndex):
+        return column[rowIndex]
+
+
+class NumpyCostTable(CostTable):
+    __slots__ = ()
+
+    def joinColumns(self, columns):
+        import numpy
+        return numpy.concatenate(columns)
+
+    def iterColumn(self, column):
+        return map(float, column)
+
+    def sequentialColumnTotal(self, column):
+        import numpy
+        if len(column) == 0:
+            return 0.0
+        return float(numpy.cumsum(column)[-1])
+
+
+class MoneyEngineCostTable(CostTable):
+    __slots__ = ('moneyEngine',)
+
+    def __init__(self, headers, formatType, names, columns, moneyEngine):
+        super().__init__(headers, formatType, names, columns)
+        self.moneyEngine = moneyEngine
+
+    def withRows(self, names, columns):
+        return type(self)(self.headers, self.formatType, names, columns, self.moneyEngine)
+
+    def joinColumns(self, columns):
+        return self.moneyEngine.joinColumns(columns)
+
+    def iterColumn(self, column):
+        return self.moneyEngine.iterAmounts(column)
+
+    def columnValue(self, column, rowIndex):
+        return self.moneyEngine.amountAt(column, rowIndex)
+
+    def sequentialColumnTotal(self, column):
+        return self.moneyEngine.total(column)
+
+
+class BudgetInfo:
+    def __init__(self, costTable, costSummary, formatType, plainColumnCount=1):
+        self.costTable = costTable
+        self.costSummary = costSummary
+        self.formatType = formatType
+        self.plainColumnCount = plainColumnCount
+
+    def __len__(self):
+        return len(self.costTable) + len(self.costSummary)
+
+    def __iter__(self):
+        yield from self.costTable
+        yield from self.costSummary
+
+    def __getitem__(self, index):
+        if not self.isIndexable():
+            raise TypeError("Streamed budget info can only be iterated, not indexed")
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Budget info index out of range")
+        tableLength = len(self.costTable)
+        if index < tableLength:
+            return self.costTable[index]
+        return self.costSummary[index - tableLength]
+
+    def isIndexable(self):
+        return all(hasattr(part, '__getitem__') and hasattr(part, '__len__') for part in (self.costTable, self.costSummary))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
 
 
 class CostSummary:
@@ -74,13 +399,19 @@ class CostSummary:
         raise ValueError("Unsupported summary type")
 
     def typeOfCostTable(self):
+        if isinstance(self.costTable, CostTable):
+            return self.costTable.formatType
         return TypeOfTable(self.costTable).getTableType()
 
     def createRawCostSummary(self):
+        if isinstance(self.costTable, CostTable):
+            return ColumnarCostSummaryRaw(self.costTable).get()
         return CostSummaryRaw(self.costTable).get()
 
     def createFormattedCostSummary(self):
         valueStandardizer = ValueStandardizer()
+        if isinstance(self.costTable, CostTable):
+            return ColumnarCostSummaryFormatted(self.costTable, valueStandardizer).get()
         return CostSummaryFormatted(self.costTable, valueStandardizer).get()
 
 
@@ -151,6 +482,16 @@ class CostSummaryRaw(CostSummaryInterface):
         return [summaryHeaders, summaryData]
 
 
+class ColumnarCostSummaryRaw(CostSummaryRaw):
+    def __init__(self, costTable):
+        self.costTable = costTable
+        self.headers = costTable.headers
+        self.items = costTable.names
+
+    def createSummaryFromTable(self, items, headers):
+        return self.costTable.columnTotals()
+
+
 class ValueStandardizer:
     def standardize(self, itemCount, totals):
         standardizedCount = self.standardizeCount(itemCount)
@@ -158,12 +499,12 @@ class ValueStandardizer:
         return [ standardizedCount ] + standardizedTotals
 
     def standardizeCount(self, itemCount):
-        return str(itemCount)
+        return itemCount
 
     def standardizeTotals(self, totals):
         standardized = []
         for total in totals:
-            standardized.append("${:.2f}".format(total))
+            standardized.append(round(total, 2))
         return standardized
 
 
@@ -182,7 +523,52 @@ class CostSummaryFormatted(CostSummaryInterface):
         totals = [0.0] * (len(headers) - 1)
         for row in items:
             for i in range(1, len(row)):
-                plainDollarValue = row[i].replace('$', '')
-                dollarValue = float(plainDollarValue)
-                totals[i-1] += dollarValue
+                totals[i-1] += self.getDollarValue(row[i])
         return totals
+
+    def getDollarValue(self, cell):
+        if isinstance(cell, str):
+            return float(cell.replace('$', ''))
+        return cell
+
+
+class ColumnarCostSummaryFormatted(CostSummaryFormatted):
+    def __init__(self, costTable, valueStandardizer):
+        self.costTable = costTable
+        self.headers = costTable.headers
+        self.items = costTable.names
+        self.valueStandardizer = valueStandardizer
+
+    def createSummaryFromTable(self, items, headers):
+        return self.costTable.columnTotals()
+
+
+class CostSummaryStream(CostSummaryInterface):
+    def __init__(self, valueStandardizer, numberOfItems=0, totals=None):
+        self.valueStandardizer = valueStandardizer
+        self.headers = []
+        self.numberOfItems = numberOfItems
+        self.totals = totals or []
+
+    def passThrough(self, costTableRows):
+        costTableRows = iter(costTableRows)
+        self.headers = next(costTableRows)
+        yield self.headers
+        yield from self.createSummaryFromTable(costTableRows, self.headers)
+
+    def iterSummary(self):
+        yield from self.get()
+
+    def get(self):
+        summaryHeaders = self.transformHeaders(self.headers)
+        summaryValues = self.valueStandardizer.standardize(self.numberOfItems, self.totals)
+        return [summaryHeaders, summaryValues]
+
+    def createSummaryFromTable(self, items, headers):
+        if not self.totals:
+            self.totals = [0.0] * (len(headers) - 1)
+        for row in items:
+            self.numberOfItems += 1
+            for i in range(1, len(row)):
+                self.totals[i-1] += row[i]
+            yield row
@@ -0,0 +1,42 @@
+import csv
+from datetime import date
+from typing import NamedTuple
+
+
+class DatedEntry(NamedTuple):
+    isoDate: str
+    item: str
+    price: str
+
+
+class DatedLedger:
+    headerRow = ['date', 'item', 'price']
+
+    def __init__(self, filePath):
+        self.filePath = filePath
+
+    def groupByDate(self):
+        entriesByDate = {}
+        for entry in self.iterEntries():
+            entriesByDate.setdefault(entry.isoDate, []).append([entry.item, entry.price])
+        return dict(sorted(entriesByDate.items()))
+
+    def iterEntries(self):
+        with open(self.filePath, 'r', encoding='utf-8', newline='') as file:
+            for lineNumber, row in enumerate(csv.reader(file), start=1):
+                row = [field.strip() for field in row]
+                if not any(row):
+                    continue
+                if lineNumber == 1 and [field.lower() for field in row] == self.headerRow:
+                    continue
+                yield self.parseRow(lineNumber, row)
+
+    def parseRow(self, lineNumber, row):
+        if len(row) != 3:
+            raise ValueError(f"Expected date, item and price on line {lineNumber}")
+        dateValue, item, price = row
+        try:
+            isoDate = date.fromisoformat(dateValue).isoformat()
+        except ValueError:
+            raise ValueError(f"Invalid date '{dateValue}' on line {lineNumber}")
+        return DatedEntry(isoDate, item, price)
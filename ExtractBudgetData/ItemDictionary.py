@@ -0,0 +1,95 @@
+import json
+import os
+import sys
+from array import array
+
+from ExtractBudgetData.ItemNames import collapseWhitespace, normalizeItemName
+
+
+class IdentifiedRow(list):
+    __slots__ = ('itemId',)
+
+    def __init__(self, row, itemId):
+        super().__init__(row)
+        self.itemId = itemId
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class ItemDictionary:
+    spellingCacheLimit = 65536
+
+    def __init__(self, names=()):
+        self.names = []
+        self.idsByKey = {}
+        self.idsBySpelling = {}
+        for name in names:
+            self.idFor(name)
+        self.isModified = False
+
+    def idFor(self, name) -> int:
+        itemId = self.idsBySpelling.get(name)
+        if itemId is None:
+            itemId = self.lookUp(name)
+            if len(self.idsBySpelling) >= self.spellingCacheLimit:
+                self.idsBySpelling.clear()
+            self.idsBySpelling[name] = itemId
+        return itemId
+
+    def lookUp(self, name) -> int:
+        key = normalizeItemName(name)
+        itemId = self.idsByKey.get(key)
+        if itemId is None:
+            itemId = self.idsByKey[key] = len(self.names)
+            self.names.append(sys.intern(collapseWhitespace(name)))
+            self.isModified = True
+        return itemId
+
+    def idsFor(self, names) -> array:
+        return array('l', map(self.idFor, names))
+
+    def nameFor(self, itemId) -> str:
+        return self.names[itemId]
+
+    def canonicalName(self, name) -> str:
+        return self.names[self.idFor(name)]
+
+    def spellingFor(self, name) -> str:
+        itemId = self.idsBySpelling.get(name)
+        if itemId is None:
+            itemId = self.idsByKey.get(normalizeItemName(name))
+        if itemId is None:
+            return collapseWhitespace(name)
+        return self.names[itemId]
+
+    def identify(self, row) -> IdentifiedRow:
+        itemId = self.idFor(row[0])
+        row[0] = self.names[itemId]
+        return IdentifiedRow(row, itemId)
+
+    def __len__(self):
+        return len(self.names)
+
+
+class ItemDictionaryStore:
+    def __init__(self, statePath):
+        self.statePath = statePath
+
+    def load(self) -> ItemDictionary:
+        try:
+            with open(self.statePath, 'r', encoding='utf-8') as file:
+                return ItemDictionary(json.load(file)['names'])
+        except FileNotFoundError:
+            return ItemDictionary()
+        except (ValueError, TypeError, KeyError, AttributeError) as error:
+            raise ValueError(f"The item dictionary {self.statePath} could not be read: {error!r}")
+
+    def save(self, itemDictionary):
+        if not itemDictionary.isModified:
+            return
+        temporaryPath = f'{self.statePath}.tmp'
+        with open(temporaryPath, 'w', encoding='utf-8') as file:
+            json.dump({'names': itemDictionary.names}, file, ensure_ascii=False)
+        os.replace(temporaryPath, self.statePath)
+        itemDictionary.isModified = False
@@ -0,0 +1,9 @@
+import unicodedata
+
+
+def collapseWhitespace(name) -> str:
+    return ' '.join(unicodedata.normalize('NFKC', name).split())
+
+
+def normalizeItemName(name) -> str:
+    return collapseWhitespace(name).casefold()
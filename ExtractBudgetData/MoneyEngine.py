@@ -0,0 +1,139 @@
+import math
+from abc import ABC, abstractmethod
+from decimal import Decimal, ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP
+from importlib.util import find_spec
+
+
+class MoneyEngineInterface(ABC):
+    supportedRoundingPolicies = (ROUND_HALF_UP, ROUND_HALF_EVEN, ROUND_HALF_DOWN)
+
+    def __init__(self, roundingPolicy=ROUND_HALF_UP):
+        if roundingPolicy not in self.supportedRoundingPolicies:
+            raise ValueError(f"Unsupported rounding policy: {roundingPolicy}")
+        self.roundingPolicy = roundingPolicy
+
+    @abstractmethod
+    def parsePrices(self, prices):
+        raise NotImplementedError(
+            "This method must be used by concrete implementations"
+        )
+
+    @abstractmethod
+    def computePriceColumns(self, basePrices, taxRates):
+        raise NotImplementedError(
+            "This method must be used by concrete implementations"
+        )
+
+    @abstractmethod
+    def iterAmounts(self, column):
+        raise NotImplementedError(
+            "This method must be used by concrete implementations"
+        )
+
+    @abstractmethod
+    def amountAt(self, column, index):
+        raise NotImplementedError(
+            "This method must be used by concrete implementations"
+        )
+
+    @abstractmethod
+    def total(self, column):
+        raise NotImplementedError(
+            "This method must be used by concrete implementations"
+        )
+
+    @abstractmethod
+    def joinColumns(self, columns):
+        raise NotImplementedError(
+            "This method must be used by concrete implementations"
+        )
+
+    def roundToCents(self, amount):
+        return amount.quantize(Decimal('0.01'), rounding=self.roundingPolicy)
+
+
+class CentsMoneyEngine(MoneyEngineInterface):
+    def __init__(self, roundingPolicy=ROUND_HALF_UP):
+        if find_spec('numpy') is None:
+            raise ImportError("The integer cents money engine requires numpy to be installed")
+        super().__init__(roundingPolicy)
+
+    def parsePrices(self, prices):
+        import numpy
+        dollars = numpy.array(prices, dtype=numpy.str_).astype(numpy.float64)
+        scaledDollars = dollars * 100
+        cents = numpy.rint(scaledDollars).astype(numpy.int64)
+        distanceFromHalfCent = numpy.abs(scaledDollars - numpy.floor(scaledDollars) - 0.5)
+        for index in numpy.flatnonzero(distanceFromHalfCent < 1e-6):
+            cents[index] = int(self.roundToCents(Decimal(prices[index].strip())) * 100)
+        return cents
+
+    def computePriceColumns(self, basePrices, taxRates):
+        numerators, denominator = self.getTaxMultiplierRatios(taxRates)
+        pricesAfterTax = self.divideAndRound(basePrices * numerators, denominator)
+        taxesPaid = pricesAfterTax - basePrices
+        return [basePrices, pricesAfterTax, taxesPaid]
+
+    def getTaxMultiplierRatios(self, taxRates):
+        import numpy
+        ratiosByRate = {rate: (1 + rate).as_integer_ratio() for rate in set(taxRates)}
+        denominator = math.lcm(*(ratio[1] for ratio in ratiosByRate.values()))
+        numeratorsByRate = {
+            rate: numerator * (denominator // rateDenominator)
+            for rate, (numerator, rateDenominator) in ratiosByRate.items()
+        }
+        numerators = numpy.array([numeratorsByRate[rate] for rate in taxRates], dtype=numpy.int64)
+        return numerators, denominator
+
+    def divideAndRound(self, dividends, divisor):
+        import numpy
+        signs = numpy.sign(dividends)
+        quotients, remainders = numpy.divmod(numpy.abs(dividends), divisor)
+        doubledRemainders = remainders * 2
+        if self.roundingPolicy == ROUND_HALF_UP:
+            roundAwayFromZero = doubledRemainders >= divisor
+        elif self.roundingPolicy == ROUND_HALF_EVEN:
+            roundAwayFromZero = (doubledRemainders > divisor) | ((doubledRemainders == divisor) & (quotients % 2 == 1))
+        else:
+            roundAwayFromZero = doubledRemainders > divisor
+        return signs * (quotients + roundAwayFromZero)
+
+    def iterAmounts(self, column):
+        return (cents / 100 for cents in column.tolist())
+
+    def amountAt(self, column, index):
+        return int(column[index]) / 100
+
+    def total(self, column):
+        return int(column.sum()) / 100
+
+    def joinColumns(self, columns):
+        import numpy
+        return numpy.concatenate(columns)
+
+
+class DecimalMoneyEngine(MoneyEngineInterface):
+    def parsePrices(self, prices):
+        return [self.roundToCents(Decimal(price.strip())) for price in prices]
+
+    def computePriceColumns(self, basePrices, taxRates):
+        pricesAfterTax = [
+            self.roundToCents(price * (1 + taxRate)) for price, taxRate in zip(basePrices, taxRates)
+        ]
+        taxesPaid = [afterTax - price for price, afterTax in zip(basePrices, pricesAfterTax)]
+        return [basePrices, pricesAfterTax, taxesPaid]
+
+    def iterAmounts(self, column):
+        return iter(column)
+
+    def amountAt(self, column, index):
+        return column[index]
+
+    def total(self, column):
+        return sum(column, Decimal('0.00'))
+
+    def joinColumns(self, columns):
+        joinedColumn = []
+        for column in columns:
+            joinedColumn.extend(column)
+        return joinedColumn
@@ -0,0 +1,111 @@
+import csv
+import os
+import re
+from typing import NamedTuple
+
+
+class RejectedPrice(NamedTuple):
+    entryNumber: int
+    item: str
+    price: str
+    reason: str
+    lineNumber: int | None = None
+
+
+class PriceParser:
+    parsedCacheLimit = 65536
+    pricePattern = re.compile(
+        r'\s*(?:'
+        r'(?P<integer>[+-]?\d+)'
+        r'|(?P<decimal>[+-]?(?:\d+\.\d*|\.\d+))'
+        r'|(?P<formatted>(?P<sign>[+-]?)(?P<prefix>[$€£¥]?)\s*'
+        r'(?P<digits>\d{1,3}(?:,\d{3})+|\d+)(?P<fraction>\.\d*)?\s*(?P<suffix>[$€£¥]?))'
+        r')\s*'
+    )
+    decimalCommaPattern = re.compile(r'\s*[+-]?[$€£¥]?\s*\d+,\d{1,2}\s*[$€£¥]?\s*')
+
+    def __init__(self):
+        self.rejects = []
+        self.parsedPrices = {}
+
+    def parse(self, price):
+        parsedPrice = self.parsedPrices.get(price)
+        if parsedPrice is None:
+            parsedPrice = self.classify(price)
+            if parsedPrice is not None:
+                if len(self.parsedPrices) >= self.parsedCacheLimit:
+                    self.parsedPrices.clear()
+                self.parsedPrices[price] = parsedPrice
+        return parsedPrice
+
+    def classify(self, price):
+        match = self.pricePattern.fullmatch(price)
+        if match is None:
+            return None
+        kind = match.lastgroup
+        if kind == 'integer':
+            return int(price)
+        if kind == 'decimal':
+            return float(price)
+        number = self.cleanFormatted(match)
+        if number is None:
+            return None
+        return float(number) if match['fraction'] is not None else int(number)
+
+    def normalize(self, price):
+        match = self.pricePattern.fullmatch(price)
+        if match is None:
+            return None
+        if match.lastgroup != 'formatted':
+            return price
+        return self.cleanFormatted(match)
+
+    def cleanFormatted(self, match):
+        if match['prefix'] and match['suffix']:
+            return None
+        return f"{match['sign']}{match['digits'].replace(',', '')}{match['fraction'] or ''}"
+
+    def parsePairs(self, pairs, parse=None):
+        parse = parse or self.parse
+        for entryNumber, pair in enumerate(pairs, 1):
+            price = parse(pair[1])
+            if price is None:
+                self.reject(entryNumber, pair)
+            else:
+                yield [pair[0], price]
+
+    def reject(self, entryNumber, pair):
+        self.rejects.append(RejectedPrice(entryNumber, pair[0], pair[1], self.explain(pair[1])))
+
+    def explain(self, price):
+        if self.decimalCommaPattern.fullmatch(price):
+            return 'decimal comma'
+        if any(symbol in price for symbol in '$€£¥') and self.pricePattern.fullmatch(price):
+            return 'currency symbol on both sides'
+        return 'not a price'
+
+
+class RejectReport:
+    headers = ['Line', 'Item', 'Price', 'Reason']
+
+    def __init__(self, reportPath):
+        self.reportPath = reportPath
+
+    def write(self, rejects, append=False):
+        if not rejects:
+            if not append:
+                self.clear()
+            return
+        appendsRows = append and os.path.exists(self.reportPath)
+        with open(self.reportPath, 'a' if appendsRows else 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            if not appendsRows:
+                writer.writerow(self.headers)
+            for rejectedPrice in rejects:
+                writer.writerow([rejectedPrice.lineNumber, rejectedPrice.item, rejectedPrice.price, rejectedPrice.reason])
+
+    def clear(self):
+        try:
+            os.remove(self.reportPath)
+        except FileNotFoundError:
+            pass
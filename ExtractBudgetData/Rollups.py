@@ -0,0 +1,99 @@
+import calendar
+from typing import NamedTuple
+
+summaryHeaders = ['Period', 'Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid']
+
+
+class RollupPeriod(NamedTuple):
+    granularity: str
+    period: str
+    parentPeriod: str | None
+
+
+def getRollupPeriods(isoDate, weekOfMonth) -> list[RollupPeriod]:
+    year = isoDate[:4]
+    month = isoDate[:7]
+    week = f'{month}-W{weekOfMonth}'
+    return [
+        RollupPeriod('day', isoDate, week),
+        RollupPeriod('week', week, month),
+        RollupPeriod('month', month, year),
+        RollupPeriod('year', year, None),
+    ]
+
+
+class Rollups:
+    schema = '''
+        CREATE TABLE IF NOT EXISTS rollupTotals (
+            granularity TEXT NOT NULL,
+            period TEXT NOT NULL,
+            parentPeriod TEXT,
+            numberOfItems INTEGER NOT NULL,
+            grossPrice REAL NOT NULL,
+            priceAfterTax REAL NOT NULL,
+            taxesPaid REAL NOT NULL,
+            PRIMARY KEY (granularity, period)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS rollupTotalsByParent ON rollupTotals (granularity, parentPeriod, period);
+    '''
+
+    def __init__(self, sqliteLedger):
+        self.sqliteLedger = sqliteLedger
+
+    def refresh(self, isoDate, weekOfMonth):
+        connection = self.sqliteLedger.connect()
+        rollupPeriods = getRollupPeriods(isoDate, weekOfMonth)
+        connection.execute(
+            'INSERT OR REPLACE INTO rollupTotals '
+            "SELECT 'day', isoDate, ?, numberOfItems, grossPrice, priceAfterTax, taxesPaid "
+            'FROM dailyTotals WHERE isoDate = ?',
+            (rollupPeriods[0].parentPeriod, isoDate)
+        )
+        for childPeriod, rollupPeriod in zip(rollupPeriods, rollupPeriods[1:]):
+            connection.execute(
+                'INSERT OR REPLACE INTO rollupTotals '
+                'SELECT ?, ?, ?, COALESCE(SUM(numberOfItems), 0), '
+                'COALESCE(SUM(grossPrice), 0), COALESCE(SUM(priceAfterTax), 0), COALESCE(SUM(taxesPaid), 0) '
+                'FROM rollupTotals WHERE granularity = ? AND parentPeriod = ?',
+                (*rollupPeriod, childPeriod.granularity, rollupPeriod.period)
+            )
+
+    def totals(self, granularity, period):
+        return self.sqliteLedger.fetchTotals(
+            'SELECT COALESCE(SUM(numberOfItems), 0), SUM(grossPrice), SUM(priceAfterTax), SUM(taxesPaid) '
+            'FROM rollupTotals WHERE granularity = ? AND period = ?',
+            (granularity, period)
+        )
+
+    def children(self, granularity, parentPeriod) -> dict:
+        rows = self.sqliteLedger.connect().execute(
+            'SELECT period, numberOfItems, grossPrice, priceAfterTax, taxesPaid '
+            'FROM rollupTotals WHERE granularity = ? AND parentPeriod = ? ORDER BY period',
+            (granularity, parentPeriod)
+        )
+        return {row[0]: self.sqliteLedger.createTotals(row[1:]) for row in rows}
+
+    def weekSummary(self, isoDate, weekOfMonth) -> list[list]:
+        _, week, _, _ = getRollupPeriods(isoDate, weekOfMonth)
+        summaryRows = [summaryHeaders]
+        for day, dayTotals in self.children('day', week.period).items():
+            summaryRows.append([day, *dayTotals])
+        summaryRows.append([f'Week {weekOfMonth}', *self.totals('week', week.period)])
+        return summaryRows
+
+    def monthSummary(self, isoDate) -> list[list]:
+        _, _, month, year = getRollupPeriods(isoDate, None)
+        summaryRows = [summaryHeaders]
+        for week, weekTotals in self.children('week', month.period).items():
+            summaryRows.append([f"Week {week.rsplit('-W', 1)[1]}", *weekTotals])
+        monthName = calendar.month_name[int(isoDate[5:7])]
+        summaryRows.append([f'{monthName} {year.period}', *self.totals('month', month.period)])
+        summaryRows.append([f'{year.period} Through {monthName}', *self.yearThroughMonth(month)])
+        return summaryRows
+
+    def yearThroughMonth(self, month):
+        return self.sqliteLedger.fetchTotals(
+            'SELECT COALESCE(SUM(numberOfItems), 0), SUM(grossPrice), SUM(priceAfterTax), SUM(taxesPaid) '
+            "FROM rollupTotals WHERE granularity = 'month' AND parentPeriod = ? AND period <= ?",
+            (month.parentPeriod, month.period)
+        )
@@ -0,0 +1,180 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from ExtractBudgetData.Cost import BudgetInfo, Cost
+from ExtractBudgetData.PriceParser import PriceParser
+from ExtractBudgetData.TextFile import TextFile, TextFileMappedReader
+
+
+class ShardResult(NamedTuple):
+    startsOnPrice: bool
+    tokenCount: int
+    leadingPrice: str | None
+    costTable: object
+    trailingItem: str | None
+    rejects: list
+
+
+class ShardedCost:
+    def __init__(self, filePath, maxWorkers=None, backend='python', moneyEngine=None, taxRules=None, itemDictionary=None, keepsNumberTypes=False):
+        if keepsNumberTypes and (backend != 'python' or moneyEngine is not None):
+            raise ValueError("Only the python backend keeps the parsed number types of the prices")
+        self.filePath = filePath
+        self.maxWorkers = maxWorkers or os.cpu_count() or 1
+        costOptions = {'backend': backend, 'moneyEngine': moneyEngine, 'taxRules': taxRules}
+        self.pairCoster = PairCoster(costOptions, itemDictionary, keepsNumberTypes)
+        self.unpairedItem = None
+        self.rejects = []
+
+    def getBudgetInfo(self, formatType):
+        priceTable = self.createPriceTable(formatType)
+        priceSummary = Cost([]).createPriceSummary(priceTable)
+        return BudgetInfo(priceTable, priceSummary, formatType)
+
+    def createPriceTable(self, formatType):
+        dialect = TextFile(self.filePath).getDialect()
+        if dialect.fileType == 'unknown':
+            raise ValueError("Unsupported file type")
+        byteRanges = FileSharder(self.filePath, dialect).getByteRanges(self.maxWorkers)
+        shardResults = self.costShards(byteRanges, dialect, formatType)
+        shardMerger = ShardMerger(self.pairCoster, formatType)
+        priceTable = shardMerger.merge(shardResults)
+        self.unpairedItem = shardMerger.unpairedItem
+        self.rejects = shardMerger.rejects
+        return priceTable
+
+    def costShards(self, byteRanges, dialect, formatType):
+        shardWorker = ShardWorker(self.filePath, dialect, formatType, self.pairCoster)
+        with ProcessPoolExecutor(max_workers=min(self.maxWorkers, len(byteRanges))) as executor:
+            shardResults = list(executor.map(shardWorker.costShard, byteRanges, self.getFirstShardParity(byteRanges)))
+            mispredictedShards = self.findMispredictedShards(shardResults)
+            recostedResults = executor.map(
+                shardWorker.costShard,
+                [byteRanges[index] for index, _ in mispredictedShards],
+                [startsOnPrice for _, startsOnPrice in mispredictedShards],
+            )
+            for (index, _), shardResult in zip(mispredictedShards, recostedResults):
+                shardResults[index] = shardResult
+        return shardResults
+
+    def getFirstShardParity(self, byteRanges):
+        return [False] + [None] * (len(byteRanges) - 1)
+
+    def findMispredictedShards(self, shardResults):
+        mispredictedShards = []
+        tokensBeforeShard = 0
+        for index, shardResult in enumerate(shardResults):
+            startsOnPrice = tokensBeforeShard % 2 == 1
+            if shardResult.startsOnPrice != startsOnPrice:
+                mispredictedShards.append((index, startsOnPrice))
+            tokensBeforeShard += shardResult.tokenCount
+        return mispredictedShards
+
+
+class FileSharder:
+    minimumShardSize = 1024 * 1024
+    scanSize = 64 * 1024
+
+    def __init__(self, filePath, dialect):
+        self.filePath = filePath
+        self.delimiter = dialect.delimiter.encode('utf-8')
+
+    def getByteRanges(self, numberOfShards):
+        fileSize = os.path.getsize(self.filePath)
+        numberOfShards = max(1, min(numberOfShards, fileSize // self.minimumShardSize))
+        boundaries = [0]
+        with open(self.filePath, 'rb') as file:
+            for shardNumber in range(1, numberOfShards):
+                targetOffset = max(fileSize * shardNumber // numberOfShards, boundaries[-1])
+                boundary = self.findNextBoundary(file, targetOffset, fileSize)
+                if boundaries[-1] < boundary < fileSize:
+                    boundaries.append(boundary)
+        boundaries.append(fileSize)
+        return list(zip(boundaries, boundaries[1:]))
+
+    def findNextBoundary(self, file, offset, fileSize):
+        file.seek(offset)
+        while offset < fileSize:
+            block = file.read(self.scanSize)
+            delimiterIndex = block.find(self.delimiter)
+            if delimiterIndex != -1:
+                return offset + delimiterIndex + 1
+            offset += len(block)
+        return fileSize
+
+
+class PairCoster:
+    def __init__(self, costOptions, itemDictionary=None, keepsNumberTypes=False):
+        self.costOptions = costOptions
+        self.itemDictionary = itemDictionary
+        self.keepsNumberTypes = keepsNumberTypes
+
+    def cost(self, pairs, formatType):
+        if self.itemDictionary is not None:
+            spellingFor = self.itemDictionary.spellingFor
+            pairs = [[spellingFor(pair[0]), pair[1]] for pair in pairs]
+        cost = Cost(pairs, **self.costOptions)
+        if self.keepsNumberTypes:
+            return cost.createRowTable(formatType), cost.priceParser.rejects
+        return cost.createPriceTable(formatType), cost.priceParser.rejects
+
+
+class ShardWorker:
+    def __init__(self, filePath, dialect, formatType, pairCoster):
+        self.filePath = filePath
+        self.dialect = dialect
+        self.formatType = formatType
+        self.pairCoster = pairCoster
+
+    def costShard(self, byteRange, startsOnPrice=None):
+        tokens = list(self.readTokens(byteRange))
+        tokenCount = len(tokens)
+        if startsOnPrice is None:
+            startsOnPrice = self.guessStartsOnPrice(tokens)
+        leadingPrice = None
+        if startsOnPrice and tokens:
+            leadingPrice = tokens.pop(0)
+        trailingItem = tokens.pop() if len(tokens) % 2 == 1 else None
+        pairs = [[tokens[i], tokens[i + 1]] for i in range(0, len(tokens), 2)]
+        costTable, rejects = self.pairCoster.cost(pairs, self.formatType)
+        return ShardResult(startsOnPrice, tokenCount, leadingPrice, costTable, trailingItem, rejects)
+
+    def guessStartsOnPrice(self, tokens):
+        if len(tokens) < 2:
+            return False
+        priceParser = PriceParser()
+        return priceParser.parse(tokens[0]) is not None and priceParser.parse(tokens[1]) is None
+
+    def readTokens(self, byteRange):
+        return TextFileMappedReader(self.filePath, self.dialect).iterTokens(byteRange)
+
+
+class ShardMerger:
+    def __init__(self, pairCoster, formatType):
+        self.pairCoster = pairCoster
+        self.formatType = formatType
+        self.unpairedItem = None
+        self.rejects = []
+
+    def merge(self, shardResults):
+        costTables = []
+        pairsBeforeShard = 0
+        for shardResult in shardResults:
+            if shardResult.leadingPrice is not None:
+                pairsBeforeShard += 1
+                costTables.append(self.costBoundaryPair(self.unpairedItem, shardResult.leadingPrice, pairsBeforeShard))
+                self.unpairedItem = None
+            costTables.append(shardResult.costTable)
+            for rejectedPrice in shardResult.rejects:
+                self.rejects.append(rejectedPrice._replace(entryNumber=pairsBeforeShard + rejectedPrice.entryNumber))
+            pairsBeforeShard += len(shardResult.costTable) - 1 + len(shardResult.rejects)
+            if shardResult.trailingItem is not None:
+                self.unpairedItem = shardResult.trailingItem
+        return costTables[0].concatenate(costTables)
+
+    def costBoundaryPair(self, item, price, entryNumber):
+        costTable, rejects = self.pairCoster.cost([[item, price]], self.formatType)
+        for rejectedPrice in rejects:
+            self.rejects.append(rejectedPrice._replace(entryNumber=entryNumber))
+        return costTable
@@ -0,0 +1,161 @@
+import os
+import sqlite3
+from typing import NamedTuple
+
+from ExtractBudgetData.Rollups import Rollups
+
+
+class LedgerTotals(NamedTuple):
+    numberOfItems: int
+    grossPrice: float
+    priceAfterTax: float
+    taxesPaid: float
+
+
+class SqliteLedger:
+    batchSize = 10000
+    busyTimeoutSeconds = 30
+    schema = '''
+        CREATE TABLE IF NOT EXISTS items (
+            isoDate TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            item TEXT NOT NULL,
+            category TEXT NOT NULL,
+            grossPrice REAL NOT NULL,
+            priceAfterTax REAL NOT NULL,
+            taxesPaid REAL NOT NULL,
+            PRIMARY KEY (isoDate, position)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS itemsByItem ON items (item COLLATE NOCASE, isoDate);
+        CREATE TABLE IF NOT EXISTS dailyTotals (
+            isoDate TEXT PRIMARY KEY,
+            numberOfItems INTEGER NOT NULL,
+            grossPrice REAL NOT NULL,
+            priceAfterTax REAL NOT NULL,
+            taxesPaid REAL NOT NULL
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS dailyCategoryTotals (
+            isoDate TEXT NOT NULL,
+            category TEXT NOT NULL,
+            numberOfItems INTEGER NOT NULL,
+            grossPrice REAL NOT NULL,
+            priceAfterTax REAL NOT NULL,
+            taxesPaid REAL NOT NULL,
+            PRIMARY KEY (isoDate, category)
+        ) WITHOUT ROWID;
+    ''' + Rollups.schema
+    stagingSchema = '''
+        CREATE TEMP TABLE IF NOT EXISTS stagedItems (
+            isoDate TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            item TEXT NOT NULL,
+            category TEXT NOT NULL,
+            grossPrice REAL NOT NULL,
+            priceAfterTax REAL NOT NULL,
+            taxesPaid REAL NOT NULL
+        );
+    '''
+
+    def __init__(self, databasePath):
+        self.databasePath = databasePath
+        self.connection = None
+        self.replacesDay = False
+
+    def connect(self):
+        if self.connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.databasePath)), exist_ok=True)
+            self.connection = sqlite3.connect(self.databasePath, timeout=self.busyTimeoutSeconds, isolation_level=None)
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+            self.connection.execute('PRAGMA temp_store=MEMORY')
+            self.connection.executescript(self.schema + self.stagingSchema)
+        return self.connection
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def holdsItemRows(self, isoDate, numberOfItems) -> bool:
+        storedItems, = self.connect().execute(
+            'SELECT COUNT(*) FROM items WHERE isoDate = ?', (isoDate,)
+        ).fetchone()
+        return storedItems == numberOfItems
+
+    def beginDay(self, isoDate, replacesDay):
+        self.connect().execute('DELETE FROM stagedItems')
+        self.replacesDay = replacesDay
+
+    def passThrough(self, isoDate, costTableRows, taxRules, firstPosition=0):
+        costTableRows = iter(costTableRows)
+        yield next(costTableRows)
+        pendingRows = []
+        for position, row in enumerate(costTableRows, start=firstPosition):
+            pendingRows.append((isoDate, position, row[0], taxRules.categoryFor(row[0]), *row[1:]))
+            if len(pendingRows) == self.batchSize:
+                self.insertRows(pendingRows)
+                pendingRows.clear()
+            yield row
+        self.insertRows(pendingRows)
+
+    def insertRows(self, rows):
+        self.connection.executemany('INSERT INTO stagedItems VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def commitDay(self, isoDate, numberOfItems, totals, weekOfMonth=None):
+        self.connection.execute('BEGIN IMMEDIATE')
+        self.moveStagedItems(isoDate)
+        self.closeDay(isoDate, numberOfItems, totals, weekOfMonth)
+        self.commit()
+
+    def moveStagedItems(self, isoDate):
+        if self.replacesDay:
+            self.connection.execute('DELETE FROM items WHERE isoDate = ?', (isoDate,))
+        self.connection.execute('INSERT OR REPLACE INTO items SELECT * FROM stagedItems')
+        self.connection.execute('DELETE FROM stagedItems')
+
+    def closeDay(self, isoDate, numberOfItems, totals, weekOfMonth=None):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO dailyTotals VALUES (?, ?, ?, ?, ?)',
+            (isoDate, numberOfItems, *(totals or [0.0, 0.0, 0.0]))
+        )
+        self.connection.execute('DELETE FROM dailyCategoryTotals WHERE isoDate = ?', (isoDate,))
+        self.connection.execute(
+            'INSERT INTO dailyCategoryTotals '
+            'SELECT isoDate, category, COUNT(*), SUM(grossPrice), SUM(priceAfterTax), SUM(taxesPaid) '
+            'FROM items WHERE isoDate = ? GROUP BY category',
+            (isoDate,)
+        )
+        if weekOfMonth is not None:
+            Rollups(self).refresh(isoDate, weekOfMonth)
+
+    def commit(self):
+        self.connection.execute('COMMIT')
+
+    def rangeTotals(self, startDate, endDate) -> LedgerTotals:
+        return self.fetchTotals(
+            'SELECT COALESCE(SUM(numberOfItems), 0), SUM(grossPrice), SUM(priceAfterTax), SUM(taxesPaid) '
+            'FROM dailyTotals WHERE isoDate BETWEEN ? AND ?',
+            (startDate, endDate)
+        )
+
+    def itemTotals(self, item, startDate, endDate) -> LedgerTotals:
+        return self.fetchTotals(
+            'SELECT COUNT(*), SUM(grossPrice), SUM(priceAfterTax), SUM(taxesPaid) '
+            'FROM items WHERE item = ? COLLATE NOCASE AND isoDate BETWEEN ? AND ?',
+            (item.strip(), startDate, endDate)
+        )
+
+    def categoryTotals(self, startDate, endDate) -> dict[str, LedgerTotals]:
+        rows = self.connect().execute(
+            'SELECT category, SUM(numberOfItems), SUM(grossPrice), SUM(priceAfterTax), SUM(taxesPaid) '
+            'FROM dailyCategoryTotals WHERE isoDate BETWEEN ? AND ? GROUP BY category ORDER BY category',
+            (startDate, endDate)
+        )
+        return {row[0]: self.createTotals(row[1:]) for row in rows}
+
+    def fetchTotals(self, query, parameters) -> LedgerTotals:
+        return self.createTotals(self.connect().execute(query, parameters).fetchone())
+
+    def createTotals(self, row) -> LedgerTotals:
+        numberOfItems, *totals = row
+        return LedgerTotals(numberOfItems, *(round(total or 0.0, 2) for total in totals))
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import re
+from decimal import Decimal
+from typing import NamedTuple
+
+from ExtractBudgetData.ItemNames import collapseWhitespace, normalizeItemName
+
+
+class TaxRule(NamedTuple):
+    matchType: str
+    pattern: str
+    category: str
+
+
+class TaxRuleTable:
+    resolvedCacheLimit = 65536
+
+    def __init__(self, categoryRates, rules=(), defaultCategory='standard'):
+        self.categoryRates = {category: Decimal(str(rate)) for category, rate in categoryRates.items()}
+        if defaultCategory not in self.categoryRates:
+            raise ValueError(f"No rate was given for the default tax category '{defaultCategory}'")
+        self.defaultCategory = defaultCategory
+        self.rules = [TaxRule(*rule) for rule in rules]
+        self.categoryMultipliers = {category: float(1 + rate) for category, rate in self.categoryRates.items()}
+        self.exactCategories = {}
+        self.prefixCategories = {}
+        self.prefixLengths = []
+        self.regexCategories = []
+        self.resolvedCategories = {}
+        self.compile(self.rules)
+
+    @classmethod
+    def default(cls):
+        return cls({'standard': '0.13'})
+
+    @classmethod
+    def fromDict(cls, configuration):
+        rules = [TaxRule(**rule) for rule in configuration.get('rules', [])]
+        defaultCategory = configuration.get('default', 'standard')
+        return cls(configuration['rates'], rules, defaultCategory)
+
+    @classmethod
+    def fromFile(cls, filePath):
+        try:
+            with open(filePath, 'r', encoding='utf-8') as file:
+                return cls.fromDict(json.load(file))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {filePath} was not found")
+
+    def fingerprint(self):
+        configuration = {
+            'rates': {category: str(rate.normalize()) for category, rate in sorted(self.categoryRates.items())},
+            'rules': [rule._asdict() for rule in self.rules],
+            'default': self.defaultCategory,
+            'nameNormalization': 'nfkc-collapsed-casefold',
+        }
+        return hashlib.sha256(json.dumps(configuration, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def compile(self, rules):
+        regexRules = []
+        for rule in rules:
+            if rule.category not in self.categoryRates:
+                raise ValueError(f"Tax rule refers to unknown category '{rule.category}'")
+            if rule.matchType == 'exact':
+                self.exactCategories.setdefault(normalizeItemName(rule.pattern), rule.category)
+            elif rule.matchType == 'prefix':
+                self.prefixCategories.setdefault(normalizeItemName(rule.pattern), rule.category)
+            elif rule.matchType == 'regex':
+                regexRules.append(rule)
+            else:
+                raise ValueError(f"Unsupported tax rule match type '{rule.matchType}'")
+        self.prefixLengths = sorted({len(prefix) for prefix in self.prefixCategories}, reverse=True)
+        self.regexCategories = [(self.compileRegex(rule.pattern), rule.category) for rule in regexRules]
+
+    def compileRegex(self, pattern):
+        try:
+            return re.compile(pattern, re.IGNORECASE)
+        except re.error as error:
+            raise ValueError(f"Tax rule has an invalid regex pattern '{pattern}': {error}")
+
+    def categoryFor(self, name):
+        category = self.resolvedCategories.get(name)
+        if category is None:
+            category = self.resolveCategory(name)
+            if len(self.resolvedCategories) >= self.resolvedCacheLimit:
+                self.resolvedCategories.clear()
+            self.resolvedCategories[name] = category
+        return category
+
+    def resolveCategory(self, name):
+        normalizedName = normalizeItemName(name)
+        if normalizedName in self.exactCategories:
+            return self.exactCategories[normalizedName]
+        for prefixLength in self.prefixLengths:
+            prefixCategory = self.prefixCategories.get(normalizedName[:prefixLength])
+            if prefixCategory is not None:
+                return prefixCategory
+        collapsedName = collapseWhitespace(name)
+        for regex, category in self.regexCategories:
+            if regex.fullmatch(collapsedName):
+                return category
+        return self.defaultCategory
+
+    def rateFor(self, name):
+        return self.categoryRates[self.categoryFor(name)]
+
+    def ratesFor(self, names):
+        return [self.categoryRates[self.categoryFor(name)] for name in names]
+
+    def multiplierFor(self, name):
+        return self.categoryMultipliers[self.categoryFor(name)]
+
+    def multipliersFor(self, names):
+        return [self.categoryMultipliers[self.categoryFor(name)] for name in names]
@@ -1,4 +1,12 @@
+import mmap
+import re
+from itertools import chain
+from typing import NamedTuple
+
+
 class TextFile:
+    chunkSize = 1024 * 1024
+
     def __init__(self, filePath):
         self.filePath = filePath
 
@@ -6,6 +14,16 @@ class TextFile:
         fileContent = self.getDataFromFile()
         return self.transformBudgetDataIntoPairStructure(fileContent)
 
+    def iterData(self):
+        fileChunks = self.getChunksFromFile()
+        yield from TextFileStreamExtractor(fileChunks).transform()
+
+    def iterMappedData(self):
+        dialect = self.getDialect()
+        if dialect.fileType == 'unknown':
+            raise ValueError("Unsupported file type")
+        yield from TextFileMappedReader(self.filePath, dialect).iterPairs()
+
     def getDataFromFile(self):
         try:
             with open(self.filePath, 'r', encoding='utf-8') as file:
@@ -15,33 +33,66 @@ class TextFile:
         except Exception as e:
             raise IOError(f"An error occurred while reading the file: {str(e)}")
 
+    def getDialect(self):
+        try:
+            with open(self.filePath, 'r', encoding='utf-8') as file:
+                fileSample = file.read(TextFileIdentifier.sniffLength)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {self.filePath} was not found")
+        except Exception as e:
+            raise IOError(f"An error occurred while reading the file: {str(e)}")
+        return TextFileIdentifier(fileSample).getDialect()
+
+    def getChunksFromFile(self):
+        try:
+            with open(self.filePath, 'r', encoding='utf-8') as file:
+                while chunk := file.read(self.chunkSize):
+                    yield chunk
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {self.filePath} was not found")
+        except Exception as e:
+            raise IOError(f"An error occurred while reading the file: {str(e)}")
+
     def transformBudgetDataIntoPairStructure(self, fileContent):
         fileIdentifier = TextFileIdentifier(fileContent)
         return TextFileExtractor(fileIdentifier, fileContent).transform()
 
 
+class TextFileDialect(NamedTuple):
+    fileType: str
+    delimiter: str | None
+    stripItems: bool
+
+
 class TextFileIdentifier:
+    sniffLength = 64 * 1024
+    csvDelimiterPattern = re.compile(r'(?<!\d),|,(?!\d)')
+
     def __init__(self, content):
         self.content = content
 
     def getFileType(self):
-        if self.fileIsCSV():
-            return 'csv'
-        if self.fileContainsNewlineDelimiters():
-            return 'newline'
-        return 'unknown'
+        return self.getDialect().fileType
+
+    def getDialect(self):
+        sample = self.getSample()
+        if self.fileIsCSV(sample):
+            return TextFileDialect('csv', ',', stripItems=True)
+        if self.fileContainsNewlineDelimiters(sample):
+            return TextFileDialect('newline', '\n', stripItems=False)
+        return TextFileDialect('unknown', None, stripItems=False)
 
-    def fileIsCSV(self):
-        for char in self.content:
-            if char == ',':
-                return True
-        return False
+    def getSample(self):
+        sample = self.content[:self.sniffLength]
+        if ',' in sample or '\n' in sample:
+            return sample
+        return self.content
 
-    def fileContainsNewlineDelimiters(self):
-        for char in self.content:
-            if char == '\n':
-                return True
-        return False
+    def fileIsCSV(self, sample):
+        return self.csvDelimiterPattern.search(sample) is not None
+
+    def fileContainsNewlineDelimiters(self, sample):
+        return '\n' in sample
 
 
 class TextFileExtractor:
@@ -50,22 +101,15 @@ class TextFileExtractor:
         self.content = content
 
     def transform(self):
-        typeOfFile = self.fileIdentifier.getFileType()
-        if typeOfFile == 'csv':
-            return self.transformCSVFile()
-        elif typeOfFile == 'newline':
-            return self.transformNewlineFile()
-        else:
+        dialect = self.fileIdentifier.getDialect()
+        if dialect.fileType == 'unknown':
             raise ValueError("Unsupported file type")
+        return self.transformWithDialect(dialect)
 
-    def transformCSVFile(self):
-        items = self.content.split(',')
-        items = list(map(str.strip, items))
-        items = list(filter(None, items))
-        return self.pairItems(items)
-
-    def transformNewlineFile(self):
-        items = self.content.split('\n')
+    def transformWithDialect(self, dialect):
+        items = self.content.split(dialect.delimiter)
+        if dialect.stripItems:
+            items = map(str.strip, items)
         items = list(filter(None, items))
         return self.pairItems(items)
 
@@ -75,3 +119,135 @@ class TextFileExtractor:
             if i + 1 < len(items):
                 pairedData.append([items[i], items[i + 1]])
         return pairedData
+
+
+class TextFileStreamExtractor:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def transform(self):
+        remainingChunks = iter(self.chunks)
+        leadingChunks, dialect = self.identifyFromLeadingChunks(remainingChunks)
+        if dialect.fileType == 'unknown':
+            raise ValueError("Unsupported file type")
+        allChunks = chain(leadingChunks, remainingChunks)
+        return self.transformWithDialect(allChunks, dialect)
+
+    def identifyFromLeadingChunks(self, chunks):
+        leadingChunks = []
+        dialect = TextFileIdentifier('').getDialect()
+        for chunk in chunks:
+            leadingChunks.append(chunk)
+            dialect = TextFileIdentifier(chunk).getDialect()
+            if dialect.fileType != 'unknown':
+                break
+        return leadingChunks, dialect
+
+    def transformWithDialect(self, chunks, dialect):
+        items = self.splitChunks(chunks, dialect.delimiter)
+        if dialect.stripItems:
+            items = map(str.strip, items)
+        items = filter(None, items)
+        return self.pairItems(items)
+
+    def splitChunks(self, chunks, delimiter):
+        unfinishedItem = ''
+        for chunk in chunks:
+            items = (unfinishedItem + chunk).split(delimiter)
+            unfinishedItem = items.pop()
+            yield from items
+        yield unfinishedItem
+
+    def pairItems(self, items):
+        items = iter(items)
+        for item in items:
+            price = next(items, None)
+            if price is None:
+                return
+            yield [item, price]
+
+
+class TextFileMappedReader:
+    windowSize = 1024 * 1024
+
+    def __init__(self, filePath, dialect):
+        self.filePath = filePath
+        self.dialect = dialect
+        self.delimiter = dialect.delimiter.encode('utf-8')
+
+    def iterPairs(self, byteRange=None):
+        tokens = self.iterTokens(byteRange)
+        for item in tokens:
+            price = next(tokens, None)
+            if price is None:
+                return
+            yield [item, price]
+
+    def iterTokens(self, byteRange=None):
+        for window in self.iterWindows(byteRange):
+            tokens = window.decode('utf-8').split(self.dialect.delimiter)
+            if self.dialect.stripItems:
+                tokens = map(str.strip, tokens)
+            yield from filter(None, tokens)
+
+    def iterNumberedTokens(self, byteRange=None):
+        lineNumber = self.countLines(byteRange[0] if byteRange else 0) + 1
+        delimiterLines = self.dialect.delimiter.count('\n')
+        for window in self.iterWindows(byteRange):
+            for index, token in enumerate(window.decode('utf-8').split(self.dialect.delimiter)):
+                if index:
+                    lineNumber += delimiterLines
+                strippedToken = token.strip() if self.dialect.stripItems else token
+                if strippedToken:
+                    leadingLength = len(token) - len(token.lstrip()) if self.dialect.stripItems else 0
+                    yield lineNumber + token.count('\n', 0, leadingLength), strippedToken
+                if self.dialect.stripItems:
+                    lineNumber += token.count('\n')
+
+    def countLines(self, end):
+        if end == 0:
+            return 0
+        with open(self.filePath, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mappedFile:
+                return sum(
+                    mappedFile[start:min(start + self.windowSize, end)].count(b'\n')
+                    for start in range(0, end, self.windowSize)
+                )
+
+    def iterWindows(self, byteRange=None):
+        try:
+            with open(self.filePath, 'rb') as file:
+                if file.seek(0, 2) == 0:
+                    return
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mappedFile:
+                    start, end = byteRange or (0, len(mappedFile))
+                    while start < end:
+                        windowEnd = self.findWindowEnd(mappedFile, start, end)
+                        window = self.normalizeNewlines(mappedFile[start:windowEnd])
+                        self.releasePages(mappedFile, start, windowEnd)
+                        yield window
+                        start = windowEnd
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {self.filePath} was not found")
+
+    def releasePages(self, mappedFile, start, end):
+        if not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+        pageStart = start - start % mmap.PAGESIZE
+        mappedFile.madvise(mmap.MADV_DONTNEED, pageStart, end - pageStart)
+
+    def findWindowEnd(self, mappedFile, start, end):
+        windowEnd = min(start + self.windowSize, end)
+        if windowEnd == end:
+            return end
+        delimiterIndex = mappedFile.rfind(self.delimiter, start, windowEnd)
+        if delimiterIndex == -1:
+            delimiterIndex = mappedFile.find(self.delimiter, windowEnd, end)
+        if delimiterIndex == -1:
+            return end
+        return delimiterIndex + 1
+
+    def normalizeNewlines(self, window):
+        if b'\r' not in window:
+            return window
+        return window.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
@@ -1,7 +1,29 @@
+import io
+import json
+import os
+import sys
+import tempfile
 import unittest
-from Cost import Cost, CostSummary
-from TextFile import TextFile, TextFileIdentifier
+from contextlib import redirect_stdout
+from decimal import Decimal, ROUND_HALF_EVEN
+from importlib.util import find_spec
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ExtractBudgetData.Aggregation import ItemAggregator, groupBudgetInfo
+from ExtractBudgetData.Checkpoint import CheckpointStore, CostCheckpoint, IncrementalCost
+from ExtractBudgetData.Cost import Cost, CostSummary
+from ExtractBudgetData.DatedLedger import DatedLedger
+from ExtractBudgetData.ItemDictionary import ItemDictionary, ItemDictionaryStore
+from ExtractBudgetData.MoneyEngine import CentsMoneyEngine, DecimalMoneyEngine
+from ExtractBudgetData.PriceParser import PriceParser, RejectedPrice
+from ExtractBudgetData.Rollups import Rollups
+from ExtractBudgetData.ShardedCost import FileSharder, ShardedCost
+from ExtractBudgetData.SqliteLedger import LedgerTotals, SqliteLedger
+from ExtractBudgetData.TaxRules import TaxRule, TaxRuleTable
+from ExtractBudgetData.TextFile import TextFile, TextFileIdentifier, TextFileMappedReader
 from colour_runner.runner import ColourTextTestRunner
+from instrumentation import JsonLinesMetricsWriter, StageInstrumentation, createInstrumentation
 
 
 class FileDataExtractorTests(unittest.TestCase):
@@ -39,6 +61,79 @@ class FileDataExtractorTests(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+class StreamingFileDataExtractorTests(unittest.TestCase):
+
+    class FakeChunkedTextFile(TextFile):
+        def __init__(self, chunks):
+            self.chunks = chunks
+
+        def getChunksFromFile(self):
+            return iter(self.chunks)
+
+    def testShouldStreamPairsFromCSVChunksSplitAcrossItems(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        csvFile = self.FakeChunkedTextFile(['Lap', 'top, 4', '00, Desk, 220,', ' Headphones, 120'])
+        expected = [['Laptop', '400'], ['Desk', '220'], ['Headphones', '120']]
+        # WHEN the following module is executed:
+        actual = list(csvFile.iterData())
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldStreamPairsFromNewlineChunksSplitAcrossItems(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        newlineFile = self.FakeChunkedTextFile(['A Shoes From New York\n4', '0\nMug\n', '\n2\nSweater\n40\nHat'])
+        expected = [['A Shoes From New York', '40'], ['Mug', '2'], ['Sweater', '40']]
+        # WHEN the following module is executed:
+        actual = list(newlineFile.iterData())
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+
+class MappedFileDataExtractorTests(unittest.TestCase):
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.windowSize = TextFileMappedReader.windowSize
+        TextFileMappedReader.windowSize = 8
+
+    def tearDown(self):
+        TextFileMappedReader.windowSize = self.windowSize
+        self.temporaryDirectory.cleanup()
+
+    def writeFile(self, content):
+        filePath = os.path.join(self.temporaryDirectory.name, 'budget.txt')
+        with open(filePath, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+        return filePath
+
+    def testShouldReadPairsFromMappedCSVFileWithUTF8Items(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        filePath = self.writeFile('Café crème, 4.50, Naïve ☕ mug, 12, Crêpes, 9')
+        expected = [['Café crème', '4.50'], ['Naïve ☕ mug', '12'], ['Crêpes', '9']]
+        # WHEN the following module is executed:
+        actual = list(TextFile(filePath).iterMappedData())
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldReadPairsFromMappedNewlineFileWithWindowsLineEndings(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        filePath = self.writeFile('Zoë’s bagel\r\n3\r\n\r\nMug\r\n2\r\nHat')
+        expected = [['Zoë’s bagel', '3'], ['Mug', '2']]
+        # WHEN the following module is executed:
+        actual = list(TextFile(filePath).iterMappedData())
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldReadOnlyTokensWithinByteRange(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        filePath = self.writeFile('Café, 4, Tea, 2')
+        dialect = TextFile(filePath).getDialect()
+        expected = ['4', 'Tea']
+        # WHEN the following module is executed:
+        actual = list(TextFileMappedReader(filePath, dialect).iterTokens((6, 14)))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+
 class FileIdentifierTests(unittest.TestCase):
 
     def getTextFileData(self, type):
@@ -65,6 +160,32 @@ class FileIdentifierTests(unittest.TestCase):
         # THEN the observable behavior should be verified as stated below:
         self.assertEqual(result, 'csv')
 
+    def testShouldExposeDelimiterOfSniffedDialect(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        textFileData = self.getTextFileData('csv')
+        textFileModule = TextFileIdentifier(textFileData)
+        # WHEN the following module is executed:
+        dialect = textFileModule.getDialect()
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual((dialect.delimiter, dialect.stripItems), (',', True))
+
+    def testShouldOnlySniffPrefixOfLargeFile(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        textFileData = 'Mug\n2\n' * TextFileIdentifier.sniffLength + 'Laptop, 400'
+        textFileModule = TextFileIdentifier(textFileData)
+        # WHEN the following module is executed:
+        result = textFileModule.getFileType()
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(result, 'newline')
+
+    def testShouldNotTreatThousandsSeparatorsAsCsvDelimiters(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        textFileModule = TextFileIdentifier('Laptop\n1,200.00\nMug\n$4.50\n')
+        # WHEN the following module is executed:
+        result = textFileModule.getFileType()
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(result, 'newline')
+
 
 class CostTableTests(unittest.TestCase):
     def setUp(self):
@@ -89,15 +210,185 @@ class CostTableTests(unittest.TestCase):
         cost = Cost(self.items)
         expected = [
             ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
-            ['Boots', '$180.00', '$203.40', '$23.40'],
-            ['Coat', '$220.00', '$248.60', '$28.60'],
-            ['Shirt', '$25.00', '$28.25', '$3.25'],
+            ['Boots', 180.00, 203.40, 23.40],
+            ['Coat', 220.00, 248.60, 28.60],
+            ['Shirt', 25.00, 28.25, 3.25],
         ]
         # WHEN the following module is executed:
         actual = cost.createPriceTable('formatted')
         # THEN the observable behavior should be verified as stated below:
         self.assertEqual(expected, actual)
 
+    def testShouldStorePricesInColumnsAndCreateRowsOnDemand(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        cost = Cost(self.items)
+        # WHEN the following module is executed:
+        priceTable = cost.createPriceTable('formatted')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(priceTable.names, ['Boots', 'Coat', 'Shirt'])
+        self.assertEqual([column.typecode for column in priceTable.columns], ['d', 'd', 'd'])
+        self.assertEqual(priceTable[-1], ['Shirt', 25.00, 28.25, 3.25])
+        self.assertEqual(len(priceTable), 4)
+
+
+@unittest.skipIf(find_spec('numpy') is None, "numpy is not installed")
+class NumpyCostTableTests(unittest.TestCase):
+    def setUp(self):
+        self.items = [['Boots', '180',], ['Coat', '220.125'], ['Shirt', '25.99']]
+
+    def testShouldCreateSameRawBudgetInfoAsPythonBackend(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        expected = Cost(self.items).getBudgetInfo('raw')
+        # WHEN the following module is executed:
+        actual = Cost(self.items, backend='numpy').getBudgetInfo('raw')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldCreateSameFormattedBudgetInfoAsPythonBackend(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        expected = Cost(self.items).getBudgetInfo('formatted')
+        # WHEN the following module is executed:
+        actual = Cost(self.items, backend='numpy').getBudgetInfo('formatted')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldRejectNumpyBackendWhenStreaming(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        cost = Cost(iter(self.items), backend='numpy')
+        # WHEN the following module is executed:
+        with self.assertRaises(ValueError) as raised:
+            cost.streamBudgetInfo('formatted')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertIn("'numpy' backend", str(raised.exception))
+
+
+class MoneyEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.items = [['Gum', '0.50'], ['Coat', '220.125'], ['Shirt', '25']]
+
+    def testShouldRoundEachItemToCentsWithDecimalReferenceEngine(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        cost = Cost(self.items, moneyEngine=DecimalMoneyEngine())
+        expected = [
+            ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+            ['Gum', Decimal('0.50'), Decimal('0.57'), Decimal('0.07')],
+            ['Coat', Decimal('220.13'), Decimal('248.75'), Decimal('28.62')],
+            ['Shirt', Decimal('25.00'), Decimal('28.25'), Decimal('3.25')],
+            ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+            [3, Decimal('245.63'), Decimal('277.57'), Decimal('31.94')],
+        ]
+        # WHEN the following module is executed:
+        actual = cost.getBudgetInfo('formatted')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldApplyConfiguredRoundingPolicy(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        cost = Cost(self.items, moneyEngine=DecimalMoneyEngine(ROUND_HALF_EVEN))
+        # WHEN the following module is executed:
+        priceTable = cost.createPriceTable('formatted')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(priceTable[1], ['Gum', Decimal('0.50'), Decimal('0.56'), Decimal('0.06')])
+        self.assertEqual(priceTable[2], ['Coat', Decimal('220.12'), Decimal('248.74'), Decimal('28.62')])
+
+    def testShouldRejectMoneyEngineWhenStreaming(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        cost = Cost(iter(self.items), moneyEngine=DecimalMoneyEngine())
+        # WHEN the following module is executed:
+        with self.assertRaises(ValueError):
+            cost.streamBudgetInfo('formatted')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(next(cost.items), ['Gum', '0.50'])
+
+    def testShouldRejectUnsupportedRoundingPolicy(self):
+        # GIVEN / WHEN / THEN the following behavior should be verified:
+        with self.assertRaises(ValueError):
+            DecimalMoneyEngine('ROUND_CEILING')
+
+    @unittest.skipIf(find_spec('numpy') is None, "numpy is not installed")
+    def testShouldMatchDecimalReferenceEngineWithIntegerCents(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        expected = Cost(self.items, moneyEngine=DecimalMoneyEngine(ROUND_HALF_EVEN)).getBudgetInfo('raw')
+        # WHEN the following module is executed:
+        actual = Cost(self.items, moneyEngine=CentsMoneyEngine(ROUND_HALF_EVEN)).getBudgetInfo('raw')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, [
+            [cell if isinstance(cell, (str, int)) else float(cell) for cell in row] for row in expected
+        ])
+
+
+class TaxRuleTableTests(unittest.TestCase):
+    def setUp(self):
+        self.taxRules = TaxRuleTable(
+            {'standard': '0.13', 'groceries': '0', 'prepared food': '0.05'},
+            [
+                TaxRule('exact', 'Milk', 'groceries'),
+                TaxRule('prefix', 'Grocery', 'groceries'),
+                TaxRule('prefix', 'Grocery Deli', 'prepared food'),
+                TaxRule('regex', r'.*\bsandwich\b.*', 'prepared food'),
+            ]
+        )
+
+    def testShouldResolveCategoryFromExactNamePrefixAndRegexRules(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        names = ['milk ', 'Grocery Bread', 'Grocery Deli Salad', 'Chicken Sandwich', 'Laptop']
+        # WHEN the following module is executed:
+        categories = list(map(self.taxRules.categoryFor, names))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(categories, ['groceries', 'groceries', 'prepared food', 'prepared food', 'standard'])
+
+    def testShouldResolveEverySpellingOfOneDictionaryItemToOneCategory(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        names = ['Grocery  Deli Salad', ' ＧＲＯＣＥＲＹ DELI salad', 'grocery\tdeli salad', 'Chicken  Sandwich']
+        itemDictionary = ItemDictionary()
+        # WHEN the following module is executed:
+        categories = list(map(self.taxRules.categoryFor, names))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(list(itemDictionary.idsFor(names)), [0, 0, 0, 1])
+        self.assertEqual(categories, ['prepared food'] * 4)
+
+    def testShouldApplyPerItemTaxRateToPriceTable(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        cost = Cost([['Milk', '4'], ['Laptop', '400']], taxRules=self.taxRules)
+        # WHEN the following module is executed:
+        priceTable = cost.createPriceTable('formatted')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(priceTable[1:], [['Milk', 4.0, 4.0, 0.0], ['Laptop', 400.0, 452.0, 52.0]])
+
+    def testShouldApplyPerItemTaxRateWithMoneyEngine(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        cost = Cost([['Grocery Deli Soup', '5.50'], ['Laptop', '400']], moneyEngine=DecimalMoneyEngine(), taxRules=self.taxRules)
+        # WHEN the following module is executed:
+        priceTable = cost.createPriceTable('formatted')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(priceTable[1][2:], [Decimal('5.78'), Decimal('0.28')])
+        self.assertEqual(priceTable[2][2:], [Decimal('452.00'), Decimal('52.00')])
+
+    def testShouldMatchRegexRulesWithBackreferencesAndSharedGroupNames(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        taxRules = TaxRuleTable(
+            {'standard': '0.13', 'groceries': '0', 'prepared food': '0.05'},
+            [
+                TaxRule('regex', r'(?P<size>small|large) soup', 'prepared food'),
+                TaxRule('regex', r'(\w+) and \1', 'groceries'),
+                TaxRule('regex', r'(?P<size>small|large) bread', 'groceries'),
+            ]
+        )
+        # WHEN the following module is executed:
+        categories = list(map(taxRules.categoryFor, ['Large Soup', 'Beans and beans', 'Beans and rice', 'Small Bread']))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(categories, ['prepared food', 'groceries', 'standard', 'groceries'])
+
+    def testShouldRejectInvalidRegexRule(self):
+        # GIVEN / WHEN / THEN the following behavior should be verified:
+        with self.assertRaises(ValueError):
+            TaxRuleTable({'standard': '0.13'}, [TaxRule('regex', '(unclosed', 'standard')])
+
+    def testShouldRejectRuleForUnknownCategory(self):
+        # GIVEN / WHEN / THEN the following behavior should be verified:
+        with self.assertRaises(ValueError):
+            TaxRuleTable({'standard': '0.13'}, [TaxRule('exact', 'Milk', 'groceries')])
+
 
 class CostSummaryTests(unittest.TestCase):
 
@@ -129,13 +420,25 @@ class CostSummaryTests(unittest.TestCase):
         ]
         expectedCostSummary = [
             ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
-            ['3', '$425.00', '$480.25', '$55.25']
+            [3, 425.00, 480.25, 55.25]
         ]
         # WHEN the following module is executed:
         costSummary = Cost("").createPriceSummary(costTable)
         # THEN the observable behavior should be verified as stated below:
         self.assertEqual(costSummary, expectedCostSummary)
 
+    def testShouldCreateFormattedCostSummaryFromRoundedNumericTable(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        cost = Cost([['Boots', '180.004'], ['Coat', '220.004'], ['Shirt', '25']])
+        expectedCostSummary = [
+            ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+            [3, 425.00, 480.25, 55.25]
+        ]
+        # WHEN the following module is executed:
+        costSummary = cost.createPriceSummary(cost.createPriceTable('formatted'))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(costSummary, expectedCostSummary)
+
 
     def testShouldIdentifyFormattedTableForCostSummary(self):
         # GIVEN the following preconditions corresponding to the system under test:
@@ -166,6 +469,518 @@ class CostSummaryTests(unittest.TestCase):
         self.assertEqual(typeOfTable, 'raw')
 
 
+class ItemAggregationTests(unittest.TestCase):
+    def setUp(self):
+        self.items = [['Coffee', '3'], ['Tea', '2.50'], [' coffee  ', '4'], ['Hat', '10'], ['COFFEE', '1']]
+
+    def testShouldGroupNormalizedItemNamesWithCountsTotalsAndPriceRange(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        budgetInfo = Cost(self.items).streamBudgetInfo('formatted')
+        # WHEN the following module is executed:
+        groupedBudgetInfo = groupBudgetInfo(budgetInfo)
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(list(groupedBudgetInfo), [
+            ['Count', 'Item', 'Gross Price', 'Price After Tax', 'Taxes Paid', 'Lowest Price', 'Highest Price'],
+            [3, 'Coffee', 8, 9.04, 1.04, 1, 4],
+            [1, 'Tea', 2.5, 2.82, 0.32, 2.5, 2.5],
+            [1, 'Hat', 10, 11.3, 1.3, 10, 10],
+            ['Number of Items', 'Distinct Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid', 'Lowest Price', 'Highest Price'],
+            [5, 3, 20.5, 23.16, 2.66, 1, 10],
+        ])
+        self.assertEqual(groupedBudgetInfo.plainColumnCount, 2)
+
+    def testShouldKeepTopItemsBySpendAndFoldTheRestIntoOneRow(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        costTable = Cost(self.items).getBudgetInfo('formatted').costTable
+        # WHEN the following module is executed:
+        groupedRows = list(ItemAggregator('formatted', topItems=1).iterTable(costTable))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(groupedRows[1:], [
+            [1, 'Hat', 10.0, 11.3, 1.3, 10.0, 10.0],
+            [4, '2 Other Items', 10.5, 11.86, 1.36, 1.0, 4.0],
+        ])
+        with self.assertRaises(ValueError):
+            ItemAggregator('formatted', topItems=0)
+
+    def testShouldGroupAnInternedCostTableByItemIdWithoutLookingNamesUp(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        itemDictionary = ItemDictionary()
+        costTable = Cost(self.items, itemDictionary=itemDictionary).getBudgetInfo('formatted').costTable
+        itemAggregator = ItemAggregator('formatted', itemDictionary=itemDictionary)
+        itemDictionary.idFor = self.failLookUp
+        # WHEN the following module is executed:
+        groupedRows = list(itemAggregator.iterTable(costTable))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertTrue(itemAggregator.holdsSameItemIds(costTable))
+        self.assertEqual([row[:2] for row in groupedRows[1:]], [[3, 'Coffee'], [1, 'Tea'], [1, 'Hat']])
+
+    def testShouldGroupStreamedRowsByTheItemIdsTheyCarryThroughWrappingGenerators(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        itemDictionary = ItemDictionary()
+        budgetInfo = Cost(iter(self.items), itemDictionary=itemDictionary).streamBudgetInfo('formatted')
+        costedRows = list(budgetInfo.costTable)
+        wrappedRows = (row for row in costedRows)
+        itemAggregator = ItemAggregator('formatted', itemDictionary=itemDictionary)
+        itemDictionary.idFor = self.failLookUp
+        # WHEN the following module is executed:
+        groupedRows = list(itemAggregator.iterTable(wrappedRows))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(groupedRows[1], [3, 'Coffee', 8, 9.04, 1.04, 1, 4])
+        self.assertEqual([row[:2] for row in groupedRows[2:]], [[1, 'Tea'], [1, 'Hat']])
+
+    def testShouldLookNamesUpWhenStreamedItemIdsComeFromAnotherDictionary(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        budgetInfo = Cost(iter(self.items), itemDictionary=ItemDictionary(['Hat'])).streamBudgetInfo('formatted')
+        # WHEN the following module is executed:
+        groupedRows = list(ItemAggregator('formatted', itemDictionary=ItemDictionary()).iterTable(budgetInfo.costTable))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual([row[:2] for row in groupedRows[1:]], [[3, 'Coffee'], [1, 'Tea'], [1, 'Hat']])
+
+    def failLookUp(self, name):
+        raise AssertionError(f"{name!r} was looked up instead of using its item id")
+
+
+class ItemDictionaryTests(unittest.TestCase):
+    def testShouldMapCaseWhitespaceAndUnicodeVariantsToOneInternedName(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        itemDictionary = ItemDictionary()
+        # WHEN the following module is executed:
+        itemIds = itemDictionary.idsFor(['Café  Latte', ' cafe\u0301 latte', 'ＣＡＦÉ LATTE', 'Tea'])
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(list(itemIds), [0, 0, 0, 1])
+        self.assertEqual(itemDictionary.names, ['Café Latte', 'Tea'])
+        self.assertIs(itemDictionary.canonicalName(' TEA '), itemDictionary.canonicalName('tea'))
+
+    def testShouldStoreItemIdsInCostTableAndKeepThemStableAcrossRuns(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        with tempfile.TemporaryDirectory() as directory:
+            itemDictionaryStore = ItemDictionaryStore(os.path.join(directory, 'items.json'))
+            firstDictionary = itemDictionaryStore.load()
+            Cost([['Tea', '2'], ['Coffee', '3']], itemDictionary=firstDictionary).getBudgetInfo('raw')
+            itemDictionaryStore.save(firstDictionary)
+            # WHEN the following module is executed:
+            secondDictionary = itemDictionaryStore.load()
+            costTable = Cost([['coffee ', '4'], ['Bagel', '1'], ['TEA', '2']], itemDictionary=secondDictionary).getBudgetInfo('raw').costTable
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(list(costTable.names), [1, 2, 0])
+        self.assertEqual([row[0] for row in costTable], ['Item', 'Coffee', 'Bagel', 'Tea'])
+        self.assertTrue(secondDictionary.isModified)
+
+    def testShouldRefuseToLoadCorruptDictionaryRatherThanReassignIds(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        with tempfile.TemporaryDirectory() as directory:
+            statePath = os.path.join(directory, 'items.json')
+            with open(statePath, 'w', encoding='utf-8') as file:
+                file.write('{"names": ["Tea", "Cof')
+            # WHEN the following module is executed:
+            with self.assertRaises(ValueError) as raised:
+                ItemDictionaryStore(statePath).load()
+            with open(statePath, 'r', encoding='utf-8') as file:
+                storedContent = file.read()
+        # THEN the observable behavior should be verified as stated below:
+        self.assertIn(statePath, str(raised.exception))
+        self.assertEqual(storedContent, '{"names": ["Tea", "Cof')
+
+
+class StreamingBudgetInfoTests(unittest.TestCase):
+    def setUp(self):
+        self.items = [['Boots', '180',], ['Coat', '220.49'], ['Shirt', '25']]
+
+    def testShouldStreamSameRawBudgetInfoAsWholeTable(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        expected = Cost(self.items).getBudgetInfo('raw')
+        # WHEN the following module is executed:
+        actual = list(Cost(iter(self.items)).streamBudgetInfo('raw'))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldStreamSameFormattedBudgetInfoAsWholeTable(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        expected = Cost(self.items).getBudgetInfo('formatted')
+        # WHEN the following module is executed:
+        actual = list(Cost(iter(self.items)).streamBudgetInfo('formatted'))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldIndexWholeTablesButNotStreams(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        budgetInfo = Cost(self.items).getBudgetInfo('formatted')
+        streamedBudgetInfo = Cost(iter(self.items)).streamBudgetInfo('formatted')
+        # WHEN the following module is executed:
+        rows = [budgetInfo[2], budgetInfo[-1], budgetInfo[3:5]]
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(rows, [list(budgetInfo)[2], list(budgetInfo)[-1], list(budgetInfo)[3:5]])
+        with self.assertRaises(TypeError):
+            streamedBudgetInfo[0]
+
+
+class ShardedCostTests(unittest.TestCase):
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.minimumShardSize = FileSharder.minimumShardSize
+        FileSharder.minimumShardSize = 64
+
+    def tearDown(self):
+        FileSharder.minimumShardSize = self.minimumShardSize
+        self.temporaryDirectory.cleanup()
+
+    def writeFile(self, fileName, content):
+        filePath = os.path.join(self.temporaryDirectory.name, fileName)
+        with open(filePath, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+        return filePath
+
+    def testShouldCostCSVShardsSameAsSerialCost(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        content = ', '.join(f'Café item {index}, {index * 7 % 300}.{index % 100:02d}' for index in range(101))
+        filePath = self.writeFile('budget.csv', content)
+        expected = Cost(TextFile(filePath).extractData()).getBudgetInfo('formatted')
+        # WHEN the following module is executed:
+        actual = list(ShardedCost(filePath, maxWorkers=4).getBudgetInfo('formatted'))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldCostNewlineShardsSameAsSerialCost(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        content = ''.join(f'Mug {index}\r\n\n{index * 3 % 40}.{index % 100:02d}\n' for index in range(101))
+        filePath = self.writeFile('budget.txt', content)
+        expected = Cost(TextFile(filePath).extractData()).getBudgetInfo('raw')
+        # WHEN the following module is executed:
+        actual = list(ShardedCost(filePath, maxWorkers=4).getBudgetInfo('raw'))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldRecostShardsWhoseParityWasMispredicted(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        content = ''.join(f'{index * 11 % 97}\n{index % 40}.{index % 100:02d}\n' for index in range(101))
+        filePath = self.writeFile('budget.txt', content)
+        expected = Cost(TextFile(filePath).extractData()).getBudgetInfo('formatted')
+        # WHEN the following module is executed:
+        actual = list(ShardedCost(filePath, maxWorkers=4).getBudgetInfo('formatted'))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+    def testShouldShardRebuiltIncrementalRunSameAsStreamedRun(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        content = ''.join(f'Mug {index}\n{index % 40}.{index % 100:02d}\n' for index in range(101)) + 'Hat\nfree\nLamp'
+        filePath = self.writeFile('budget.txt', content)
+        streamedRun = IncrementalCost(filePath, 'Sheet', 'formatted')
+        expected = list(streamedRun.streamBudgetInfo())
+        shardedRun = IncrementalCost(filePath, 'Sheet', 'formatted')
+        # WHEN the following module is executed:
+        actual = list(shardedRun.shardBudgetInfo(maxWorkers=4))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+        self.assertEqual(shardedRun.getCheckpoint(), streamedRun.getCheckpoint())
+        self.assertEqual(shardedRun.getRejects(), streamedRun.getRejects())
+
+    def testShouldCanonicalizeShardedNamesBeforePricingSameAsStreamedRun(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        spellings = ['Iced  Tea', 'iced tea', ' ICED TEA', 'Ｉｃｅｄ Tea', 'Mug']
+        content = ''.join(f'{spellings[index % 5]}\n{index % 7}{"" if index % 2 else ".25"}\n' for index in range(101))
+        filePath = self.writeFile('budget.txt', content)
+        taxRules = TaxRuleTable(
+            {'standard': '0.13', 'drinks': '0.05'},
+            [TaxRule('exact', 'iced tea', 'drinks'), TaxRule('regex', 'Iced Tea', 'drinks')],
+        )
+        streamedDictionary = ItemDictionary()
+        streamedRun = IncrementalCost(filePath, 'Sheet', 'formatted', taxRules, streamedDictionary)
+        expected = list(streamedRun.streamBudgetInfo())
+        shardedDictionary = ItemDictionary()
+        shardedRun = IncrementalCost(filePath, 'Sheet', 'formatted', taxRules, shardedDictionary)
+        # WHEN the following module is executed:
+        actual = list(shardedRun.shardBudgetInfo(maxWorkers=4))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+        self.assertEqual([list(map(type, row)) for row in actual], [list(map(type, row)) for row in expected])
+        self.assertEqual([row.itemId for row in actual[1:-2]], [row.itemId for row in expected[1:-2]])
+        self.assertEqual(shardedDictionary.names, streamedDictionary.names)
+        self.assertEqual(shardedRun.getCheckpoint(), streamedRun.getCheckpoint())
+
+    def testShouldCostShardsWithMoneyEngineSameAsSerialCost(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        content = ', '.join(f'Shirt {index}, {index}.{index % 100:02d}5' for index in range(101))
+        filePath = self.writeFile('budget.csv', content)
+        moneyEngine = DecimalMoneyEngine()
+        expected = Cost(TextFile(filePath).extractData(), moneyEngine=moneyEngine).getBudgetInfo('formatted')
+        # WHEN the following module is executed:
+        actual = list(ShardedCost(filePath, maxWorkers=4, moneyEngine=moneyEngine).getBudgetInfo('formatted'))
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(actual, expected)
+
+
+class IncrementalCostTests(unittest.TestCase):
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.filePath = os.path.join(self.temporaryDirectory.name, 'budget.txt')
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def writeFile(self, content):
+        with open(self.filePath, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+
+    def runIncrementally(self, savedCheckpoint):
+        incrementalCost = IncrementalCost(self.filePath, 'Sheet', 'formatted')
+        incrementalCost.resumeFrom(savedCheckpoint)
+        budgetInfo = list(incrementalCost.streamBudgetInfo())
+        return incrementalCost, budgetInfo
+
+    def testShouldCostOnlyAppendedTailAndCarryRunningTotals(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.writeFile('Boots, 180, Coat, 220.49, Shirt')
+        firstRun, _ = self.runIncrementally(None)
+        self.writeFile('Boots, 180, Coat, 220.49, Shirt, 25, Café, 4.5')
+        expected = Cost([['Boots', '180'], ['Coat', '220.49'], ['Shirt', '25'], ['Café', '4.5']]).getBudgetInfo('formatted')
+        # WHEN the following module is executed:
+        secondRun, budgetInfo = self.runIncrementally(firstRun.getCheckpoint())
+        # THEN the observable behavior should be verified as stated below:
+        self.assertTrue(secondRun.isResuming)
+        self.assertEqual(budgetInfo[1:3], expected[3:5])
+        self.assertEqual(budgetInfo[-2:], expected[-2:])
+
+    def testShouldRebuildWhenProcessedPrefixChanges(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.writeFile('Boots, 180, Coat, 220')
+        firstRun, _ = self.runIncrementally(None)
+        self.writeFile('Shoes, 180, Coat, 220, Shirt, 25')
+        # WHEN the following module is executed:
+        secondRun, budgetInfo = self.runIncrementally(firstRun.getCheckpoint())
+        # THEN the observable behavior should be verified as stated below:
+        self.assertFalse(secondRun.isResuming)
+        self.assertEqual(budgetInfo, Cost([['Shoes', '180'], ['Coat', '220'], ['Shirt', '25']]).getBudgetInfo('formatted'))
+
+    def testShouldRebuildWhenLastProcessedTokenIsExtended(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.writeFile('Boots, 18')
+        firstRun, _ = self.runIncrementally(None)
+        self.writeFile('Boots, 180')
+        # WHEN the following module is executed:
+        secondRun, budgetInfo = self.runIncrementally(firstRun.getCheckpoint())
+        # THEN the observable behavior should be verified as stated below:
+        self.assertFalse(secondRun.isResuming)
+        self.assertEqual(budgetInfo, Cost([['Boots', '180']]).getBudgetInfo('formatted'))
+
+    def testShouldRebuildWhenTaxRulesChange(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.writeFile('Milk, 4, Coat, 220')
+        firstRun, _ = self.runIncrementally(None)
+        self.writeFile('Milk, 4, Coat, 220, Shirt, 25')
+        taxRules = TaxRuleTable({'standard': '0.13', 'groceries': '0'}, [TaxRule('exact', 'Milk', 'groceries')])
+        secondRun = IncrementalCost(self.filePath, 'Sheet', 'formatted', taxRules)
+        # WHEN the following module is executed:
+        isResuming = secondRun.resumeFrom(firstRun.getCheckpoint())
+        # THEN the observable behavior should be verified as stated below:
+        self.assertFalse(isResuming)
+        self.assertEqual(list(secondRun.streamBudgetInfo())[1], ['Milk', 4, 4.0, 0.0])
+
+    def testShouldPersistCheckpointInSidecarStateFile(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        checkpointStore = CheckpointStore(f'{self.filePath}.checkpoint.json')
+        checkpoint = CostCheckpoint('Sheet', 'formatted', 12, 'abc', 2, [1.5, 1.7, 0.2], 'Mug', 'def')
+        # WHEN the following module is executed:
+        checkpointStore.save(checkpoint)
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(checkpointStore.load(), checkpoint)
+
+    def testShouldReportRejectedPricesWithLineNumbers(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.writeFile('Boots\n180\n\nCoat\n4,50\nShirt\n25\nHat\nfree\n')
+        # WHEN the following module is executed:
+        incrementalCost, budgetInfo = self.runIncrementally(None)
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual([row[0] for row in budgetInfo[1:3]], ['Boots', 'Shirt'])
+        self.assertEqual(incrementalCost.getRejects(), [
+            RejectedPrice(2, 'Coat', '4,50', 'decimal comma', 5),
+            RejectedPrice(4, 'Hat', 'free', 'not a price', 9),
+        ])
+
+
+class DatedLedgerTests(unittest.TestCase):
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.filePath = os.path.join(self.temporaryDirectory.name, 'ledger.csv')
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def writeFile(self, content):
+        with open(self.filePath, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+
+    def testShouldGroupEntriesByDateInChronologicalOrder(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.writeFile('date,item,price\n2026-10-15, Coat, 220\n\n2026-10-13,Boots,180\n2026-10-15,"Shirt, linen",25\n')
+        # WHEN the following module is executed:
+        entriesByDate = DatedLedger(self.filePath).groupByDate()
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(entriesByDate, {
+            '2026-10-13': [['Boots', '180']],
+            '2026-10-15': [['Coat', '220'], ['Shirt, linen', '25']],
+        })
+        self.assertEqual(list(entriesByDate), ['2026-10-13', '2026-10-15'])
+
+    def testShouldRejectRowsWithoutValidDates(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.writeFile('2026-10-13,Boots,180\n10/15/2026,Coat,220\n')
+        # WHEN the following module is executed:
+        with self.assertRaises(ValueError) as raised:
+            DatedLedger(self.filePath).groupByDate()
+        # THEN the observable behavior should be verified as stated below:
+        self.assertIn('line 2', str(raised.exception))
+
+
+class SqliteLedgerTests(unittest.TestCase):
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.sqliteLedger = SqliteLedger(os.path.join(self.temporaryDirectory.name, 'ledger.sqlite3'))
+        self.taxRules = TaxRuleTable({'standard': '0.13', 'food': '0'}, [TaxRule('prefix', 'bagel', 'food')])
+
+    def tearDown(self):
+        self.sqliteLedger.close()
+        self.temporaryDirectory.cleanup()
+
+    def recordDay(self, isoDate, items, replacesDay=True, firstPosition=0):
+        budgetInfo = Cost(items, taxRules=self.taxRules).streamBudgetInfo('formatted')
+        self.sqliteLedger.beginDay(isoDate, replacesDay)
+        rows = list(self.sqliteLedger.passThrough(isoDate, budgetInfo.costTable, self.taxRules, firstPosition))
+        self.sqliteLedger.commitDay(isoDate, len(rows) - 1 + firstPosition, [0.0, 0.0, 0.0])
+        return rows
+
+    def testShouldPassRowsThroughAndAnswerItemAndCategoryTotals(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        passedRows = self.recordDay('2026-10-13', [['Coffee', '4'], ['Bagel', '2.50']])
+        self.recordDay('2026-10-20', [['coffee', '3']])
+        # WHEN the following module is executed:
+        itemTotals = self.sqliteLedger.itemTotals('COFFEE', '2026-10-01', '2026-10-31')
+        categoryTotals = self.sqliteLedger.categoryTotals('2026-10-01', '2026-10-14')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(passedRows[0], ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'])
+        self.assertEqual(itemTotals, LedgerTotals(2, 7.0, 7.91, 0.91))
+        self.assertEqual(categoryTotals, {
+            'food': LedgerTotals(1, 2.5, 2.5, 0.0),
+            'standard': LedgerTotals(1, 4.0, 4.52, 0.52),
+        })
+
+    def testShouldReplaceRebuiltDaysAndExtendResumedDays(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.recordDay('2026-10-13', [['Coffee', '4'], ['Hat', '10']])
+        self.recordDay('2026-10-13', [['Coffee', '4']])
+        # WHEN the following module is executed:
+        self.recordDay('2026-10-13', [['Mug', '6']], replacesDay=False, firstPosition=1)
+        # THEN the observable behavior should be verified as stated below:
+        self.assertTrue(self.sqliteLedger.holdsItemRows('2026-10-13', 2))
+        self.assertEqual(self.sqliteLedger.rangeTotals('2026-10-13', '2026-10-13').numberOfItems, 2)
+        self.assertEqual(self.sqliteLedger.itemTotals('Hat', '2026-10-13', '2026-10-13').numberOfItems, 0)
+        self.assertEqual(self.sqliteLedger.categoryTotals('2026-10-13', '2026-10-13')['standard'].grossPrice, 10.0)
+
+    def testShouldCreateTheMissingLedgerDirectoryOnFirstConnect(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        databasePath = os.path.join(self.temporaryDirectory.name, 'Spreadsheets', '2026', 'ledger.sqlite3')
+        sqliteLedger = SqliteLedger(databasePath)
+        # WHEN the following module is executed:
+        rangeTotals = sqliteLedger.rangeTotals('2026-10-01', '2026-10-31')
+        sqliteLedger.close()
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(rangeTotals, LedgerTotals(0, 0.0, 0.0, 0.0))
+        self.assertTrue(os.path.exists(databasePath))
+
+    def testShouldLeaveTheWriteLockFreeWhileRowsStreamThrough(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.recordDay('2026-10-13', [['Hat', '10']])
+        budgetInfo = Cost([['Coffee', '4'], ['Mug', '6']], taxRules=self.taxRules).streamBudgetInfo('formatted')
+        otherWriter = SqliteLedger(self.sqliteLedger.databasePath)
+        otherWriter.busyTimeoutSeconds = 0
+        self.sqliteLedger.beginDay('2026-10-13', replacesDay=True)
+        # WHEN the following module is executed:
+        passedRows = list(self.sqliteLedger.passThrough('2026-10-13', budgetInfo.costTable, self.taxRules))
+        otherWriter.connect().execute('BEGIN IMMEDIATE')
+        otherWriter.commit()
+        otherWriter.close()
+        itemsBeforeCommit = self.sqliteLedger.itemTotals('Hat', '2026-10-13', '2026-10-13').numberOfItems
+        self.sqliteLedger.commitDay('2026-10-13', len(passedRows) - 1, [10.0, 11.3, 1.3])
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(itemsBeforeCommit, 1)
+        self.assertTrue(self.sqliteLedger.holdsItemRows('2026-10-13', 2))
+        self.assertEqual(self.sqliteLedger.itemTotals('Hat', '2026-10-13', '2026-10-13').numberOfItems, 0)
+
+
+class RollupsTests(unittest.TestCase):
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.sqliteLedger = SqliteLedger(os.path.join(self.temporaryDirectory.name, 'ledger.sqlite3'))
+        self.rollups = Rollups(self.sqliteLedger)
+
+    def tearDown(self):
+        self.sqliteLedger.close()
+        self.temporaryDirectory.cleanup()
+
+    def recordDay(self, isoDate, weekOfMonth, numberOfItems, totals):
+        self.sqliteLedger.beginDay(isoDate, replacesDay=True)
+        self.sqliteLedger.commitDay(isoDate, numberOfItems, totals, weekOfMonth)
+
+    def testShouldRollDaysUpIntoWeekMonthAndYearTotals(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.recordDay('2026-09-30', 5, 1, [10.0, 11.3, 1.3])
+        self.recordDay('2026-10-13', 3, 2, [4.0, 4.52, 0.52])
+        self.recordDay('2026-10-15', 3, 1, [2.5, 2.5, 0.0])
+        self.recordDay('2026-10-20', 4, 3, [30.0, 33.9, 3.9])
+        # WHEN the following module is executed:
+        weekSummary = self.rollups.weekSummary('2026-10-15', 3)
+        monthSummary = self.rollups.monthSummary('2026-10-15')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(weekSummary[1:], [
+            ['2026-10-13', 2, 4.0, 4.52, 0.52],
+            ['2026-10-15', 1, 2.5, 2.5, 0.0],
+            ['Week 3', 3, 6.5, 7.02, 0.52],
+        ])
+        self.assertEqual(monthSummary[1:], [
+            ['Week 3', 3, 6.5, 7.02, 0.52],
+            ['Week 4', 3, 30.0, 33.9, 3.9],
+            ['October 2026', 6, 36.5, 40.92, 4.42],
+            ['2026 Through October', 7, 46.5, 52.22, 5.72],
+        ])
+
+    def testShouldRecomputeOnlyTheParentsOfARewrittenDay(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        self.recordDay('2026-10-13', 3, 2, [4.0, 4.52, 0.52])
+        self.recordDay('2026-10-20', 4, 3, [30.0, 33.9, 3.9])
+        self.sqliteLedger.connect().execute(
+            "UPDATE rollupTotals SET numberOfItems = 99 WHERE granularity = 'week' AND period = '2026-10-W4'"
+        )
+        # WHEN the following module is executed:
+        self.recordDay('2026-10-13', 3, 1, [1.0, 1.13, 0.13])
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(self.rollups.totals('week', '2026-10-W3'), LedgerTotals(1, 1.0, 1.13, 0.13))
+        self.assertEqual(self.rollups.totals('week', '2026-10-W4').numberOfItems, 99)
+        self.assertEqual(self.rollups.totals('month', '2026-10'), LedgerTotals(100, 31.0, 35.03, 4.03))
+        self.assertEqual(self.rollups.totals('year', '2026'), LedgerTotals(100, 31.0, 35.03, 4.03))
+
+
+class PriceParserTests(unittest.TestCase):
+    def testShouldParseCurrencySymbolsAndThousandsSeparators(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        priceParser = PriceParser()
+        prices = ['4', ' 4.50', '$4.50', '-$1,234.50', '1,234', '12.99€']
+        # WHEN the following module is executed:
+        result = [priceParser.parse(price) for price in prices]
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(result, [4, 4.5, 4.5, -1234.5, 1234, 12.99])
+        self.assertEqual([type(price) for price in result[:2]], [int, float])
+
+    def testShouldCollectRejectedRowsInsteadOfRaising(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        cost = Cost([['Boots', '$180'], ['Coat', '4,50'], ['Shirt', '25'], ['Hat', 'nan']])
+        # WHEN the following module is executed:
+        budgetInfo = cost.getBudgetInfo('formatted')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(budgetInfo[1:3], [['Boots', 180, 203.4, 23.4], ['Shirt', 25, 28.25, 3.25]])
+        self.assertEqual([(reject.entryNumber, reject.reason) for reject in cost.priceParser.rejects], [
+            (2, 'decimal comma'), (4, 'not a price'),
+        ])
+
+
 class SummaryTableConsolidatorTests(unittest.TestCase):
 
     def testShouldConsolidateCostDetailsGivenTableAndSummary(self):
@@ -196,5 +1011,44 @@ class SummaryTableConsolidatorTests(unittest.TestCase):
 
         
 
+
+class InstrumentationTests(unittest.TestCase):
+    def runStages(self, instrumentation):
+        instrumentation.measure('parse', lambda: bytearray(4 * 1024 * 1024))
+        rows = list(instrumentation.measureIterable('cost', iter([['Mug', 3], ['Hat', 10], ['Tea', 2]])))
+        return rows, instrumentation.finish()
+
+    def testShouldWriteOneMetricsRecordPerStageWithRowsAndTracedPeaks(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        with tempfile.TemporaryDirectory() as directory:
+            metricsFile = os.path.join(directory, 'metrics.jsonl')
+            instrumentation = StageInstrumentation(JsonLinesMetricsWriter(metricsFile), traceMemory=True)
+            # WHEN the following module is executed:
+            rows, stageMetrics = self.runStages(instrumentation)
+            with open(metricsFile, 'r', encoding='utf-8') as file:
+                records = [json.loads(line) for line in file]
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(rows, [['Mug', 3], ['Hat', 10], ['Tea', 2]])
+        self.assertEqual([record['stage'] for record in records], ['parse', 'cost'])
+        self.assertEqual([record['rows'] for record in records], [None, 3])
+        self.assertGreaterEqual(records[0]['peakBytes'], 4 * 1024 * 1024)
+        self.assertIsInstance(records[1]['peakBytes'], int)
+        self.assertTrue(all(record['wallSeconds'] >= 0 and record['cpuSeconds'] >= 0 for record in records))
+        self.assertEqual([metrics.stage for metrics in stageMetrics], ['parse', 'cost'])
+
+    def testShouldPrintTracedPeaksWhenNoMetricsFileIsGiven(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        instrumentation = createInstrumentation(traceMemory=True)
+        printedSummary = io.StringIO()
+        # WHEN the following module is executed:
+        with redirect_stdout(printedSummary):
+            self.runStages(instrumentation)
+        # THEN the observable behavior should be verified as stated below:
+        printedLines = printedSummary.getvalue().splitlines()
+        self.assertEqual([line.split()[0] for line in printedLines], ['parse', 'cost'])
+        self.assertTrue(all(line.endswith('peak bytes') for line in printedLines))
+        self.assertIn('3 rows', printedLines[1])
+
+
 if __name__ == '__main__':
     unittest.main(testRunner=ColourTextTestRunner(verbosity=2))
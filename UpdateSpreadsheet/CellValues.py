@@ -0,0 +1,70 @@
+from numbers import Number
+
+from UpdateSpreadsheet.dataObjects import COLUMN_WIDTH_PADDING
+
+# Shared by every writer: the kind of a cell value depends only on its type, so the cache never goes stale.
+valueKindsByType = {}
+
+
+def getValueKind(value) -> str:
+    valueKind = valueKindsByType.get(type(value))
+    if valueKind is None:
+        valueKind = valueKindsByType[type(value)] = classifyValue(value)
+    return valueKind
+
+
+def classifyValue(value) -> str:
+    if value is None:
+        return 'empty'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, Number):
+        return 'number'
+    return 'text'
+
+
+class ColumnWidthMeter:
+    def __init__(self, formatsCurrency: bool, plainColumnCount: int = 1):
+        self.formatsCurrency = formatsCurrency
+        self.plainColumnCount = plainColumnCount
+        self.numberOfRows = 0
+        self.columnWidths = []
+        self.filledCellCounts = []
+
+    def measure(self, row: list) -> list[bool]:
+        self.numberOfRows += 1
+        currencyFlags = []
+        for columnIndex, value in enumerate(row):
+            if columnIndex == len(self.columnWidths):
+                self.columnWidths.append(0)
+                self.filledCellCounts.append(0)
+            isCurrency = self.isCurrency(columnIndex, value)
+            displayedLength = len(self.getDisplayedValue(value, isCurrency))
+            if displayedLength > self.columnWidths[columnIndex]:
+                self.columnWidths[columnIndex] = displayedLength
+            self.filledCellCounts[columnIndex] += 1
+            currencyFlags.append(isCurrency)
+        return currencyFlags
+
+    def getColumnWidths(self) -> list:
+        emptyCellLength = len(str(None))
+        columnWidths = []
+        for columnIndex, columnWidth in enumerate(self.columnWidths):
+            if self.filledCellCounts[columnIndex] < self.numberOfRows:
+                columnWidth = max(columnWidth, emptyCellLength)
+            columnWidths.append(columnWidth + COLUMN_WIDTH_PADDING)
+        return columnWidths
+
+    def pad(self, row: list, fillValue=None) -> list:
+        return list(row) + [fillValue] * (len(self.columnWidths) - len(row))
+
+    def isCurrency(self, columnIndex: int, value) -> bool:
+        return self.formatsCurrency and columnIndex >= self.plainColumnCount and self.isNumber(value)
+
+    def isNumber(self, value) -> bool:
+        return getValueKind(value) == 'number'
+
+    def getDisplayedValue(self, value, isCurrency: bool) -> str:
+        if isCurrency:
+            return '${0:.2f}'.format(value)
+        return str(value)
@@ -1,9 +1,13 @@
-import pendulum
-from typing import Callable, NamedTuple
+from functools import lru_cache
+from typing import NamedTuple
 
-class DateFormats(NamedTuple):
+class DateContext(NamedTuple):
     iso: str
     spreadsheet: str
+    monthName: str
+    weekOfMonth: int
+    weekStart: str
+    weekdays: tuple[str, ...]
 
 def getCurrentDate():
     dateFromPendulum = getDateFromPendulum
@@ -11,12 +15,28 @@ def getCurrentDate():
 
 def getCurrentDateObject(dateProvider):
     dateStr = dateProvider()
-    dateObj = pendulum.parse(dateStr)
+    return getDateContext(dateStr)
 
-    isoFormat = dateObj.format('YYYY-MM-DD')
-    spreadsheetFormat = dateObj.format('MMM.DD.YYYY')
+@lru_cache(maxsize=4096)
+def getDateContext(dateStr):
+    import pendulum
+    dateObj = pendulum.parse(dateStr)
+    startOfWeek = getStartOfWeek(dateObj)
+    return DateContext(
+        iso=dateObj.format('YYYY-MM-DD'),
+        spreadsheet=dateObj.format('MMM.DD.YYYY'),
+        monthName=dateObj.format('MMMM'),
+        weekOfMonth=dateObj.week_of_month,
+        weekStart=startOfWeek.format('YYYY-MM-DD'),
+        weekdays=tuple(startOfWeek.add(days=dayNumber).format('MMM.DD.YYYY') for dayNumber in range(7)),
+    )
 
-    return DateFormats(iso=isoFormat, spreadsheet=spreadsheetFormat)
+def getStartOfWeek(dateObj):
+    dayOfWeek = dateObj.day_of_week
+    if dayOfWeek == 6:
+        return dateObj
+    return dateObj.subtract(days=dayOfWeek + 1)
 
 def getDateFromPendulum():
+    import pendulum
     return pendulum.now().to_date_string()
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-import pendulum
 import os
-import openpyxl
+import shutil
+import tempfile
+
+from UpdateSpreadsheet.DateTranslator import getDateContext
 
 
 class FileSystem:
@@ -10,8 +12,13 @@ class FileSystem:
 
     def setUpSpreadsheet(self, date):
         monthFolder = self.createSpreadsheetMonthFolder(date)
-        workbook = self.createSpreadsheetFile(monthFolder, date)
-        return workbook
+        spreadsheet = self.createSpreadsheetFile(monthFolder, date)
+        return spreadsheet
+
+    def setUpMonthSummary(self, date):
+        monthFolder = self.createSpreadsheetMonthFolder(date)
+        fileCreator = FileCreator(monthFolder)
+        return SpreadsheetFile(fileCreator.completeFileName('Month Summary'), lambda filePath: fileCreator.createWorkbook())
 
     def createSpreadsheetMonthFolder(self, date):
         directoryCreator = DirectoryCreator(self.spreadsheetParentDirectory)
@@ -46,7 +53,7 @@ class MonthDirectory(FileSystemInterface):
         return self.makeFolderRepresentingTheMonthOfSpreadsheet(monthOfCurrentDate)
 
     def getMonthOfCurrentDate(self, currentDate):
-        return pendulum.parse(currentDate).format('MMMM')
+        return getDateContext(currentDate).monthName
 
     def makeFolderRepresentingTheMonthOfSpreadsheet(self, monthName):
         spreadsheetMonthDirectory = self.folderCreator.createDirectory(monthName)
@@ -83,36 +90,90 @@ class SpreadsheetFileCreator(FileSystemInterface):
     def create(self):
         weekWithinMonth = self.getWeekInMonth(self.currentDate)
         spreadsheetFileName = self.getSpreadsheetFileName(weekWithinMonth)
-        spreadsheetFile =  self.createSpreadsheetOnFileSystem(spreadsheetFileName)
-        workbook = self.getWorkbook(spreadsheetFile)
-        return {'FilePath': spreadsheetFile, 'Workbook': workbook}
+        spreadsheetFile = self.fileCreator.completeFileName(spreadsheetFileName)
+        return SpreadsheetFile(spreadsheetFile, self.getWorkbook)
 
     def getWeekInMonth(self, isoDate):
-        date = pendulum.parse(isoDate)
-        return date.week_of_month
+        return getDateContext(isoDate).weekOfMonth
 
     def getSpreadsheetFileName(self, weekWithinMonth):
         return f'Week {weekWithinMonth}'
 
-    def createSpreadsheetOnFileSystem(self, spreadsheetFileName):
-        return self.fileCreator.createFile(spreadsheetFileName)
-
     def getWorkbook(self, spreadsheetFilePath):
-        return openpyxl.load_workbook(spreadsheetFilePath)
+        import openpyxl
+        if os.path.exists(spreadsheetFilePath):
+            return openpyxl.load_workbook(spreadsheetFilePath)
+        return self.fileCreator.createWorkbook()
+
+
+class SpreadsheetFile:
+    def __init__(self, filePath, workbookLoader):
+        self.filePath = filePath
+        self.workbookLoader = workbookLoader
+        self.workbook = None
+        self.isNew = not os.path.exists(filePath)
+
+    def __getitem__(self, key):
+        if key == 'FilePath':
+            return self.filePath
+        if key == 'Workbook':
+            return self.getWorkbook()
+        raise KeyError(key)
+
+    def getWorkbook(self):
+        if self.workbook is None:
+            self.workbook = self.workbookLoader(self.filePath)
+        return self.workbook
+
+    def useWorkbook(self, workbook):
+        self.workbook = workbook
+
+    def save(self):
+        workbook = self.getWorkbook()
+        fileDescriptor, temporaryPath = tempfile.mkstemp(suffix='.xlsx', dir=os.path.dirname(self.filePath) or None)
+        os.close(fileDescriptor)
+        try:
+            workbook.save(temporaryPath)
+            self.matchFileMode(temporaryPath)
+            self.flushToDisk(temporaryPath)
+            os.replace(temporaryPath, self.filePath)
+        except BaseException:
+            os.remove(temporaryPath)
+            raise
+        self.flushDirectory()
+
+    def matchFileMode(self, temporaryPath):
+        if os.path.exists(self.filePath):
+            shutil.copymode(self.filePath, temporaryPath)
+            return
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temporaryPath, 0o666 & ~umask)
+
+    def flushToDisk(self, temporaryPath):
+        with open(temporaryPath, 'rb+') as file:
+            os.fsync(file.fileno())
+
+    def flushDirectory(self):
+        try:
+            directoryDescriptor = os.open(os.path.dirname(self.filePath) or '.', os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(directoryDescriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(directoryDescriptor)
 
 
 class FileCreator:
     def __init__(self, parentDirectory):
         self.parentDirectory = parentDirectory
 
-    def createFile(self, fileName):
-       completeFileName = self.completeFileName(fileName) 
-       self.createSpreadsheetFile(completeFileName)
-       return completeFileName
-
     def completeFileName(self, fileName):
         return f"{self.parentDirectory}{fileName}.xlsx"
 
-    def createSpreadsheetFile(self, completeFileName):
-        workbook = openpyxl.Workbook()
-        workbook.save(completeFileName)
+    def createWorkbook(self):
+        import openpyxl
+        return openpyxl.Workbook()
@@ -0,0 +1,51 @@
+from UpdateSpreadsheet.WorkbookPopulator import DefaultWorksheetEraser
+from UpdateSpreadsheet.XlsxExporter import XlsxWorkbookExporter
+
+WEEK_SUMMARY_WORKSHEET = 'Week Summary'
+MONTH_SUMMARY_WORKSHEET = 'Month Summary'
+
+
+class RollupTable:
+    formatType = 'formatted'
+    plainColumnCount = 2
+
+    def __init__(self, rollupRows):
+        self.rollupRows = rollupRows
+
+    def __iter__(self):
+        return iter(self.rollupRows)
+
+
+class RollupSheetDepositor:
+    def __init__(self, worksheetWriter='standard'):
+        self.worksheetWriter = worksheetWriter
+
+    def depositWeekSummary(self, workbook, rollupRows):
+        return self.deposit(workbook, WEEK_SUMMARY_WORKSHEET, rollupRows)
+
+    def saveMonthSummary(self, spreadsheetFile, rollupRows):
+        spreadsheetFile.useWorkbook(self.deposit(self.createWorkbook(), MONTH_SUMMARY_WORKSHEET, rollupRows))
+        spreadsheetFile.save()
+
+    def createWorkbook(self):
+        if self.worksheetWriter == 'xml':
+            return XlsxWorkbookExporter([])
+        from openpyxl import Workbook
+        if self.worksheetWriter == 'streaming':
+            return Workbook(write_only=True)
+        return DefaultWorksheetEraser(Workbook()).getCleanWorkbook()
+
+    def deposit(self, workbook, worksheetName, rollupRows):
+        rollupRows = RollupTable(rollupRows)
+        if self.worksheetWriter == 'xml':
+            workbook.insert(worksheetName, rollupRows)
+        elif self.worksheetWriter == 'streaming':
+            from UpdateSpreadsheet.StreamingWorksheetWriter import StreamingWorksheetDataDepositor
+            StreamingWorksheetDataDepositor(workbook, worksheetName).insert(rollupRows)
+        else:
+            from UpdateSpreadsheet.WorksheetFormatter import SpreadsheetFormatter
+            from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+            depositor = WorksheetDataDepositor(workbook, worksheetName)
+            depositor.replace(rollupRows)
+            SpreadsheetFormatter(workbook[worksheetName], depositor.getRowTypes()).apply()
+        return workbook
@@ -0,0 +1,149 @@
+import pickle
+import tempfile
+from copy import copy
+
+import openpyxl
+from openpyxl.cell.cell import Cell
+from openpyxl.utils import get_column_letter
+
+from UpdateSpreadsheet.CellValues import ColumnWidthMeter
+from UpdateSpreadsheet.FontFormatter import TypeOfRowIdentifier
+from UpdateSpreadsheet.StyleRegistry import StyleRegistry
+from UpdateSpreadsheet.dataObjects import (
+    BODY_FONT_PROFILE,
+    BOTTOM_LEFT_ALIGNMENT,
+    CURRENCY_NUMBER_FORMAT,
+    HEADER_FONT_PROFILE,
+    ROW_HEIGHT,
+)
+
+class StreamingWorksheetDataDepositor:
+    def __init__(self, workbook: openpyxl.Workbook, worksheetName: str):
+        self.workbook: openpyxl.Workbook = workbook
+        self.worksheetName: str = worksheetName
+
+    def insert(self, budgetInfo) -> openpyxl.Workbook:
+        dateWorksheet = self._ensureWorksheetExistsInWorkbook(self.workbook, self.worksheetName)
+        worksheetFormatter = StreamingWorksheetFormatter(
+            dateWorksheet, self._hasFormattedAmounts(budgetInfo), getattr(budgetInfo, 'plainColumnCount', 1)
+        )
+        with RowSpool() as rowSpool:
+            for row in budgetInfo:
+                worksheetFormatter.measure(row)
+                rowSpool.append(row)
+            worksheetFormatter.applyColumnWidths()
+            for rowNumber, row in enumerate(rowSpool, start=1):
+                self._appendRow(dateWorksheet, rowNumber, worksheetFormatter.style(row))
+        return self.workbook
+
+    def _ensureWorksheetExistsInWorkbook(self, workbook: openpyxl.Workbook, worksheetName: str):
+        try:
+            return workbook[worksheetName]
+        except KeyError:
+            return self.workbook.create_sheet(worksheetName)
+
+    def _hasFormattedAmounts(self, budgetInfo) -> bool:
+        return getattr(budgetInfo, 'formatType', None) == 'formatted'
+
+    def _appendRow(self, dateWorksheet, rowNumber: int, styledRow: list) -> None:
+        dateWorksheet.row_dimensions[rowNumber].height = ROW_HEIGHT
+        dateWorksheet.append(styledRow)
+        del dateWorksheet.row_dimensions[rowNumber]
+
+
+class StreamingWorksheetFormatter:
+    def __init__(self, worksheet, formatsCurrency: bool, plainColumnCount: int = 1):
+        self.worksheet = worksheet
+        self.columnWidthMeter = ColumnWidthMeter(formatsCurrency, plainColumnCount)
+        self.styles = {
+            ('Header', False): self._createStyle('Budget Header', HEADER_FONT_PROFILE, 'General'),
+            ('Body', False): self._createStyle('Budget Body', BODY_FONT_PROFILE, 'General'),
+            ('Body', True): self._createStyle('Budget Currency', BODY_FONT_PROFILE, CURRENCY_NUMBER_FORMAT),
+        }
+
+    def measure(self, row: list) -> None:
+        self.columnWidthMeter.measure(row)
+
+    def applyColumnWidths(self) -> None:
+        for columnIndex, columnWidth in enumerate(self.columnWidthMeter.getColumnWidths()):
+            columnLetter = get_column_letter(columnIndex + 1)
+            self.worksheet.column_dimensions[columnLetter].width = columnWidth
+
+    def style(self, row: list) -> list:
+        typeOfRow = TypeOfRowIdentifier(self.worksheet).typeOfRow(row)
+        paddedRow = self.columnWidthMeter.pad(row)
+        return [
+            self._createCell(value, self.styles[typeOfRow, self.columnWidthMeter.isCurrency(columnIndex, value)])
+            for columnIndex, value in enumerate(paddedRow)
+        ]
+
+    def _createCell(self, value, styleName: str) -> Cell:
+        cell = Cell(self.worksheet, row=1, column=1, value=value)
+        cell.style = styleName
+        return cell
+
+    def _createStyle(self, styleName: str, fontProfile, numberFormat: str) -> str:
+        styleRegistry = StyleRegistry.forWorkbook(self.worksheet.parent)
+        return styleRegistry.getNamedStyle(styleName, fontProfile, BOTTOM_LEFT_ALIGNMENT, numberFormat)
+
+
+class StreamingWorkbookCopier:
+    def __init__(self, sourceWorkbook: openpyxl.Workbook):
+        self.sourceWorkbook: openpyxl.Workbook = sourceWorkbook
+
+    def copyInto(self, targetWorkbook: openpyxl.Workbook, *skippedWorksheetNames: str) -> openpyxl.Workbook:
+        for sourceWorksheet in self.sourceWorkbook.worksheets:
+            if sourceWorksheet.title in skippedWorksheetNames:
+                continue
+            targetWorksheet = self._ensureWorksheetExistsInWorkbook(targetWorkbook, sourceWorksheet.title)
+            self._copyWorksheet(sourceWorksheet, targetWorksheet)
+        return targetWorkbook
+
+    def _ensureWorksheetExistsInWorkbook(self, workbook: openpyxl.Workbook, worksheetName: str):
+        try:
+            return workbook[worksheetName]
+        except KeyError:
+            return workbook.create_sheet(worksheetName)
+
+    def _copyWorksheet(self, sourceWorksheet, targetWorksheet) -> None:
+        for columnLetter, columnDimension in sourceWorksheet.column_dimensions.items():
+            targetWorksheet.column_dimensions[columnLetter].width = columnDimension.width
+        for rowNumber, row in enumerate(sourceWorksheet.iter_rows(), start=1):
+            rowDimension = sourceWorksheet.row_dimensions.get(rowNumber)
+            if rowDimension is not None and rowDimension.height is not None:
+                targetWorksheet.row_dimensions[rowNumber].height = rowDimension.height
+            targetWorksheet.append([self._copyCell(targetWorksheet, cell) for cell in row])
+            targetWorksheet.row_dimensions.pop(rowNumber, None)
+
+    def _copyCell(self, targetWorksheet, sourceCell) -> Cell:
+        targetCell = Cell(targetWorksheet, row=1, column=1, value=sourceCell.value)
+        if sourceCell.has_style:
+            targetCell.font = copy(sourceCell.font)
+            targetCell.fill = copy(sourceCell.fill)
+            targetCell.border = copy(sourceCell.border)
+            targetCell.alignment = copy(sourceCell.alignment)
+            targetCell.protection = copy(sourceCell.protection)
+            targetCell.number_format = sourceCell.number_format
+        return targetCell
+
+
+class RowSpool:
+    def __init__(self):
+        self.spoolFile = tempfile.TemporaryFile()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exceptionInfo):
+        self.spoolFile.close()
+
+    def append(self, row: list) -> None:
+        pickle.dump(row, self.spoolFile, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def __iter__(self):
+        self.spoolFile.seek(0)
+        while True:
+            try:
+                yield pickle.load(self.spoolFile)
+            except EOFError:
+                return
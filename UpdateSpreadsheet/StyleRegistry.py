@@ -0,0 +1,49 @@
+from weakref import WeakKeyDictionary
+
+from openpyxl.styles import Alignment, Font, NamedStyle
+
+
+class StyleRegistry:
+    registries = WeakKeyDictionary()
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.fonts = {}
+        self.alignments = {}
+
+    @classmethod
+    def forWorkbook(cls, workbook):
+        styleRegistry = cls.registries.get(workbook)
+        if styleRegistry is None:
+            styleRegistry = cls(workbook)
+            cls.registries[workbook] = styleRegistry
+        return styleRegistry
+
+    def applyFont(self, cell, fontProfile) -> None:
+        cell.font = self.getFont(fontProfile)
+
+    def applyAlignment(self, cell, alignmentProfile) -> None:
+        cell.alignment = self.getAlignment(alignmentProfile)
+
+    def getFont(self, fontProfile) -> Font:
+        font = self.fonts.get(fontProfile)
+        if font is None:
+            font = self.fonts[fontProfile] = Font(name=fontProfile.name, size=fontProfile.size, bold=fontProfile.boldToggle)
+        return font
+
+    def getAlignment(self, alignmentProfile) -> Alignment:
+        alignment = self.alignments.get(alignmentProfile)
+        if alignment is None:
+            alignment = self.alignments[alignmentProfile] = Alignment(horizontal=alignmentProfile.horizontal, vertical=alignmentProfile.vertical)
+        return alignment
+
+    def getNamedStyle(self, styleName, fontProfile, alignmentProfile, numberFormat) -> str:
+        if styleName not in self.workbook.named_styles:
+            namedStyle = NamedStyle(
+                name=styleName,
+                font=self.getFont(fontProfile),
+                alignment=self.getAlignment(alignmentProfile),
+                number_format=numberFormat,
+            )
+            self.workbook.add_named_style(namedStyle)
+        return styleName
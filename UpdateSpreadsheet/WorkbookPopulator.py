@@ -1,4 +1,4 @@
-import pendulum
+from UpdateSpreadsheet.DateTranslator import getDateContext
 
 
 class WorkbookPopulator:
@@ -19,7 +19,8 @@ class WorkbookPopulator:
 
     def insertDateWorksheetsInWorkbook(self, workbook, daysWithinWeek):
         for day in daysWithinWeek:
-            workbook.create_sheet(day)
+            if day not in workbook.sheetnames:
+                workbook.create_sheet(day)
         return workbook
 
 
@@ -29,13 +30,19 @@ class DefaultWorksheetEraser:
 
     def getCleanWorkbook(self):
         defaultWorksheet = self.getDefaultWorksheet(self.workbook)
-        self.removeDefaultWorksheet(defaultWorksheet)
+        if self.isUntouchedDefaultWorksheet(defaultWorksheet):
+            self.removeDefaultWorksheet(defaultWorksheet)
         return self.workbook
 
     def getDefaultWorksheet(self, workbook):
         defaultWorksheet = workbook.active
         return defaultWorksheet
 
+    def isUntouchedDefaultWorksheet(self, worksheet):
+        if worksheet is None or worksheet.title != 'Sheet':
+            return False
+        return worksheet.max_row == 1 and worksheet.max_column == 1 and worksheet['A1'].value is None
+
     def removeDefaultWorksheet(self, defaultWorksheet):
         self.workbook.remove(defaultWorksheet)
 
@@ -45,25 +52,4 @@ class WeekNormalizer:
         self.currentDate = currentDate
 
     def getWeekdays(self):
-        currentDate = self.encodeCurrentDate(self.currentDate)
-        startOfWeek = self.standardizeWeekToSunday(currentDate)
-        return self.convertDateTimeObjectsToString(self.getListOfDatesForTheWeek(startOfWeek))
-
-    def encodeCurrentDate(self, currentDate):
-        return pendulum.parse(currentDate)
-
-    def standardizeWeekToSunday(self, currentDate):
-        dayOfWeek = currentDate.day_of_week
-        if dayOfWeek == 6:
-            startOfWeek = currentDate
-        else:
-            startOfWeek = currentDate.subtract(days=dayOfWeek + 1)
-        return startOfWeek
-
-    def getListOfDatesForTheWeek(self, startOfWeek):
-        getDates = lambda dayNumber: startOfWeek.add(days=dayNumber)
-        return list(map(getDates, range(7)))
-
-    def convertDateTimeObjectsToString(self, dateTimeObjects):
-        convert = lambda dateTime: dateTime.format('MMM.DD.YYYY')
-        return list(map(convert, dateTimeObjects))
+        return list(getDateContext(self.currentDate).weekdays)
@@ -1,63 +1,56 @@
-from openpyxl.styles import Alignment
-
-from UpdateSpreadsheet.FontFormatter import FontFormatter
-from UpdateSpreadsheet.dataObjects import FontProfile
+from openpyxl.utils import get_column_letter
+
+from UpdateSpreadsheet.FontFormatter import TypeOfRowIdentifier
+from UpdateSpreadsheet.StyleRegistry import StyleRegistry
+from UpdateSpreadsheet.dataObjects import (
+    BODY_FONT_PROFILE,
+    BOTTOM_LEFT_ALIGNMENT,
+    COLUMN_WIDTH_PADDING,
+    CURRENCY_NUMBER_FORMAT,
+    HEADER_FONT_PROFILE,
+    ROW_HEIGHT,
+)
 from UpdateSpreadsheet.dataTypes import ExcelWorkbook, ExcelWorksheet
 
 
 class SpreadsheetFormatter:
-    def __init__(self, worksheet):
+    fontProfiles = {'Header': HEADER_FONT_PROFILE, 'Body': BODY_FONT_PROFILE}
+
+    def __init__(self, worksheet, rowTypes=None):
         self.worksheet = worksheet
         self.dataRows = worksheet.max_row
+        self.rowTypes = rowTypes
+        self.rowIdentifier = TypeOfRowIdentifier(worksheet)
+        self.styleRegistry = StyleRegistry.forWorkbook(worksheet.parent)
 
     def apply(self):
-        self.changeHeaderFont()
-        self.changeBodyFont()
-        self.adjustWidthOfColumnsToFit()
-        self.padRowHeight()
-        self.alignCellsBottomLeft()
-
-    def changeHeaderFont(self) -> None:
-        headerFontProfile = FontProfile(
-            "Georgia",
-            18,
-            boldToggle = True
-        )
-        FontFormatter(self.worksheet).changeHeaderFont(headerFontProfile)
-
-    def changeBodyFont(self) -> None:
-        bodyFontProfile = FontProfile(
-            "Helvetica Neue",
-            12.8,
-            boldToggle = False
-        )
-        FontFormatter(self.worksheet).changeBodyFont(bodyFontProfile)
-
-    def adjustWidthOfColumnsToFit(self) -> None:
-        for column in self.worksheet.iter_cols():
-            currentColumnIndex = ""
-            maxLengthOfCellInColumn = 0
-
-            for cell in column:
-                currentColumnIndex = cell.column_letter
-                lengthOfCellValue = len(str(cell.value))
-                if lengthOfCellValue > maxLengthOfCellInColumn:
-                    maxLengthOfCellInColumn = lengthOfCellValue
-
-            self.worksheet.column_dimensions[currentColumnIndex].width = maxLengthOfCellInColumn + 8
-
-    def padRowHeight(self) -> None:
-        idealRowHeight = 27
-        for row in range(1, self.dataRows + 1):
-            self.worksheet.row_dimensions[row].height = idealRowHeight
-
-    def alignCellsBottomLeft(self) -> None:
-        for row in self.worksheet.iter_rows(
+        columnWidths = [0] * self.worksheet.max_column
+        for rowNumber, row in enumerate(self.worksheet.iter_rows(
                 max_row=self.dataRows,
-                max_col=self.worksheet.max_column
-        ):
-            for cell in row:
-                cell.alignment = Alignment(
-                    horizontal="left",
-                    vertical="bottom"
-                )
+                max_col=len(columnWidths)
+        ), start=1):
+            fontProfile = self.fontProfiles[self.getTypeOfRow(rowNumber, row)]
+            for columnIndex, cell in enumerate(row):
+                self.formatCell(cell, fontProfile)
+                columnWidths[columnIndex] = max(columnWidths[columnIndex], len(self.getDisplayedValue(cell)))
+            self.worksheet.row_dimensions[rowNumber].height = ROW_HEIGHT
+        self.adjustWidthOfColumnsToFit(columnWidths)
+
+    def getTypeOfRow(self, rowNumber, row) -> str:
+        if self.rowTypes is not None:
+            return self.rowTypes[rowNumber - 1]
+        return self.rowIdentifier.typeOfRow(cell.value for cell in row)
+
+    def formatCell(self, cell, fontProfile) -> None:
+        self.styleRegistry.applyFont(cell, fontProfile)
+        self.styleRegistry.applyAlignment(cell, BOTTOM_LEFT_ALIGNMENT)
+
+    def adjustWidthOfColumnsToFit(self, columnWidths) -> None:
+        for columnIndex, maxLengthOfCellInColumn in enumerate(columnWidths):
+            columnLetter = get_column_letter(columnIndex + 1)
+            self.worksheet.column_dimensions[columnLetter].width = maxLengthOfCellInColumn + COLUMN_WIDTH_PADDING
+
+    def getDisplayedValue(self, cell) -> str:
+        if cell.number_format == CURRENCY_NUMBER_FORMAT:
+            return '${0:.2f}'.format(cell.value)
+        return str(cell.value)
@@ -1,21 +1,90 @@
+from numbers import Number
+
 import openpyxl
+from openpyxl.cell.cell import Cell
+
+from UpdateSpreadsheet.FontFormatter import TypeOfRowIdentifier
+from UpdateSpreadsheet.dataObjects import CURRENCY_NUMBER_FORMAT
 
 class WorksheetDataDepositor:
+    summaryRowCount = 2
+    itemHeader = 'Item'
+
     def __init__(self, workbook: openpyxl.Workbook, worksheetName: str):
         self.workbook: openpyxl.Workbook = workbook
         self.worksheetName: str = worksheetName
+        self.rowTypes: list[str] = []
 
     def insert(self, budgetInfo) -> openpyxl.Workbook:
         dateWorksheet = self._ensureWorksheetExistsInWorkbook(self.workbook, self.worksheetName)
-        self._insertConsolidatedPandasDataInWorksheet(dateWorksheet, budgetInfo)
+        self._insertRows(dateWorksheet, budgetInfo, budgetInfo)
         return self.workbook
 
+    def replace(self, budgetInfo) -> openpyxl.Workbook:
+        self.rowTypes = []
+        if self.worksheetName in self.workbook.sheetnames:
+            worksheetIndex = self.workbook.sheetnames.index(self.worksheetName)
+            self.workbook.remove(self.workbook[self.worksheetName])
+            self.workbook.create_sheet(self.worksheetName, worksheetIndex)
+        return self.insert(budgetInfo)
+
+    def extend(self, budgetInfo) -> openpyxl.Workbook:
+        dateWorksheet = self.workbook[self.worksheetName]
+        dateWorksheet.delete_rows(dateWorksheet.max_row - self.summaryRowCount + 1, self.summaryRowCount)
+        del self.rowTypes[-self.summaryRowCount:]
+        appendedRows = iter(budgetInfo)
+        next(appendedRows)
+        self._insertRows(dateWorksheet, budgetInfo, appendedRows)
+        return self.workbook
+
+    def holdsItemRows(self, numberOfItems: int) -> bool:
+        if self.worksheetName not in self.workbook.sheetnames:
+            return False
+        dateWorksheet = self.workbook[self.worksheetName]
+        if dateWorksheet['A1'].value != self.itemHeader:
+            return False
+        return dateWorksheet.max_row == numberOfItems + self.summaryRowCount + 1
+
+    def getRowTypes(self) -> list[str] | None:
+        if len(self.rowTypes) != self.workbook[self.worksheetName].max_row:
+            return None
+        return self.rowTypes
+
+    def _insertRows(self, dateWorksheet, budgetInfo, rows) -> None:
+        rows = self._recordRowTypes(dateWorksheet, rows)
+        if self._hasFormattedAmounts(budgetInfo):
+            self._insertFormattedDataInWorksheet(dateWorksheet, rows, getattr(budgetInfo, 'plainColumnCount', 1))
+        else:
+            self._insertConsolidatedPandasDataInWorksheet(dateWorksheet, rows)
+
+    def _recordRowTypes(self, dateWorksheet, rows):
+        rowIdentifier = TypeOfRowIdentifier(dateWorksheet)
+        for row in rows:
+            self.rowTypes.append(rowIdentifier.typeOfRow(row))
+            yield row
+
     def _ensureWorksheetExistsInWorkbook(self, workbook: openpyxl.Workbook, worksheetName: str) -> openpyxl.worksheet.worksheet.Worksheet:
         try:
             return workbook[worksheetName]
         except:
             return self.workbook.create_sheet(worksheetName)
 
+    def _hasFormattedAmounts(self, budgetInfo) -> bool:
+        return getattr(budgetInfo, 'formatType', None) == 'formatted'
+
     def _insertConsolidatedPandasDataInWorksheet(self, dateWorksheet, budgetInfo: list[list]) -> None:
         for row in budgetInfo:
             dateWorksheet.append(row)
+
+    def _insertFormattedDataInWorksheet(self, dateWorksheet, budgetInfo, plainColumnCount: int) -> None:
+        for row in budgetInfo:
+            dateWorksheet.append(self._formatAmountsInRow(dateWorksheet, row, plainColumnCount))
+
+    def _formatAmountsInRow(self, dateWorksheet, row: list, plainColumnCount: int) -> list:
+        formattedRow = list(row[:plainColumnCount])
+        for value in row[plainColumnCount:]:
+            if isinstance(value, Number):
+                value = Cell(dateWorksheet, value=value)
+                value.number_format = CURRENCY_NUMBER_FORMAT
+            formattedRow.append(value)
+        return formattedRow
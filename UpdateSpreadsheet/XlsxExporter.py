@@ -0,0 +1,311 @@
+import re
+import shutil
+import tempfile
+import zipfile
+from math import isfinite
+from xml.sax.saxutils import escape, quoteattr
+
+from UpdateSpreadsheet.CellValues import ColumnWidthMeter, getValueKind, valueKindsByType
+from UpdateSpreadsheet.FontFormatter import TypeOfRowIdentifier
+from UpdateSpreadsheet.dataObjects import (
+    BODY_FONT_PROFILE,
+    BOTTOM_LEFT_ALIGNMENT,
+    CURRENCY_NUMBER_FORMAT,
+    HEADER_FONT_PROFILE,
+    ROW_HEIGHT,
+    AlignmentProfile,
+    FontProfile,
+)
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+MAIN_NAMESPACE = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+RELATIONSHIP_NAMESPACE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_RELATIONSHIP_NAMESPACE = 'http://schemas.openxmlformats.org/package/2006/relationships'
+WORKSHEET_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml'
+ILLEGAL_CHARACTERS_PATTERN = re.compile(r'[\000-\010]|[\013-\014]|[\016-\037]')
+BUILTIN_NUMBER_FORMAT_IDS = {
+    'General': 0, '0': 1, '0.00': 2, '#,##0': 3, '#,##0.00': 4,
+    '"$"#,##0_);("$"#,##0)': 5, '"$"#,##0_);[Red]("$"#,##0)': 6,
+    '"$"#,##0.00_);("$"#,##0.00)': 7, '"$"#,##0.00_);[Red]("$"#,##0.00)': 8,
+    '0%': 9, '0.00%': 10, '0.00E+00': 11, '# ?/?': 12, '# ??/??': 13,
+    'mm-dd-yy': 14, 'd-mmm-yy': 15, 'd-mmm': 16, 'mmm-yy': 17, 'h:mm AM/PM': 18, 'h:mm:ss AM/PM': 19,
+    'h:mm': 20, 'h:mm:ss': 21, 'm/d/yy h:mm': 22,
+    '#,##0_);(#,##0)': 37, '#,##0_);[Red](#,##0)': 38, '#,##0.00_);(#,##0.00)': 39, '#,##0.00_);[Red](#,##0.00)': 40,
+    '_(* #,##0_);_(* \\(#,##0\\);_(* "-"_);_(@_)': 41,
+    '_("$"* #,##0_);_("$"* \\(#,##0\\);_("$"* "-"_);_(@_)': 42,
+    '_(* #,##0.00_);_(* \\(#,##0.00\\);_(* "-"??_);_(@_)': 43,
+    '_("$"* #,##0.00_)_("$"* \\(#,##0.00\\)_("$"* "-"??_)_(@_)': 44,
+    'mm:ss': 45, '[h]:mm:ss': 46, 'mmss.0': 47, '##0.0E+0': 48, '@': 49,
+}
+
+
+def getColumnLetter(columnIndex: int) -> str:
+    columnLetter = ''
+    while columnIndex:
+        columnIndex, remainder = divmod(columnIndex - 1, 26)
+        columnLetter = chr(ord('A') + remainder) + columnLetter
+    return columnLetter
+
+
+def getColumnIndex(columnLetter: str) -> int:
+    columnIndex = 0
+    for letter in columnLetter.upper():
+        columnIndex = columnIndex * 26 + ord(letter) - ord('A') + 1
+    return columnIndex
+
+
+class XlsxWorkbookExporter:
+    def __init__(self, worksheetNames: list[str]):
+        self.worksheetNames: list[str] = list(worksheetNames)
+        self.styleTable = XlsxStyleTable()
+        self.worksheetParts = {}
+
+    def insert(self, worksheetName: str, budgetInfo) -> None:
+        worksheetPart = self._createWorksheetPart(worksheetName)
+        columnWidthMeter = ColumnWidthMeter(
+            getattr(budgetInfo, 'formatType', None) == 'formatted', getattr(budgetInfo, 'plainColumnCount', 1)
+        )
+        headerStyleId = self.styleTable.getStyleId(HEADER_FONT_PROFILE, BOTTOM_LEFT_ALIGNMENT, 'General')
+        bodyStyleId = self.styleTable.getStyleId(BODY_FONT_PROFILE, BOTTOM_LEFT_ALIGNMENT, 'General')
+        currencyStyleId = self.styleTable.getStyleId(BODY_FONT_PROFILE, BOTTOM_LEFT_ALIGNMENT, CURRENCY_NUMBER_FORMAT)
+        styleIds = {'Header': [headerStyleId, headerStyleId], 'Body': [bodyStyleId, currencyStyleId]}
+        rowIdentifier = TypeOfRowIdentifier(None)
+        for rowNumber, row in enumerate(budgetInfo, start=1):
+            currencyFlags = columnWidthMeter.measure(row)
+            rowStyleIds = styleIds[rowIdentifier.typeOfRow(row)]
+            worksheetPart.writeRow(rowNumber, ROW_HEIGHT, [
+                (value, rowStyleIds[isCurrency])
+                for value, isCurrency in zip(columnWidthMeter.pad(row), columnWidthMeter.pad(currencyFlags, False))
+            ])
+        for columnIndex, columnWidth in enumerate(columnWidthMeter.getColumnWidths(), start=1):
+            worksheetPart.setColumnWidth(columnIndex, columnIndex, columnWidth)
+
+    def copyFrom(self, sourceWorkbook, *skippedWorksheetNames: str) -> None:
+        for sourceWorksheet in sourceWorkbook.worksheets:
+            if sourceWorksheet.title in skippedWorksheetNames:
+                continue
+            self._copyWorksheet(sourceWorksheet, self._createWorksheetPart(sourceWorksheet.title))
+
+    def save(self, filePath: str) -> None:
+        with zipfile.ZipFile(filePath, 'w', zipfile.ZIP_DEFLATED) as xlsxFile:
+            xlsxFile.writestr('[Content_Types].xml', self._getContentTypes())
+            xlsxFile.writestr('_rels/.rels', self._getPackageRelationships())
+            xlsxFile.writestr('xl/workbook.xml', self._getWorkbook())
+            xlsxFile.writestr('xl/_rels/workbook.xml.rels', self._getWorkbookRelationships())
+            xlsxFile.writestr('xl/styles.xml', self.styleTable.toXml())
+            for sheetNumber, worksheetName in enumerate(self.worksheetNames, start=1):
+                worksheetPart = self.worksheetParts.get(worksheetName) or XlsxWorksheetPart(sheetNumber == 1)
+                with xlsxFile.open(f'xl/worksheets/sheet{sheetNumber}.xml', 'w') as sheetFile:
+                    worksheetPart.writeTo(sheetFile)
+
+    def _createWorksheetPart(self, worksheetName: str):
+        if worksheetName not in self.worksheetNames:
+            self.worksheetNames.append(worksheetName)
+        isSelected = self.worksheetNames.index(worksheetName) == 0
+        worksheetPart = self.worksheetParts[worksheetName] = XlsxWorksheetPart(isSelected)
+        return worksheetPart
+
+    def _copyWorksheet(self, sourceWorksheet, worksheetPart) -> None:
+        for columnLetter, columnDimension in sourceWorksheet.column_dimensions.items():
+            if columnDimension.customWidth:
+                firstColumn = columnDimension.min or getColumnIndex(columnLetter)
+                worksheetPart.setColumnWidth(firstColumn, columnDimension.max or firstColumn, columnDimension.width)
+        for rowNumber, row in enumerate(sourceWorksheet.iter_rows(), start=1):
+            rowDimension = sourceWorksheet.row_dimensions.get(rowNumber)
+            rowHeight = rowDimension.height if rowDimension is not None else None
+            worksheetPart.writeRow(rowNumber, rowHeight, [(cell.value, self._getCellStyleId(cell)) for cell in row])
+
+    def _getCellStyleId(self, cell) -> int:
+        if not cell.has_style:
+            return 0
+        return self.styleTable.getStyleId(
+            FontProfile(cell.font.name, cell.font.sz, bool(cell.font.b)),
+            AlignmentProfile(cell.alignment.horizontal, cell.alignment.vertical),
+            cell.number_format,
+        )
+
+    def _getContentTypes(self) -> str:
+        worksheetOverrides = ''.join(
+            f'<Override PartName="/xl/worksheets/sheet{sheetNumber}.xml" ContentType="{WORKSHEET_CONTENT_TYPE}"/>'
+            for sheetNumber in range(1, len(self.worksheetNames) + 1)
+        )
+        return (
+            f'{XML_DECLARATION}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            f'{worksheetOverrides}</Types>'
+        )
+
+    def _getPackageRelationships(self) -> str:
+        return (
+            f'{XML_DECLARATION}<Relationships xmlns="{PACKAGE_RELATIONSHIP_NAMESPACE}">'
+            f'<Relationship Id="rId1" Type="{RELATIONSHIP_NAMESPACE}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        )
+
+    def _getWorkbook(self) -> str:
+        sheets = ''.join(
+            f'<sheet name={quoteattr(worksheetName)} sheetId="{sheetNumber}" r:id="rId{sheetNumber}"/>'
+            for sheetNumber, worksheetName in enumerate(self.worksheetNames, start=1)
+        )
+        return (
+            f'{XML_DECLARATION}<workbook xmlns="{MAIN_NAMESPACE}" xmlns:r="{RELATIONSHIP_NAMESPACE}">'
+            f'<bookViews><workbookView activeTab="0"/></bookViews><sheets>{sheets}</sheets></workbook>'
+        )
+
+    def _getWorkbookRelationships(self) -> str:
+        worksheetRelationships = ''.join(
+            f'<Relationship Id="rId{sheetNumber}" Type="{RELATIONSHIP_NAMESPACE}/worksheet" '
+            f'Target="worksheets/sheet{sheetNumber}.xml"/>'
+            for sheetNumber in range(1, len(self.worksheetNames) + 1)
+        )
+        stylesId = len(self.worksheetNames) + 1
+        return (
+            f'{XML_DECLARATION}<Relationships xmlns="{PACKAGE_RELATIONSHIP_NAMESPACE}">{worksheetRelationships}'
+            f'<Relationship Id="rId{stylesId}" Type="{RELATIONSHIP_NAMESPACE}/styles" Target="styles.xml"/>'
+            '</Relationships>'
+        )
+
+
+class XlsxWorksheetPart:
+    def __init__(self, isSelected: bool):
+        self.isSelected = isSelected
+        self.columnWidths = {}
+        self.columnLetters = []
+        self.styleAttributes = {}
+        self.sheetData = tempfile.TemporaryFile()
+
+    def setColumnWidth(self, firstColumn: int, lastColumn: int, width) -> None:
+        self.columnWidths[firstColumn] = (lastColumn, width)
+
+    def writeRow(self, rowNumber: int, rowHeight, cells: list) -> None:
+        while len(self.columnLetters) < len(cells):
+            self.columnLetters.append(getColumnLetter(len(self.columnLetters) + 1))
+        heightAttributes = '' if rowHeight is None else f' ht="{rowHeight}" customHeight="1"'
+        styleAttributes = self.styleAttributes
+        rowReference = str(rowNumber)
+        rowXml = ''.join([
+            self._getCellXml(
+                columnLetter + rowReference,
+                value,
+                styleAttributes[styleId] if styleId in styleAttributes else self._getStyleAttribute(styleId)
+            )
+            for columnLetter, (value, styleId) in zip(self.columnLetters, cells)
+        ])
+        self.sheetData.write(f'<row r="{rowReference}"{heightAttributes}>{rowXml}</row>'.encode('utf-8'))
+
+    def writeTo(self, sheetFile) -> None:
+        tabSelected = ' tabSelected="1"' if self.isSelected else ''
+        sheetFile.write((
+            f'{XML_DECLARATION}<worksheet xmlns="{MAIN_NAMESPACE}" xmlns:r="{RELATIONSHIP_NAMESPACE}">'
+            f'<sheetViews><sheetView{tabSelected} workbookViewId="0"/></sheetViews>'
+            f'<sheetFormatPr defaultRowHeight="15"/>{self._getColumnsXml()}<sheetData>'
+        ).encode('utf-8'))
+        self.sheetData.seek(0)
+        shutil.copyfileobj(self.sheetData, sheetFile)
+        sheetFile.write(
+            '</sheetData><pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>'
+            '</worksheet>'.encode('utf-8')
+        )
+
+    def _getColumnsXml(self) -> str:
+        if not self.columnWidths:
+            return ''
+        columns = ''.join(
+            f'<col min="{firstColumn}" max="{lastColumn}" width="{width}" customWidth="1"/>'
+            for firstColumn, (lastColumn, width) in sorted(self.columnWidths.items())
+        )
+        return f'<cols>{columns}</cols>'
+
+    def _getStyleAttribute(self, styleId: int) -> str:
+        styleAttribute = self.styleAttributes[styleId] = f' s="{styleId}"' if styleId else ''
+        return styleAttribute
+
+    def _getCellXml(self, reference: str, value, styleAttribute: str) -> str:
+        valueKind = valueKindsByType.get(type(value)) or getValueKind(value)
+        if valueKind == 'number' and isfinite(value):
+            return f'<c r="{reference}"{styleAttribute}><v>{"%.16g" % value}</v></c>'
+        if valueKind == 'boolean':
+            return f'<c r="{reference}"{styleAttribute} t="b"><v>{int(value)}</v></c>'
+        if valueKind != 'text' or value == '':
+            return f'<c r="{reference}"{styleAttribute}/>'
+        value = str(value)
+        if ILLEGAL_CHARACTERS_PATTERN.search(value):
+            raise ValueError(f"Cannot write {value!r} to a worksheet")
+        if value.startswith('=') and len(value) > 1:
+            return f'<c r="{reference}"{styleAttribute}><f>{escape(value[1:])}</f><v></v></c>'
+        spaceAttribute = ' xml:space="preserve"' if value != value.strip() else ''
+        return f'<c r="{reference}"{styleAttribute} t="inlineStr"><is><t{spaceAttribute}>{escape(value)}</t></is></c>'
+
+
+class XlsxStyleTable:
+    customNumberFormatStart = 164
+
+    def __init__(self):
+        self.fontIds = {None: 0}
+        self.numberFormatIds = {}
+        self.styleIds = {None: 0}
+
+    def getStyleId(self, fontProfile, alignmentProfile, numberFormat: str) -> int:
+        styleKey = (self.getFontId(fontProfile), alignmentProfile, self.getNumberFormatId(numberFormat))
+        if styleKey not in self.styleIds:
+            self.styleIds[styleKey] = len(self.styleIds)
+        return self.styleIds[styleKey]
+
+    def getFontId(self, fontProfile) -> int:
+        if fontProfile not in self.fontIds:
+            self.fontIds[fontProfile] = len(self.fontIds)
+        return self.fontIds[fontProfile]
+
+    def getNumberFormatId(self, numberFormat: str) -> int:
+        if numberFormat in BUILTIN_NUMBER_FORMAT_IDS:
+            return BUILTIN_NUMBER_FORMAT_IDS[numberFormat]
+        if numberFormat not in self.numberFormatIds:
+            self.numberFormatIds[numberFormat] = self.customNumberFormatStart + len(self.numberFormatIds)
+        return self.numberFormatIds[numberFormat]
+
+    def toXml(self) -> str:
+        return (
+            f'{XML_DECLARATION}<styleSheet xmlns="{MAIN_NAMESPACE}">{self._getNumberFormatsXml()}'
+            f'<fonts count="{len(self.fontIds)}">{"".join(map(self._getFontXml, self.fontIds))}</fonts>'
+            '<fills count="2"><fill><patternFill/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            f'<cellXfs count="{len(self.styleIds)}">{"".join(map(self._getCellFormatXml, self.styleIds))}</cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'
+        )
+
+    def _getNumberFormatsXml(self) -> str:
+        if not self.numberFormatIds:
+            return ''
+        numberFormats = ''.join(
+            f'<numFmt numFmtId="{numberFormatId}" formatCode={quoteattr(numberFormat)}/>'
+            for numberFormat, numberFormatId in self.numberFormatIds.items()
+        )
+        return f'<numFmts count="{len(self.numberFormatIds)}">{numberFormats}</numFmts>'
+
+    def _getFontXml(self, fontProfile) -> str:
+        if fontProfile is None:
+            return '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+        bold = '<b val="1"/>' if fontProfile.boldToggle else ''
+        size = '' if fontProfile.size is None else f'<sz val="{fontProfile.size}"/>'
+        name = '' if fontProfile.name is None else f'<name val={quoteattr(fontProfile.name)}/>'
+        return f'<font>{bold}{size}{name}</font>'
+
+    def _getCellFormatXml(self, styleKey) -> str:
+        if styleKey is None:
+            return '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        fontId, alignmentProfile, numberFormatId = styleKey
+        alignmentAttributes = ''.join(
+            f' {name}="{value}"' for name, value in alignmentProfile._asdict().items() if value is not None
+        )
+        alignment = f'<alignment{alignmentAttributes}/>' if alignmentAttributes else ''
+        return (
+            f'<xf numFmtId="{numberFormatId}" fontId="{fontId}" fillId="0" borderId="0" xfId="0" '
+            f'applyNumberFormat="1" applyFont="1" applyAlignment="1">{alignment}</xf>'
+        )
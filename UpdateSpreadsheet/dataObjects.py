@@ -4,3 +4,17 @@ class FontProfile(NamedTuple):
     name       : str
     size       : int | float
     boldToggle : bool
+
+
+class AlignmentProfile(NamedTuple):
+    horizontal : str
+    vertical   : str
+
+
+CURRENCY_NUMBER_FORMAT = '"$"0.00'
+
+HEADER_FONT_PROFILE = FontProfile("Georgia", 18, boldToggle = True)
+BODY_FONT_PROFILE = FontProfile("Helvetica Neue", 12.8, boldToggle = False)
+BOTTOM_LEFT_ALIGNMENT = AlignmentProfile("left", "bottom")
+ROW_HEIGHT = 27
+COLUMN_WIDTH_PADDING = 8
@@ -1,5 +1,7 @@
-import openpyxl
-from typing import TypeAlias
+from typing import TYPE_CHECKING, TypeAlias
 
-ExcelWorkbook: TypeAlias = openpyxl.workbook.workbook.Workbook
-ExcelWorksheet: TypeAlias = openpyxl.worksheet.worksheet.Worksheet
+if TYPE_CHECKING:
+    import openpyxl
+
+ExcelWorkbook: TypeAlias = 'openpyxl.workbook.workbook.Workbook'
+ExcelWorksheet: TypeAlias = 'openpyxl.worksheet.worksheet.Worksheet'
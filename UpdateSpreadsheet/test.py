@@ -1,12 +1,32 @@
+import os
+import subprocess
+import stat
+import sys
+import tempfile
 import unittest
-from openpyxl import Workbook
-from FileSystem import MonthDirectory, DirectoryCreator, SpreadsheetFileCreator, FileCreator
-from WorkbookPopulator import WorkbookPopulator
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook, load_workbook
+from ExtractBudgetData.Aggregation import groupBudgetInfo
+from ExtractBudgetData.Cost import Cost
+from ExtractBudgetData.DatedLedger import DatedLedger
+from ExtractBudgetData.TaxRules import TaxRuleTable
+from UpdateSpreadsheet.FileSystem import MonthDirectory, DirectoryCreator, SpreadsheetFile, SpreadsheetFileCreator, FileCreator
+from UpdateSpreadsheet.WorkbookPopulator import WorkbookPopulator
 import pendulum
 from colour_runner.runner import ColourTextTestRunner
 import pandas
-from WorksheetWriter import WorksheetDataDepositor
-from DateTranslator import getCurrentDateObject
+from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+from UpdateSpreadsheet.StreamingWorksheetWriter import StreamingWorkbookCopier, StreamingWorksheetDataDepositor
+from UpdateSpreadsheet.XlsxExporter import XlsxWorkbookExporter
+from UpdateSpreadsheet.RollupSheets import MONTH_SUMMARY_WORKSHEET, WEEK_SUMMARY_WORKSHEET, RollupSheetDepositor
+from UpdateSpreadsheet.WorksheetFormatter import SpreadsheetFormatter
+from UpdateSpreadsheet.DateTranslator import getCurrentDateObject, getDateContext
+from UpdateSpreadsheet.FontFormatter import TypeOfRowIdentifier
+from UpdateSpreadsheet.StyleRegistry import StyleRegistry
+from UpdateSpreadsheet.dataObjects import BODY_FONT_PROFILE, BOTTOM_LEFT_ALIGNMENT, CURRENCY_NUMBER_FORMAT, HEADER_FONT_PROFILE
+from backfill import backfill, groupEntriesByWeekFile
 
 
 class SpreadsheetFileSystemTest(unittest.TestCase):
@@ -44,8 +64,8 @@ class SpreadsheetFileSystemTest(unittest.TestCase):
             def __init__(self, parentDirectory):
                 self.parentDirectory = parentDirectory
 
-            def createSpreadsheetFile(self, filePath):
-                return filePath
+            def createWorkbook(self):
+                return None
 
         def get_week_in_month(iso_date: str) -> int:
             date = pendulum.parse(iso_date)
@@ -60,6 +80,89 @@ class SpreadsheetFileSystemTest(unittest.TestCase):
         self.assertEqual(spreadsheet['FilePath'], f"{parentDirectory}Week {weekWithinMonth}.xlsx")
 
 
+class SpreadsheetFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.parentDirectory = f"{self.temporaryDirectory.name}/"
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def testShouldCreateNewWorkbookInMemoryWithoutWritingToDisk(self):
+        spreadsheet = SpreadsheetFileCreator(FileCreator(self.parentDirectory), '2025-03-20').create()
+
+        workbook = spreadsheet['Workbook']
+
+        self.assertTrue(spreadsheet.isNew)
+        self.assertEqual(workbook.sheetnames, ['Sheet'])
+        self.assertEqual(os.listdir(self.temporaryDirectory.name), [])
+
+    def testShouldReuseExistingWeekWorkbookAndKeepOtherDays(self):
+        firstRun = SpreadsheetFileCreator(FileCreator(self.parentDirectory), '2025-03-18').create()
+        WorkbookPopulator('2025-03-18').populate(firstRun['Workbook'])['Mar.18.2025'].append(['Mug', 3])
+        firstRun.save()
+
+        secondRun = SpreadsheetFileCreator(FileCreator(self.parentDirectory), '2025-03-20').create()
+        workbook = WorkbookPopulator('2025-03-20').populate(secondRun['Workbook'])
+
+        self.assertFalse(secondRun.isNew)
+        self.assertEqual(len(workbook.sheetnames), 7)
+        self.assertEqual([cell.value for cell in workbook['Mar.18.2025'][1]], ['Mug', 3])
+
+    def testShouldNotLoadWorkbookUntilItIsAccessed(self):
+        loadedPaths = []
+
+        def loadWorkbook(filePath):
+            loadedPaths.append(filePath)
+            return Workbook()
+
+        spreadsheet = SpreadsheetFile(f"{self.parentDirectory}Week 1.xlsx", loadWorkbook)
+
+        self.assertEqual(loadedPaths, [])
+        spreadsheet['Workbook']
+        spreadsheet['Workbook']
+        self.assertEqual(loadedPaths, [f"{self.parentDirectory}Week 1.xlsx"])
+
+    def testShouldSaveAtomicallyWithoutLeavingTemporaryFiles(self):
+        spreadsheet = SpreadsheetFile(f"{self.parentDirectory}Week 1.xlsx", lambda filePath: Workbook())
+
+        spreadsheet.save()
+
+        self.assertEqual(os.listdir(self.temporaryDirectory.name), ['Week 1.xlsx'])
+        self.assertEqual(load_workbook(f"{self.parentDirectory}Week 1.xlsx").sheetnames, ['Sheet'])
+
+    def testShouldSaveNewFileWithTheDefaultFileMode(self):
+        umask = os.umask(0o022)
+        try:
+            SpreadsheetFile(f"{self.parentDirectory}Week 1.xlsx", lambda filePath: Workbook()).save()
+        finally:
+            os.umask(umask)
+
+        self.assertEqual(stat.S_IMODE(os.stat(f"{self.parentDirectory}Week 1.xlsx").st_mode), 0o644)
+
+    def testShouldKeepTheModeOfAnExistingFile(self):
+        filePath = f"{self.parentDirectory}Week 1.xlsx"
+        SpreadsheetFile(filePath, lambda filePath: Workbook()).save()
+        os.chmod(filePath, 0o640)
+
+        SpreadsheetFile(filePath, load_workbook).save()
+
+        self.assertEqual(stat.S_IMODE(os.stat(filePath).st_mode), 0o640)
+
+    def testShouldNotImportOpenpyxlOrPendulumUntilAWorkbookOrDateIsNeeded(self):
+        importedModules = subprocess.run(
+            [sys.executable, '-c', 'import sys, UpdateSpreadsheet.FileSystem, UpdateSpreadsheet.WorkbookPopulator, UpdateSpreadsheet.dataTypes, UpdateSpreadsheet.XlsxExporter, UpdateSpreadsheet.RollupSheets; print(sorted(sys.modules))'],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        self.assertNotIn("'openpyxl'", importedModules)
+        self.assertNotIn("'pendulum'", importedModules)
+
+
 class WorksheetPopulationTest(unittest.TestCase):
 
         @staticmethod
@@ -126,6 +229,359 @@ class InsertionOfDataInSpreadsheetTest(unittest.TestCase):
 
         self.assertEqual(dataInWorksheet, nestedList)
 
+    def testShouldKeepFormattedAmountsNumericAndDisplayThemAsCurrency(self):
+
+        class FakeFormattedBudgetInfo(list):
+            formatType = 'formatted'
+
+        budgetInfo = FakeFormattedBudgetInfo([
+            ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+            ['Candy', 1.0, 1.13, 0.13],
+            ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+            [1, 1.0, 1.13, 0.13]
+        ])
+        worksheetName = 'Sheet 1'
+
+        workbookWithData = WorksheetDataDepositor(Workbook(), worksheetName).insert(budgetInfo)
+        worksheet = workbookWithData[worksheetName]
+
+        self.assertEqual([cell.value for cell in worksheet[2]], ['Candy', 1.0, 1.13, 0.13])
+        self.assertEqual([cell.number_format for cell in worksheet[2]], ['General', '"$"0.00', '"$"0.00', '"$"0.00'])
+        self.assertEqual(worksheet['A4'].number_format, 'General')
+
+    def testShouldAppendNewRowsAndReplaceSummaryWhenExtendingWorksheet(self):
+
+        class FakeFormattedBudgetInfo(list):
+            formatType = 'formatted'
+
+        worksheetName = 'Sheet 1'
+        existingBudgetInfo = FakeFormattedBudgetInfo([
+            ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+            ['Candy', 1.0, 1.13, 0.13],
+            ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+            [1, 1.0, 1.13, 0.13]
+        ])
+        appendedBudgetInfo = FakeFormattedBudgetInfo([
+            ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+            ['Gum', 2.0, 2.26, 0.26],
+            ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+            [2, 3.0, 3.39, 0.39]
+        ])
+        depositor = WorksheetDataDepositor(Workbook(), worksheetName)
+        depositor.insert(existingBudgetInfo)
+
+        self.assertTrue(depositor.holdsItemRows(1))
+        workbookWithData = depositor.extend(appendedBudgetInfo)
+        worksheet = workbookWithData[worksheetName]
+
+        self.assertEqual(
+            [[cell.value for cell in row] for row in worksheet.iter_rows()],
+            [
+                ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+                ['Candy', 1.0, 1.13, 0.13],
+                ['Gum', 2.0, 2.26, 0.26],
+                ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+                [2, 3.0, 3.39, 0.39]
+            ]
+        )
+        self.assertEqual(worksheet['B3'].number_format, '"$"0.00')
+
+
+class StreamingInsertionOfDataInSpreadsheetTest(unittest.TestCase):
+
+    class FakeFormattedBudgetInfo(list):
+        formatType = 'formatted'
+
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.worksheetName = 'Sheet 1'
+        self.budgetInfo = self.FakeFormattedBudgetInfo([
+            ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+            ['Candy', 1.0, 1.13, 0.13],
+            ['Extremely Long Sweater Name', 120.5, 136.17, 15.67],
+            ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+            [2, 121.5, 137.3, 15.8]
+        ])
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def getVisibleFormatting(self, workbook):
+        filePath = os.path.join(self.temporaryDirectory.name, f'{len(os.listdir(self.temporaryDirectory.name))}.xlsx')
+        workbook.save(filePath)
+        worksheet = load_workbook(filePath)[self.worksheetName]
+        cells = [
+            (cell.value, cell.number_format, cell.font.name, cell.font.sz, cell.font.b, cell.alignment.horizontal, cell.alignment.vertical)
+            for row in worksheet.iter_rows() for cell in row
+        ]
+        columnWidths = {letter: dimension.width for letter, dimension in worksheet.column_dimensions.items()}
+        rowHeights = {number: dimension.height for number, dimension in worksheet.row_dimensions.items()}
+        return cells, columnWidths, rowHeights
+
+    def testShouldProduceSameVisibleFormattingAsStandardWriterAndFormatter(self):
+        standardWorkbook = WorksheetDataDepositor(Workbook(), self.worksheetName).insert(self.budgetInfo)
+        SpreadsheetFormatter(standardWorkbook[self.worksheetName]).apply()
+
+        streamingWorkbook = StreamingWorksheetDataDepositor(Workbook(write_only=True), self.worksheetName).insert(self.budgetInfo)
+
+        self.assertEqual(self.getVisibleFormatting(streamingWorkbook), self.getVisibleFormatting(standardWorkbook))
+
+    def testShouldExportSameVisibleFormattingAsXmlAsStandardWriterAndFormatter(self):
+        standardWorkbook = WorksheetDataDepositor(Workbook(), self.worksheetName).insert(self.budgetInfo)
+        SpreadsheetFormatter(standardWorkbook[self.worksheetName]).apply()
+
+        xlsxExporter = XlsxWorkbookExporter([self.worksheetName])
+        xlsxExporter.insert(self.worksheetName, self.budgetInfo)
+
+        self.assertEqual(self.getVisibleFormatting(xlsxExporter), self.getVisibleFormatting(standardWorkbook))
+
+    def testShouldCopyOtherWorksheetsWhenExportingAsXml(self):
+        sourceWorkbook = WorksheetDataDepositor(Workbook(), 'Sheet 2').insert(self.budgetInfo)
+        SpreadsheetFormatter(sourceWorkbook['Sheet 2']).apply()
+
+        xlsxExporter = XlsxWorkbookExporter([self.worksheetName, 'Sheet 2'])
+        xlsxExporter.copyFrom(sourceWorkbook, self.worksheetName)
+        xlsxExporter.insert(self.worksheetName, self.budgetInfo)
+        filePath = os.path.join(self.temporaryDirectory.name, 'exported.xlsx')
+        xlsxExporter.save(filePath)
+        exportedWorkbook = load_workbook(filePath)
+
+        self.assertEqual(exportedWorkbook.sheetnames, [self.worksheetName, 'Sheet 2', 'Sheet'])
+        self.assertEqual(
+            [[cell.value for cell in row] for row in exportedWorkbook['Sheet 2'].iter_rows()],
+            [list(row) for row in self.budgetInfo]
+        )
+        self.assertEqual(exportedWorkbook['Sheet 2']['A1'].font.name, 'Georgia')
+        self.assertEqual(exportedWorkbook['Sheet 2'].row_dimensions[1].height, 27)
+
+    def testShouldRewriteWeekSummaryAndSaveMonthSummaryWithEveryWriter(self):
+        staleSummary = [['Period', 'Number of Items'], ['Week 1', 1]]
+        weekSummary = [
+            ['Period', 'Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+            ['2025-03-20', 2, 2.5, 2.89, 0.39],
+            ['Week 3', 2, 2.5, 2.89, 0.39],
+        ]
+        for worksheetWriter in ('standard', 'streaming', 'xml'):
+            rollupSheetDepositor = RollupSheetDepositor(worksheetWriter)
+            sourceWorkbook = RollupSheetDepositor().depositWeekSummary(Workbook(), staleSummary)
+            if worksheetWriter == 'standard':
+                weekWorkbook = sourceWorkbook
+            elif worksheetWriter == 'streaming':
+                weekWorkbook = StreamingWorkbookCopier(sourceWorkbook).copyInto(
+                    Workbook(write_only=True), self.worksheetName, WEEK_SUMMARY_WORKSHEET
+                )
+            else:
+                weekWorkbook = XlsxWorkbookExporter(['Sheet'])
+                weekWorkbook.copyFrom(sourceWorkbook, WEEK_SUMMARY_WORKSHEET)
+            rollupSheetDepositor.depositWeekSummary(weekWorkbook, weekSummary)
+            weekPath = os.path.join(self.temporaryDirectory.name, f'{worksheetWriter} week.xlsx')
+            weekWorkbook.save(weekPath)
+            monthPath = os.path.join(self.temporaryDirectory.name, f'{worksheetWriter} month.xlsx')
+            rollupSheetDepositor.saveMonthSummary(SpreadsheetFile(monthPath, lambda filePath: Workbook()), weekSummary)
+
+            weekWorksheet = load_workbook(weekPath)[WEEK_SUMMARY_WORKSHEET]
+            weekRows = [list(row) for row in weekWorksheet.iter_rows(values_only=True)]
+            monthWorkbook = load_workbook(monthPath)
+            self.assertEqual(weekRows, weekSummary)
+            self.assertEqual(monthWorkbook.sheetnames, [MONTH_SUMMARY_WORKSHEET])
+            self.assertEqual(monthWorkbook[MONTH_SUMMARY_WORKSHEET]['A1'].font.name, 'Georgia')
+            for worksheet in (weekWorksheet, monthWorkbook[MONTH_SUMMARY_WORKSHEET]):
+                self.assertEqual(
+                    [cell.number_format for cell in worksheet[3]],
+                    ['General', 'General', CURRENCY_NUMBER_FORMAT, CURRENCY_NUMBER_FORMAT, CURRENCY_NUMBER_FORMAT]
+                )
+
+    def testShouldLineGroupedRowsAndTheirSummaryUpUnderTheGroupedHeadersWithEveryWriter(self):
+        items = [['Coffee', '3'], ['Tea', '2.50'], [' coffee  ', '4'], ['Hat', '10']]
+        currency, general = CURRENCY_NUMBER_FORMAT, 'General'
+        for worksheetWriter in ('standard', 'streaming', 'xml'):
+            budgetInfo = groupBudgetInfo(Cost(items).streamBudgetInfo('formatted'))
+            filePath = os.path.join(self.temporaryDirectory.name, f'{worksheetWriter} grouped.xlsx')
+            if worksheetWriter == 'standard':
+                workbook = Workbook()
+                WorksheetDataDepositor(workbook, self.worksheetName).insert(budgetInfo)
+            elif worksheetWriter == 'streaming':
+                workbook = Workbook(write_only=True)
+                StreamingWorksheetDataDepositor(workbook, self.worksheetName).insert(budgetInfo)
+            else:
+                workbook = XlsxWorkbookExporter([self.worksheetName])
+                workbook.insert(self.worksheetName, budgetInfo)
+            workbook.save(filePath)
+
+            worksheet = load_workbook(filePath)[self.worksheetName]
+            self.assertEqual([[cell.value for cell in row] for row in worksheet.iter_rows()], [
+                ['Count', 'Item', 'Gross Price', 'Price After Tax', 'Taxes Paid', 'Lowest Price', 'Highest Price'],
+                [2, 'Coffee', 7, 7.91, 0.91, 3, 4],
+                [1, 'Tea', 2.5, 2.82, 0.32, 2.5, 2.5],
+                [1, 'Hat', 10, 11.3, 1.3, 10, 10],
+                ['Number of Items', 'Distinct Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid', 'Lowest Price', 'Highest Price'],
+                [4, 3, 19.5, 22.03, 2.53, 2.5, 10],
+            ])
+            self.assertEqual([cell.number_format for cell in worksheet[2]], [general, general] + [currency] * 5)
+            self.assertEqual([cell.number_format for cell in worksheet[6]], [general, general] + [currency] * 5)
+
+
+class StyleRegistryTest(unittest.TestCase):
+
+    def getBudgetInfo(self):
+        return [
+            ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+            ['Candy', 1.0, 1.13, 0.13],
+            ['Orange', 1.5, 1.76, 0.25],
+            ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+            [2, 2.5, 2.89, 0.38]
+        ]
+
+    def testShouldRegisterEachProfileOnceAndShareItAcrossCells(self):
+        workbook = Workbook()
+        styleRegistry = StyleRegistry.forWorkbook(workbook)
+        firstCell, secondCell = workbook.active['A1'], workbook.active['B2']
+
+        styleRegistry.applyFont(firstCell, BODY_FONT_PROFILE)
+        styleRegistry.applyFont(secondCell, BODY_FONT_PROFILE)
+        styleRegistry.applyAlignment(firstCell, BOTTOM_LEFT_ALIGNMENT)
+        styleRegistry.applyAlignment(secondCell, BOTTOM_LEFT_ALIGNMENT)
+
+        self.assertIs(StyleRegistry.forWorkbook(workbook), styleRegistry)
+        self.assertIs(styleRegistry.getFont(BODY_FONT_PROFILE), styleRegistry.getFont(BODY_FONT_PROFILE))
+        self.assertIs(styleRegistry.getAlignment(BOTTOM_LEFT_ALIGNMENT), styleRegistry.getAlignment(BOTTOM_LEFT_ALIGNMENT))
+        self.assertEqual(firstCell.font.name, secondCell.font.name)
+        self.assertEqual(firstCell.alignment.horizontal, secondCell.alignment.horizontal)
+        self.assertEqual((firstCell.font.name, firstCell.font.sz, firstCell.font.b), ('Helvetica Neue', 12.8, False))
+        self.assertEqual((secondCell.alignment.horizontal, secondCell.alignment.vertical), ('left', 'bottom'))
+
+    def testShouldNotGrowStyleTablesWhenFormattingMoreRows(self):
+        workbook = WorksheetDataDepositor(Workbook(), 'Sheet 1').insert(self.getBudgetInfo())
+        SpreadsheetFormatter(workbook['Sheet 1']).apply()
+        fontCount, alignmentCount = len(workbook._fonts), len(workbook._alignments)
+
+        WorksheetDataDepositor(workbook, 'Sheet 2').insert(self.getBudgetInfo() * 3)
+        SpreadsheetFormatter(workbook['Sheet 2']).apply()
+
+        self.assertEqual((len(workbook._fonts), len(workbook._alignments)), (fontCount, alignmentCount))
+        self.assertEqual(workbook['Sheet 2']['A1'].font.name, HEADER_FONT_PROFILE.name)
+        self.assertEqual(workbook['Sheet 2']['B2'].font.name, BODY_FONT_PROFILE.name)
+
+
+class SpreadsheetFormatterTest(unittest.TestCase):
+
+    class FakeFormattedBudgetInfo(list):
+        formatType = 'formatted'
+
+    def getBudgetInfo(self):
+        return self.FakeFormattedBudgetInfo([
+            ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+            ['Candy', 1.0, 1.13, 0.13],
+            ['Extremely Long Sweater Name', 120.5, 136.17, 15.67],
+            ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+            [2, 121.5, 137.3, 15.8]
+        ])
+
+    def getFormatting(self, worksheet):
+        cells = [
+            (cell.value, cell.number_format, cell.font.name, cell.font.b, cell.alignment.horizontal, cell.alignment.vertical)
+            for row in worksheet.iter_rows() for cell in row
+        ]
+        columnWidths = {letter: dimension.width for letter, dimension in worksheet.column_dimensions.items()}
+        rowHeights = {number: dimension.height for number, dimension in worksheet.row_dimensions.items()}
+        return cells, columnWidths, rowHeights
+
+    def testShouldRecordRowTypesOnlyWhileTheyCoverTheWholeWorksheet(self):
+        depositor = WorksheetDataDepositor(Workbook(), 'Sheet 1')
+        depositor.insert(self.getBudgetInfo())
+
+        self.assertEqual(depositor.getRowTypes(), ['Header', 'Body', 'Body', 'Header', 'Body'])
+        self.assertIsNone(WorksheetDataDepositor(depositor.workbook, 'Sheet 1').getRowTypes())
+
+    def testShouldFormatTheSameWithSuppliedOrDetectedRowTypes(self):
+        depositor = WorksheetDataDepositor(Workbook(), 'Sheet 1')
+        suppliedWorksheet = depositor.insert(self.getBudgetInfo())['Sheet 1']
+        detectedWorksheet = WorksheetDataDepositor(Workbook(), 'Sheet 1').insert(self.getBudgetInfo())['Sheet 1']
+
+        SpreadsheetFormatter(suppliedWorksheet, depositor.getRowTypes()).apply()
+        SpreadsheetFormatter(detectedWorksheet).apply()
+
+        self.assertEqual(self.getFormatting(suppliedWorksheet), self.getFormatting(detectedWorksheet))
+        self.assertEqual(suppliedWorksheet['A1'].font.name, 'Georgia')
+        self.assertEqual(suppliedWorksheet['A2'].font.name, 'Helvetica Neue')
+        self.assertEqual(suppliedWorksheet.column_dimensions['A'].width, len('Extremely Long Sweater Name') + 8)
+
+
+class BackfillTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temporaryDirectory = tempfile.TemporaryDirectory()
+        self.parentDirectory = os.path.join(self.temporaryDirectory.name, 'Spreadsheets', '')
+        self.ledgerPath = os.path.join(self.temporaryDirectory.name, 'ledger.csv')
+        with open(self.ledgerPath, 'w', encoding='utf-8', newline='') as file:
+            file.write('date,item,price\n2026-10-15,Tea,2.50\n2026-10-13,Mug,3\n2026-10-20,Coffee,4\n2026-10-13,Hat,10\n')
+
+    def tearDown(self):
+        self.temporaryDirectory.cleanup()
+
+    def getFilledSheets(self, filePath):
+        workbook = load_workbook(filePath)
+        return {
+            worksheet.title: [list(row) for row in worksheet.iter_rows(values_only=True)]
+            for worksheet in workbook if worksheet.max_row > 1
+        }
+
+    def testShouldGroupDatedEntriesIntoOneBatchPerWeekFileInDateOrder(self):
+        weekBatches = groupEntriesByWeekFile(DatedLedger(self.ledgerPath), self.parentDirectory, TaxRuleTable.default())
+
+        self.assertEqual([os.path.relpath(weekBatch.filePath, self.parentDirectory) for weekBatch in weekBatches], [
+            os.path.join('October', 'Week 3.xlsx'), os.path.join('October', 'Week 4.xlsx')
+        ])
+        self.assertEqual(weekBatches[0].entriesByDate, [
+            ('2026-10-13', [['Mug', '3'], ['Hat', '10']]), ('2026-10-15', [['Tea', '2.50']])
+        ])
+        self.assertEqual(weekBatches[1].entriesByDate, [('2026-10-20', [['Coffee', '4']])])
+
+    def testShouldWriteEveryWeekWorkbookWithItsDaysAndWeekSummary(self):
+        ledgerDatabase = os.path.join(self.parentDirectory, 'ledger.sqlite3')
+
+        writtenFiles = backfill(self.ledgerPath, self.parentDirectory, TaxRuleTable.default(), 1, ledgerDatabase)
+
+        monthDirectory = os.path.join(self.parentDirectory, 'October')
+        self.assertEqual(writtenFiles, [os.path.join(monthDirectory, 'Week 3.xlsx'), os.path.join(monthDirectory, 'Week 4.xlsx')])
+        self.assertEqual(sorted(os.listdir(monthDirectory)), ['Month Summary.xlsx', 'Week 3.xlsx', 'Week 4.xlsx'])
+        self.assertEqual(self.getFilledSheets(writtenFiles[0]), {
+            'Oct.13.2026': [
+                ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+                ['Mug', 3, 3.39, 0.39],
+                ['Hat', 10, 11.3, 1.3],
+                ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+                [2, 13, 14.69, 1.69],
+            ],
+            'Oct.15.2026': [
+                ['Item', 'Gross Price', 'Price After Tax', 'Taxes Paid'],
+                ['Tea', 2.5, 2.82, 0.32],
+                ['Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+                [1, 2.5, 2.82, 0.32],
+            ],
+            WEEK_SUMMARY_WORKSHEET: [
+                ['Period', 'Number of Items', 'Total Gross Price', 'Total Price After Tax', 'Total Taxes Paid'],
+                ['2026-10-13', 2, 13, 14.69, 1.69],
+                ['2026-10-15', 1, 2.5, 2.82, 0.32],
+                ['Week 3', 3, 15.5, 17.51, 2.01],
+            ],
+        })
+        self.assertEqual(self.getFilledSheets(writtenFiles[1])['Oct.20.2026'][1], ['Coffee', 4, 4.52, 0.52])
+        self.assertEqual(self.getFilledSheets(writtenFiles[1])[WEEK_SUMMARY_WORKSHEET][-1], ['Week 4', 1, 4, 4.52, 0.52])
+
+
+class RowIdentificationTest(unittest.TestCase):
+
+    def testShouldIdentifyRowsWithNumericAmountsAsBody(self):
+        worksheet = Workbook().active
+        for row in [['Item', 'Gross Price'], ['Candy', 1.0], ['Number of Items', 'Total Gross Price'], [1, 1.0]]:
+            worksheet.append(row)
+
+        rowIdentifier = TypeOfRowIdentifier(worksheet)
+        rowTypes = [rowIdentifier.typeOfRow(row) for row in worksheet.iter_rows(values_only=True)]
+
+        self.assertEqual(rowTypes, ['Header', 'Body', 'Header', 'Body'])
+
 
 class DateConversionTests(unittest.TestCase):
 
@@ -148,5 +604,24 @@ class DateConversionTests(unittest.TestCase):
         # THEN the observable behavior should be verified as stated below:
         self.assertEqual(actualResult.iso, expectedResult)
 
+    def testShouldCarryMonthWeekAndWeekdaysInDateContext(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        expectedWeekdays = ('Feb.23.2025', 'Feb.24.2025', 'Feb.25.2025', 'Feb.26.2025', 'Feb.27.2025', 'Feb.28.2025', 'Mar.01.2025')
+        # WHEN the following module is executed:
+        dateContext = getDateContext('2025-02-26')
+        # THEN the observable behavior should be verified as stated below:
+        self.assertEqual(dateContext.monthName, 'February')
+        self.assertEqual(dateContext.weekOfMonth, 5)
+        self.assertEqual(dateContext.weekStart, '2025-02-23')
+        self.assertEqual(dateContext.weekdays, expectedWeekdays)
+
+    def testShouldReuseDateContextForTheSameDate(self):
+        # GIVEN the following preconditions corresponding to the system under test:
+        firstContext = getCurrentDateObject(self.getFakeDateFromPendulum)
+        # WHEN the following module is executed:
+        secondContext = getDateContext(self.getFakeDateFromPendulum())
+        # THEN the observable behavior should be verified as stated below:
+        self.assertIs(secondContext, firstContext)
+
 if __name__ == '__main__':
     unittest.main(testRunner=ColourTextTestRunner(), verbosity=2)
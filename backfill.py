@@ -0,0 +1,113 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from ExtractBudgetData.Cost import Cost
+from ExtractBudgetData.DatedLedger import DatedLedger
+from ExtractBudgetData.ItemDictionary import ItemDictionary, ItemDictionaryStore
+from ExtractBudgetData.Rollups import Rollups
+from ExtractBudgetData.SqliteLedger import SqliteLedger
+
+from UpdateSpreadsheet.DateTranslator import getCurrentDateObject
+from UpdateSpreadsheet.FileSystem import FileSystem
+from UpdateSpreadsheet.RollupSheets import RollupSheetDepositor
+from UpdateSpreadsheet.WorkbookPopulator import WorkbookPopulator
+from UpdateSpreadsheet.WorksheetFormatter import SpreadsheetFormatter
+from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+
+class WeekBatch(NamedTuple):
+    parentDirectory: str
+    filePath: str
+    entriesByDate: list
+    taxRules: object
+    ledgerDatabase: str | None = None
+    itemDictionary: ItemDictionary | None = None
+
+def groupEntriesByWeekFile(datedLedger, parentDirectory, taxRules, ledgerDatabase=None, itemDictionary=None):
+    fileSystem = FileSystem(parentDirectory)
+    entriesByWeekFile = {}
+    for isoDate, items in datedLedger.groupByDate().items():
+        filePath = fileSystem.setUpSpreadsheet(isoDate)['FilePath']
+        entriesByWeekFile.setdefault(filePath, []).append((isoDate, items))
+        if itemDictionary is not None:
+            itemDictionary.idsFor(item[0] for item in items)
+    return [
+        WeekBatch(parentDirectory, filePath, entriesByDate, taxRules, ledgerDatabase, itemDictionary)
+        for filePath, entriesByDate in entriesByWeekFile.items()
+    ]
+
+def depositDay(workbook, isoDate, items, taxRules, sqliteLedger=None, itemDictionary=None):
+    currentDate = getCurrentDateObject(lambda: isoDate)
+    WorkbookPopulator(currentDate.iso).populate(workbook)
+    budgetInfo = Cost(items, taxRules=taxRules, itemDictionary=itemDictionary).getBudgetInfo('formatted')
+    if sqliteLedger is not None:
+        recordDayInLedger(sqliteLedger, currentDate, budgetInfo, taxRules)
+    depositor = WorksheetDataDepositor(workbook, currentDate.spreadsheet)
+    worksheet = depositor.replace(budgetInfo)
+    SpreadsheetFormatter(worksheet[currentDate.spreadsheet], depositor.getRowTypes()).apply()
+
+def recordDayInLedger(sqliteLedger, currentDate, budgetInfo, taxRules):
+    sqliteLedger.beginDay(currentDate.iso, replacesDay=True)
+    for _ in sqliteLedger.passThrough(currentDate.iso, budgetInfo.costTable, taxRules):
+        pass
+    numberOfItems, *totals = budgetInfo.costSummary[1]
+    sqliteLedger.commitDay(currentDate.iso, numberOfItems, totals, currentDate.weekOfMonth)
+
+def buildWeekWorkbook(weekBatch):
+    firstDate = weekBatch.entriesByDate[0][0]
+    spreadsheet = FileSystem(weekBatch.parentDirectory).setUpSpreadsheet(firstDate)
+    sqliteLedger = SqliteLedger(weekBatch.ledgerDatabase) if weekBatch.ledgerDatabase is not None else None
+    for isoDate, items in weekBatch.entriesByDate:
+        depositDay(spreadsheet['Workbook'], isoDate, items, weekBatch.taxRules, sqliteLedger, weekBatch.itemDictionary)
+    if sqliteLedger is not None:
+        weekOfMonth = getCurrentDateObject(lambda: firstDate).weekOfMonth
+        weekSummary = Rollups(sqliteLedger).weekSummary(firstDate, weekOfMonth)
+        RollupSheetDepositor().depositWeekSummary(spreadsheet['Workbook'], weekSummary)
+        sqliteLedger.close()
+    spreadsheet.save()
+    return weekBatch.filePath
+
+def buildMonthSummaries(weekBatches, parentDirectory, ledgerDatabase):
+    sqliteLedger = SqliteLedger(ledgerDatabase)
+    rollups = Rollups(sqliteLedger)
+    isoDateByMonth = {weekBatch.entriesByDate[0][0][:7]: weekBatch.entriesByDate[0][0] for weekBatch in weekBatches}
+    for isoDate in isoDateByMonth.values():
+        monthSummary = FileSystem(parentDirectory).setUpMonthSummary(isoDate)
+        RollupSheetDepositor().saveMonthSummary(monthSummary, rollups.monthSummary(isoDate))
+    sqliteLedger.close()
+
+def backfill(ledgerPath, parentDirectory, taxRules, maxWorkers=None, ledgerDatabase=None, itemDictionaryFile=None):
+    if ledgerDatabase is not None:
+        SqliteLedger(ledgerDatabase).connect().close()
+    itemDictionaryStore = ItemDictionaryStore(itemDictionaryFile) if itemDictionaryFile is not None else None
+    itemDictionary = itemDictionaryStore.load() if itemDictionaryStore is not None else ItemDictionary()
+    weekBatches = groupEntriesByWeekFile(DatedLedger(ledgerPath), parentDirectory, taxRules, ledgerDatabase, itemDictionary)
+    if not weekBatches:
+        return []
+    if itemDictionaryStore is not None:
+        itemDictionaryStore.save(itemDictionary)
+    maxWorkers = min(maxWorkers or os.cpu_count() or 1, len(weekBatches))
+    with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+        writtenFiles = list(executor.map(buildWeekWorkbook, weekBatches))
+    if ledgerDatabase is not None:
+        buildMonthSummaries(weekBatches, parentDirectory, ledgerDatabase)
+    return writtenFiles
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description='Build week workbooks for every date in a dated ledger.')
+    parser.add_argument('ledgerPath', help='CSV file with date,item,price rows')
+    parser.add_argument('--workers', type=int, default=None)
+    return parser.parse_args()
+
+if __name__ == '__main__':
+    import paths
+    from main import getItemDictionaryStore, getSqliteLedger, loadTaxRules
+    arguments = parseArguments()
+    sqliteLedger = getSqliteLedger()
+    writtenFiles = backfill(
+        arguments.ledgerPath, paths.saveDirectoryForSpreadsheets, loadTaxRules(), arguments.workers,
+        sqliteLedger.databasePath if sqliteLedger is not None else None, getItemDictionaryStore().statePath
+    )
+    for filePath in writtenFiles:
+        print(f"Wrote '{filePath}'")
@@ -0,0 +1,237 @@
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import NamedTuple
+
+metricsFormats = ('jsonl', 'prometheus')
+
+
+class StageMetrics(NamedTuple):
+    stage: str
+    wallSeconds: float
+    cpuSeconds: float
+    rows: int | None
+    peakBytes: int | None
+
+
+class StageTotals:
+    __slots__ = ('wallSeconds', 'cpuSeconds', 'rows', 'peakBytes', 'profile')
+
+    def __init__(self, profile=None):
+        self.wallSeconds = 0.0
+        self.cpuSeconds = 0.0
+        self.rows = None
+        self.peakBytes = None
+        self.profile = profile
+
+
+class InstrumentationInterface(ABC):
+    @abstractmethod
+    def measure(self, stageName, function, *arguments):
+        raise NotImplementedError(
+            "This method must be used by concrete implementations"
+        )
+
+    @abstractmethod
+    def measureIterable(self, stageName, iterable):
+        raise NotImplementedError(
+            "This method must be used by concrete implementations"
+        )
+
+    @abstractmethod
+    def finish(self) -> list[StageMetrics]:
+        raise NotImplementedError(
+            "This method must be used by concrete implementations"
+        )
+
+
+class DisabledInstrumentation(InstrumentationInterface):
+    def measure(self, stageName, function, *arguments):
+        return function(*arguments)
+
+    def measureIterable(self, stageName, iterable):
+        return iterable
+
+    def finish(self) -> list[StageMetrics]:
+        return []
+
+
+class StageInstrumentation(InstrumentationInterface):
+    def __init__(self, metricsWriter=None, traceMemory=False, profileDirectory=None):
+        self.metricsWriter = metricsWriter
+        self.traceMemory = traceMemory
+        self.profileDirectory = profileDirectory
+        self.stageTotals = {}
+        self.activeStages = []
+        self.wallMark = time.perf_counter()
+        self.cpuMark = time.process_time()
+        if traceMemory:
+            tracemalloc.start()
+
+    def measure(self, stageName, function, *arguments):
+        self.enterStage(stageName)
+        try:
+            return function(*arguments)
+        finally:
+            self.exitStage()
+
+    def measureIterable(self, stageName, iterable):
+        stageTotals = self.getStageTotals(stageName)
+        stageTotals.rows = stageTotals.rows or 0
+        iterator = iter(iterable)
+        while True:
+            self.enterStage(stageName)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.exitStage()
+            stageTotals.rows += 1
+            yield item
+
+    def enterStage(self, stageName):
+        self.chargeActiveStage()
+        if self.activeStages:
+            self.disableProfile(self.activeStages[-1])
+        self.activeStages.append(stageName)
+        self.enableProfile(stageName)
+
+    def exitStage(self):
+        self.chargeActiveStage()
+        self.disableProfile(self.activeStages.pop())
+        if self.activeStages:
+            self.enableProfile(self.activeStages[-1])
+
+    def chargeActiveStage(self):
+        wallMark = time.perf_counter()
+        cpuMark = time.process_time()
+        if self.activeStages:
+            stageTotals = self.getStageTotals(self.activeStages[-1])
+            stageTotals.wallSeconds += wallMark - self.wallMark
+            stageTotals.cpuSeconds += cpuMark - self.cpuMark
+            if self.traceMemory:
+                stageTotals.peakBytes = max(stageTotals.peakBytes or 0, tracemalloc.get_traced_memory()[1])
+                tracemalloc.reset_peak()
+        self.wallMark = wallMark
+        self.cpuMark = cpuMark
+
+    def getStageTotals(self, stageName) -> StageTotals:
+        stageTotals = self.stageTotals.get(stageName)
+        if stageTotals is None:
+            profile = cProfile.Profile() if self.profileDirectory is not None else None
+            stageTotals = self.stageTotals[stageName] = StageTotals(profile)
+        return stageTotals
+
+    def enableProfile(self, stageName):
+        profile = self.getStageTotals(stageName).profile
+        if profile is not None:
+            profile.enable()
+
+    def disableProfile(self, stageName):
+        profile = self.getStageTotals(stageName).profile
+        if profile is not None:
+            profile.disable()
+
+    def finish(self) -> list[StageMetrics]:
+        if self.traceMemory:
+            tracemalloc.stop()
+        if self.profileDirectory is not None:
+            self.dumpProfiles()
+        stageMetrics = [
+            StageMetrics(stageName, stageTotals.wallSeconds, stageTotals.cpuSeconds, stageTotals.rows, stageTotals.peakBytes)
+            for stageName, stageTotals in self.stageTotals.items()
+        ]
+        if self.metricsWriter is not None:
+            self.metricsWriter.write(stageMetrics)
+        return stageMetrics
+
+    def dumpProfiles(self):
+        os.makedirs(self.profileDirectory, exist_ok=True)
+        for stageName, stageTotals in self.stageTotals.items():
+            stageTotals.profile.dump_stats(os.path.join(self.profileDirectory, f'{stageName}.prof'))
+
+
+class JsonLinesMetricsWriter:
+    def __init__(self, filePath):
+        self.filePath = filePath
+
+    def write(self, stageMetrics):
+        recordedAt = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with open(self.filePath, 'a', encoding='utf-8') as file:
+            for metrics in stageMetrics:
+                file.write(json.dumps({'recordedAt': recordedAt, **metrics._asdict()}) + '\n')
+
+
+class PrometheusMetricsWriter:
+    metricPrefix = 'expense_tracker'
+    gauges = (
+        ('wallSeconds', 'stage_wall_seconds', 'Wall time spent in the stage itself, excluding nested stages.'),
+        ('cpuSeconds', 'stage_cpu_seconds', 'CPU time spent in the stage itself, excluding nested stages.'),
+        ('rows', 'stage_rows', 'Rows produced by the stage.'),
+        ('peakBytes', 'stage_peak_bytes', 'Peak memory traced by tracemalloc while the stage ran.'),
+    )
+
+    def __init__(self, filePath):
+        self.filePath = filePath
+
+    def write(self, stageMetrics):
+        temporaryPath = f'{self.filePath}.tmp'
+        with open(temporaryPath, 'w', encoding='utf-8') as file:
+            file.write(self.format(stageMetrics, time.time()))
+        os.replace(temporaryPath, self.filePath)
+
+    def format(self, stageMetrics, timestamp) -> str:
+        lines = []
+        for fieldName, metricName, description in self.gauges:
+            samples = [
+                (metrics.stage, getattr(metrics, fieldName))
+                for metrics in stageMetrics
+                if getattr(metrics, fieldName) is not None
+            ]
+            if not samples:
+                continue
+            lines.append(f'# HELP {self.metricPrefix}_{metricName} {description}')
+            lines.append(f'# TYPE {self.metricPrefix}_{metricName} gauge')
+            lines.extend(f'{self.metricPrefix}_{metricName}{{stage="{stage}"}} {value}' for stage, value in samples)
+        lines.append(f'# HELP {self.metricPrefix}_last_run_timestamp_seconds Time the last run finished.')
+        lines.append(f'# TYPE {self.metricPrefix}_last_run_timestamp_seconds gauge')
+        lines.append(f'{self.metricPrefix}_last_run_timestamp_seconds {timestamp}')
+        return '\n'.join(lines) + '\n'
+
+
+class ConsoleMetricsWriter:
+    def write(self, stageMetrics):
+        for metrics in stageMetrics:
+            print(self.format(metrics))
+
+    def format(self, metrics) -> str:
+        line = f'{metrics.stage:<12} {metrics.wallSeconds:>9.3f}s wall {metrics.cpuSeconds:>9.3f}s cpu'
+        if metrics.rows is not None:
+            line += f' {metrics.rows:>10,} rows'
+        if metrics.peakBytes is not None:
+            line += f' {metrics.peakBytes:>14,} peak bytes'
+        return line
+
+
+def createMetricsWriter(metricsFile, metricsFormat):
+    if metricsFile is None:
+        return None
+    if metricsFormat == 'jsonl':
+        return JsonLinesMetricsWriter(metricsFile)
+    if metricsFormat == 'prometheus':
+        return PrometheusMetricsWriter(metricsFile)
+    raise ValueError(f"Unsupported metrics format: {metricsFormat}")
+
+
+def createInstrumentation(metricsFile=None, metricsFormat='jsonl', traceMemory=False, profileDirectory=None):
+    if metricsFile is None and not traceMemory and profileDirectory is None:
+        return DisabledInstrumentation()
+    metricsWriter = createMetricsWriter(metricsFile, metricsFormat)
+    if metricsWriter is None and traceMemory:
+        metricsWriter = ConsoleMetricsWriter()
+    return StageInstrumentation(metricsWriter, traceMemory, profileDirectory)
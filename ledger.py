@@ -0,0 +1,52 @@
+import argparse
+
+from ExtractBudgetData.SqliteLedger import SqliteLedger
+
+earliestDate = '0000-01-01'
+latestDate = '9999-12-31'
+
+
+def formatTotals(label, ledgerTotals):
+    return (
+        f'{label:<20} {ledgerTotals.numberOfItems:>8} items'
+        f'  gross ${ledgerTotals.grossPrice:,.2f}'
+        f'  after tax ${ledgerTotals.priceAfterTax:,.2f}'
+        f'  taxes ${ledgerTotals.taxesPaid:,.2f}'
+    )
+
+
+def queryLedger(sqliteLedger, arguments):
+    dateRange = (arguments.start, arguments.end)
+    if arguments.command == 'range':
+        return [formatTotals(f'{arguments.start}..{arguments.end}', sqliteLedger.rangeTotals(*dateRange))]
+    if arguments.command == 'item':
+        return [formatTotals(arguments.item, sqliteLedger.itemTotals(arguments.item, *dateRange))]
+    if arguments.command == 'categories':
+        return [
+            formatTotals(category, ledgerTotals)
+            for category, ledgerTotals in sqliteLedger.categoryTotals(*dateRange).items()
+        ]
+    raise ValueError(f"Unsupported ledger command: {arguments.command}")
+
+
+def parseArguments(defaultDatabase):
+    parser = argparse.ArgumentParser(description='Answer spending questions from the SQLite ledger without opening any workbook.')
+    parser.add_argument('--database', default=defaultDatabase, required=defaultDatabase is None)
+    parser.add_argument('--from', dest='start', default=earliestDate, help='first ISO date, inclusive')
+    parser.add_argument('--to', dest='end', default=latestDate, help='last ISO date, inclusive')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('range', help='totals for every item in the date range')
+    itemCommand = commands.add_parser('item', help='totals for one item in the date range')
+    itemCommand.add_argument('item')
+    commands.add_parser('categories', help='totals per tax category in the date range')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    from main import getSqliteLedger
+    defaultLedger = getSqliteLedger()
+    arguments = parseArguments(defaultLedger.databasePath if defaultLedger is not None else None)
+    sqliteLedger = SqliteLedger(arguments.database)
+    for line in queryLedger(sqliteLedger, arguments):
+        print(line)
+    sqliteLedger.close()
@@ -1,22 +1,212 @@
-from ExtractBudgetData.Cost import Cost
-from ExtractBudgetData.TextFile import TextFile
+import argparse
+
+from ExtractBudgetData.Aggregation import groupBudgetInfo
+from ExtractBudgetData.Checkpoint import CheckpointStore, IncrementalCost
+from ExtractBudgetData.Cost import BudgetInfo
+from ExtractBudgetData.ItemDictionary import ItemDictionaryStore
+from ExtractBudgetData.PriceParser import RejectReport
+from ExtractBudgetData.Rollups import Rollups
+from ExtractBudgetData.SqliteLedger import SqliteLedger
+from ExtractBudgetData.TaxRules import TaxRuleTable
 
 from UpdateSpreadsheet.DateTranslator import getCurrentDate
 from UpdateSpreadsheet.FileSystem import FileSystem
-from UpdateSpreadsheet.WorkbookPopulator import WorkbookPopulator
-from UpdateSpreadsheet.WorksheetFormatter import SpreadsheetFormatter
-from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+from UpdateSpreadsheet.WorkbookPopulator import WeekNormalizer, WorkbookPopulator
+
+from instrumentation import DisabledInstrumentation, createInstrumentation, metricsFormats
 
+import paths
 from paths import flatTextFile, saveDirectoryForSpreadsheets
 
-def createSpreadsheet():
-    textFileData = TextFile(flatTextFile).extractData()
-    budgetInfo = Cost(textFileData).getBudgetInfo('formatted')
+worksheetWriters = ('standard', 'streaming', 'xml')
+
+def loadTaxRules():
+    taxRulesFile = getattr(paths, 'taxRulesFile', None)
+    if taxRulesFile is None:
+        return TaxRuleTable.default()
+    return TaxRuleTable.fromFile(taxRulesFile)
+
+def getWorksheetWriter():
+    return getattr(paths, 'worksheetWriter', 'standard')
+
+def getGroupItems():
+    return getattr(paths, 'groupItems', False)
+
+def getTopItems():
+    return getattr(paths, 'topItems', None)
+
+def getShardWorkers():
+    return getattr(paths, 'shardWorkers', None)
+
+def getCheckpointStore():
+    checkpointFile = getattr(paths, 'checkpointFile', f'{flatTextFile}.checkpoint.json')
+    return CheckpointStore(checkpointFile)
+
+def getItemDictionaryStore():
+    itemDictionaryFile = getattr(paths, 'itemDictionaryFile', f'{flatTextFile}.items.json')
+    return ItemDictionaryStore(itemDictionaryFile)
+
+def getRejectReport():
+    rejectReportFile = getattr(paths, 'rejectReportFile', f'{flatTextFile}.rejects.csv')
+    return RejectReport(rejectReportFile)
+
+def getSqliteLedger():
+    ledgerDatabase = getattr(paths, 'ledgerDatabase', f'{saveDirectoryForSpreadsheets}ledger.sqlite3')
+    if ledgerDatabase is None:
+        return None
+    return SqliteLedger(ledgerDatabase)
+
+def canResume(incrementalCost, checkpointStore, spreadsheet, currentDate, sqliteLedger=None):
+    if spreadsheet.isNew:
+        return False
+    if not incrementalCost.resumeFrom(checkpointStore.load()):
+        return False
+    if sqliteLedger is not None and not sqliteLedger.holdsItemRows(currentDate.iso, incrementalCost.checkpoint.numberOfItems):
+        return False
+    from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+    depositor = WorksheetDataDepositor(spreadsheet['Workbook'], currentDate.spreadsheet)
+    return depositor.holdsItemRows(incrementalCost.checkpoint.numberOfItems)
+
+def streamBudgetInfoIntoNewWorkbook(spreadsheet, budgetInfo, currentDate):
+    from openpyxl import Workbook
+    from UpdateSpreadsheet.RollupSheets import WEEK_SUMMARY_WORKSHEET
+    from UpdateSpreadsheet.StreamingWorksheetWriter import StreamingWorkbookCopier, StreamingWorksheetDataDepositor
+    streamingWorkbook = WorkbookPopulator(currentDate.iso).populate(Workbook(write_only=True))
+    if not spreadsheet.isNew:
+        StreamingWorkbookCopier(spreadsheet['Workbook']).copyInto(
+            streamingWorkbook, currentDate.spreadsheet, WEEK_SUMMARY_WORKSHEET
+        )
+    StreamingWorksheetDataDepositor(streamingWorkbook, currentDate.spreadsheet).insert(budgetInfo)
+    spreadsheet.useWorkbook(streamingWorkbook)
+
+def exportBudgetInfoAsXml(spreadsheet, budgetInfo, currentDate):
+    from UpdateSpreadsheet.RollupSheets import WEEK_SUMMARY_WORKSHEET
+    from UpdateSpreadsheet.XlsxExporter import XlsxWorkbookExporter
+    worksheetNames = WeekNormalizer(currentDate.iso).getWeekdays()
+    xlsxExporter = XlsxWorkbookExporter(worksheetNames)
+    if not spreadsheet.isNew:
+        xlsxExporter.copyFrom(spreadsheet['Workbook'], currentDate.spreadsheet, WEEK_SUMMARY_WORKSHEET)
+    xlsxExporter.insert(currentDate.spreadsheet, budgetInfo)
+    spreadsheet.useWorkbook(xlsxExporter)
+
+def streamMeasuredBudgetInfo(incrementalCost, instrumentation):
+    appendedPairs = instrumentation.measureIterable('parse', incrementalCost.iterAppendedPairs())
+    budgetInfo = instrumentation.measure('parse', incrementalCost.streamBudgetInfo, appendedPairs)
+    costTable = instrumentation.measureIterable('cost', budgetInfo.costTable)
+    return BudgetInfo(costTable, budgetInfo.costSummary, budgetInfo.formatType)
+
+def shardMeasuredBudgetInfo(incrementalCost, shardWorkers, instrumentation):
+    budgetInfo = instrumentation.measure('cost', incrementalCost.shardBudgetInfo, shardWorkers)
+    costTable = instrumentation.measureIterable('cost', budgetInfo.costTable)
+    return BudgetInfo(costTable, budgetInfo.costSummary, budgetInfo.formatType)
+
+def groupMeasuredBudgetInfo(budgetInfo, topItems, itemDictionary, instrumentation):
+    groupedBudgetInfo = groupBudgetInfo(budgetInfo, topItems, itemDictionary)
+    costTable = instrumentation.measureIterable('group', groupedBudgetInfo.costTable)
+    return BudgetInfo(costTable, groupedBudgetInfo.costSummary, groupedBudgetInfo.formatType, groupedBudgetInfo.plainColumnCount)
+
+def recordBudgetInfoInLedger(sqliteLedger, budgetInfo, incrementalCost, currentDate):
+    sqliteLedger.beginDay(currentDate.iso, replacesDay=not incrementalCost.isResuming)
+    costTable = sqliteLedger.passThrough(
+        currentDate.iso, budgetInfo.costTable, incrementalCost.taxRules, incrementalCost.checkpoint.numberOfItems
+    )
+    return BudgetInfo(costTable, budgetInfo.costSummary, budgetInfo.formatType)
+
+def commitLedgerDay(sqliteLedger, checkpoint, currentDate):
+    sqliteLedger.commitDay(currentDate.iso, checkpoint.numberOfItems, checkpoint.totals, currentDate.weekOfMonth)
+
+def depositRollups(sqliteLedger, spreadsheet, currentDate, worksheetWriter):
+    from UpdateSpreadsheet.RollupSheets import RollupSheetDepositor
+    rollups = Rollups(sqliteLedger)
+    rollupSheetDepositor = RollupSheetDepositor(worksheetWriter)
+    rollupSheetDepositor.depositWeekSummary(spreadsheet['Workbook'], rollups.weekSummary(currentDate.iso, currentDate.weekOfMonth))
+    monthSummary = FileSystem(saveDirectoryForSpreadsheets).setUpMonthSummary(currentDate.iso)
+    rollupSheetDepositor.saveMonthSummary(monthSummary, rollups.monthSummary(currentDate.iso))
+
+def reportRejectedPrices(rejectReport, incrementalCost):
+    rejects = incrementalCost.getRejects()
+    rejectReport.write(rejects, append=incrementalCost.isResuming)
+    if rejects:
+        print(f"Skipped {len(rejects)} entries with unreadable prices, see '{rejectReport.reportPath}'")
+
+def depositBudgetInfo(spreadsheet, budgetInfo, currentDate, isResuming, worksheetWriter='standard', instrumentation=DisabledInstrumentation()):
+    if worksheetWriter == 'streaming' and not isResuming:
+        return streamBudgetInfoIntoNewWorkbook(spreadsheet, budgetInfo, currentDate)
+    if worksheetWriter == 'xml' and not isResuming:
+        return exportBudgetInfoAsXml(spreadsheet, budgetInfo, currentDate)
+    from UpdateSpreadsheet.WorksheetFormatter import SpreadsheetFormatter
+    from UpdateSpreadsheet.WorksheetWriter import WorksheetDataDepositor
+    if isResuming:
+        depositor = WorksheetDataDepositor(spreadsheet['Workbook'], currentDate.spreadsheet)
+        worksheet = depositor.extend(budgetInfo)
+    else:
+        workbookWithDateWorksheets = WorkbookPopulator(currentDate.iso).populate(spreadsheet['Workbook'])
+        depositor = WorksheetDataDepositor(workbookWithDateWorksheets, currentDate.spreadsheet)
+        worksheet = depositor.replace(budgetInfo)
+    spreadsheetFormatter = SpreadsheetFormatter(worksheet[currentDate.spreadsheet], depositor.getRowTypes())
+    instrumentation.measure('format', spreadsheetFormatter.apply)
+
+def createSpreadsheet(worksheetWriter=None, instrumentation=DisabledInstrumentation(), groupItems=None, topItems=None, shardWorkers=None):
     currentDate = getCurrentDate()
-    workbook = FileSystem(saveDirectoryForSpreadsheets).setUpSpreadsheet(currentDate.iso)
-    workbookWithDateWorksheets = WorkbookPopulator(currentDate.iso).populate(workbook['Workbook'])
-    worksheet = WorksheetDataDepositor(workbookWithDateWorksheets, currentDate.spreadsheet).insert(budgetInfo)
-    SpreadsheetFormatter(worksheet[currentDate.spreadsheet]).apply()
-    workbook['Workbook'].save(workbook['FilePath'])
+    topItems = getTopItems() if topItems is None else topItems
+    shardWorkers = getShardWorkers() if shardWorkers is None else shardWorkers
+    groupItems = (getGroupItems() if groupItems is None else groupItems) or topItems is not None
+    checkpointStore = getCheckpointStore()
+    itemDictionaryStore = getItemDictionaryStore()
+    itemDictionary = instrumentation.measure('setUp', itemDictionaryStore.load)
+    incrementalCost = instrumentation.measure(
+        'setUp', IncrementalCost, flatTextFile, currentDate.spreadsheet, 'formatted', loadTaxRules(), itemDictionary
+    )
+    spreadsheet = instrumentation.measure('setUp', FileSystem(saveDirectoryForSpreadsheets).setUpSpreadsheet, currentDate.iso)
+    sqliteLedger = getSqliteLedger()
+    if groupItems or not instrumentation.measure('load', canResume, incrementalCost, checkpointStore, spreadsheet, currentDate, sqliteLedger):
+        incrementalCost.rebuild()
+    if shardWorkers and not incrementalCost.isResuming:
+        budgetInfo = shardMeasuredBudgetInfo(incrementalCost, shardWorkers, instrumentation)
+    else:
+        budgetInfo = streamMeasuredBudgetInfo(incrementalCost, instrumentation)
+    if sqliteLedger is not None:
+        budgetInfo = recordBudgetInfoInLedger(sqliteLedger, budgetInfo, incrementalCost, currentDate)
+    if groupItems:
+        budgetInfo = groupMeasuredBudgetInfo(budgetInfo, topItems, itemDictionary, instrumentation)
+    worksheetWriter = 'standard' if incrementalCost.isResuming else worksheetWriter or getWorksheetWriter()
+    instrumentation.measure(
+        'deposit', depositBudgetInfo, spreadsheet, budgetInfo, currentDate,
+        incrementalCost.isResuming, worksheetWriter, instrumentation
+    )
+    checkpoint = incrementalCost.getCheckpoint()
+    instrumentation.measure('rejects', reportRejectedPrices, getRejectReport(), incrementalCost)
+    if sqliteLedger is not None:
+        instrumentation.measure('ledger', commitLedgerDay, sqliteLedger, checkpoint, currentDate)
+        instrumentation.measure('rollup', depositRollups, sqliteLedger, spreadsheet, currentDate, worksheetWriter)
+        sqliteLedger.close()
+    instrumentation.measure('save', spreadsheet.save)
+    instrumentation.measure('checkpoint', itemDictionaryStore.save, itemDictionary)
+    instrumentation.measure('checkpoint', checkpointStore.save, checkpoint)
+
+def parseArguments(arguments=None):
+    parser = argparse.ArgumentParser(description="Write today's ledger into this week's spreadsheet.")
+    parser.add_argument('--writer', choices=worksheetWriters, default=getWorksheetWriter())
+    parser.add_argument('--group-items', action='store_true', default=getGroupItems(), help='write one row per distinct item')
+    parser.add_argument('--top-items', type=int, default=getTopItems(), help='group items and keep the N with the highest spend')
+    parser.add_argument('--shard-workers', type=int, default=getShardWorkers(), help='cost a rebuilt day in N worker processes')
+    parser.add_argument('--metrics-file', help='file that per-stage metrics are written to')
+    parser.add_argument('--metrics-format', choices=metricsFormats, default='jsonl')
+    parser.add_argument('--trace-memory', action='store_true', help='record tracemalloc peak memory per stage, printed when no metrics file is given')
+    parser.add_argument('--profile-directory', help='directory that a cProfile dump per stage is written to')
+    return parser.parse_args(arguments)
+
+def main(arguments=None):
+    arguments = parseArguments(arguments)
+    instrumentation = createInstrumentation(
+        arguments.metrics_file, arguments.metrics_format, arguments.trace_memory, arguments.profile_directory
+    )
+    try:
+        createSpreadsheet(
+            arguments.writer, instrumentation, arguments.group_items, arguments.top_items, arguments.shard_workers
+        )
+    finally:
+        instrumentation.finish()
 
-createSpreadsheet()
+if __name__ == '__main__':
+    main()